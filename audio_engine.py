@@ -3,11 +3,70 @@ Audio engine for guitar fretboard playback.
 Handles all audio processing, loading, mixing, and playback timing.
 """
 
-import os
+import time
 import numpy as np
 from PySide6.QtCore import QObject, QTimer, Qt, Slot, Signal
 from PySide6.QtMultimedia import QAudioSink, QAudioFormat, QMediaDevices
-import wavfile
+from sample_bank import InstrumentBanks, DEFAULT_BUDGET_BYTES
+from constants import BEND_RISE_MS, BEND_HOLD_MS, BEND_RELEASE_MS
+from timing_stats import TimingStat
+
+# MIDI note numbers for open strings from low E to high e
+STANDARD_TUNING = {
+    'E': 40, 'A': 45, 'D': 50, 'G': 55, 'B': 59, 'e': 64
+}
+
+# How often the audio clock position is sent while playing in clock mode
+CLOCK_SYNC_INTERVAL_MS = 500
+
+
+def render_bend(data, samplerate, halftones):
+    """
+    Pitch-glide a note sample up by some halftones and back down.
+
+    The pitch follows the bend animation of the fretboard: it rises over
+    BEND_RISE_MS (ease out), holds for BEND_HOLD_MS and is released over
+    BEND_RELEASE_MS (ease in). The sample is resampled with a time-varying
+    rate, so the bent part is played slightly faster and the result is
+    shorter than the input.
+
+    Args:
+        data: 1-D int16 array of the unbent note
+        samplerate: Sample rate of data in Hz
+        halftones: Bend amount in halftones
+
+    Returns:
+        1-D int16 array of the bent note
+    """
+    n = len(data)
+    if n < 2 or not halftones:
+        return np.asarray(data)
+
+    rise = int(samplerate * BEND_RISE_MS / 1000)
+    hold = int(samplerate * BEND_HOLD_MS / 1000)
+    release = int(samplerate * BEND_RELEASE_MS / 1000)
+
+    # Pitch offset in halftones for every output sample
+    semitones = np.zeros(n, dtype=np.float64)
+    t = np.linspace(0.0, 1.0, rise, endpoint=False)
+    end = min(rise, n)
+    semitones[:end] = (halftones * (1.0 - (1.0 - t) ** 2))[:end]
+    semitones[rise:rise + hold] = halftones
+    start = rise + hold
+    if start < n:
+        t = np.linspace(0.0, 1.0, release, endpoint=False)
+        end = min(start + release, n)
+        semitones[start:end] = (halftones * (1.0 - t ** 2))[:end - start]
+
+    # Read position in the input advances by the playback rate of each sample
+    rate = np.exp2(semitones / 12.0)
+    position = np.empty(n, dtype=np.float64)
+    position[0] = 0.0
+    np.cumsum(rate[:-1], out=position[1:])
+    position = position[position <= n - 1]
+
+    bent = np.interp(position, np.arange(n, dtype=np.float64), data.astype(np.float32))
+    return bent.astype(np.int16)
 
 
 class AudioEngine(QObject):
@@ -19,22 +78,77 @@ class AudioEngine(QObject):
     # Signals
     playback_stopped = Signal()  # Emitted when playback stops
     highlight_note_index = Signal(int)  # Emitted when a note index should be highlighted
+    playback_started = Signal(list)  # Step onset times in ms, emitted when playback starts
+    audio_clock = Signal(float)  # Audio position in ms from processedUSecs, for clock-driven UIs
 
-    def __init__(self, audio_folder='clean', samplerate=44100, strum_delay_ms=10, parent=None):
+    def __init__(self, audio_folder='clean', samplerate=44100, strum_delay_ms=10,
+                 render_cache=None, memory_budget_bytes=DEFAULT_BUDGET_BYTES,
+                 default_instrument='clean', pack_index_dir=None, parent=None):
+        """
+        Args:
+            audio_folder: Sample folder, or a compressed .llpack sample pack,
+                          registered as the default instrument
+            samplerate: Output sample rate in Hz
+            strum_delay_ms: Delay between the notes of a strummed chord
+            render_cache: Optional RenderCache for rendered part timelines
+            memory_budget_bytes: Sample memory shared by all instrument banks
+            default_instrument: Name under which audio_folder is registered
+            pack_index_dir: Directory for the sample pack indexes. Defaults to
+                            ConfigManager.get_configdir()/cache/packs
+            parent: Optional parent QObject
+        """
         super().__init__(parent)
 
         # Configuration
         self.audio_folder = audio_folder
         self.samplerate = samplerate
         self.strum_delay_ms = strum_delay_ms
+        self.tuning = dict(STANDARD_TUNING)
+        self.speed = 1.0
+
+        # Instrument sample banks, mapped lazily and sharing one memory budget
+        self.instruments = InstrumentBanks(memory_budget_bytes)
+        self.pack_index_dir = pack_index_dir
+        self.instruments.register(default_instrument, audio_folder, index_dir=pack_index_dir)
+        self.default_instrument = default_instrument
+        # Instrument name -> pack fingerprint, scanned on first use and by refresh_samples()
+        self._seen_pack_fingerprints = {}
+        self._warm_note_set = []  # Notes of the current lesson, prefetched on bank switch
+        self._bent_samples = {}  # (instrument, midi, halftones) -> rendered bend
+
+        # Optional RenderCache; rendered parts are reused across app launches
+        self.render_cache = render_cache
 
         # Playback state
+        self.play_sequence = None  # Play sequence currently loaded
         self.midi = None  # List of MIDI note lists for each step
         self.note_duration = None  # Duration in ms for each step
+        self.bends = None  # Halftones bent for each note of each step (0 = no bend)
         self.sound_list = None  # Pre-mixed audio buffers as byte arrays
+        self.step_onsets_ms = []  # Start time of each step in the rendered part
         self.play_index = 0
         self.is_playing = False
         self.current_sample_position = 0
+        # Step the sink was started at and its onset, see reload_part()
+        self._start_index = 0
+        self._start_onset_ms = 0.0
+        # Bumped whenever the sink starts or stops, so step signals scheduled
+        # for a previous run (or the part before a reload) are dropped
+        self._sink_generation = 0
+
+        # Highlight timing. Step signals are scheduled per step in Python;
+        # clock signals let the UI run its own clock from the step onsets,
+        # corrected every CLOCK_SYNC_INTERVAL_MS with the audio position.
+        self.step_signals_enabled = True
+        self.clock_signals_enabled = False
+        self._last_clock_sync_ms = None
+
+        # Timing of the current playback, see timing_stats()
+        self._push_interval = TimingStat()
+        self._step_signal_late = TimingStat()
+        self._step_audio_offset = TimingStat()
+        self._underruns = 0
+        self._last_push_at = None
 
         # Audio components
         self.audio_format = None
@@ -76,27 +190,64 @@ class AudioEngine(QObject):
             play_seq: List of note sequences, where each sequence contains
                      tuples of (string_name, fret) and an integer duration in ms
         """
+        self.play_sequence = play_seq
         self.init_midi(play_seq)
         self.create_sound_list()
 
-    def load_part(self, part):
+    def load_part(self, part, instrument=''):
         """
         Load and prepare a Part object for playback.
 
         Convenience method that extracts the play_sequence from a Part
-        and calls load_sequence().
+        and calls load_sequence(). The part is rendered with Part.instrument,
+        falling back to the given instrument and then the default bank.
 
         Args:
             part: Part object from models.lesson_model
+            instrument: Instrument for parts that don't name their own
 
         Example:
             >>> from models.lesson_model import Part
             >>> part = Part(name="Scale", notes_to_highlight=[...], play_sequence=[...])
             >>> audio_engine.load_part(part)
         """
+        self.set_instrument(part.instrument or instrument, rerender=False)
         self.load_sequence(part.play_sequence)
         print(f"Loaded part: {part.name}")
 
+    def reload_part(self, part, instrument=''):
+        """
+        Load a changed version of the current part without stopping playback.
+
+        While playing, the sink is restarted at the start of the step that was
+        playing, so playback continues from about the same position in the new
+        render. If the new part has fewer steps or is played with another
+        instrument, playback stops.
+
+        Args:
+            part: Part object from models.lesson_model
+            instrument: Instrument for parts that don't name their own
+        """
+        if not self.is_playing:
+            self.load_part(part, instrument=instrument)
+            return
+
+        index = self.play_index
+        self.push_timer.stop()
+        if self.audio_sink:
+            self.audio_sink.stop()
+            self.output_device = None
+        self.load_part(part, instrument=instrument)
+        if not self.is_playing:
+            # Switching to another instrument bank stopped playback
+            return
+
+        if index >= len(self.sound_list):
+            self.stop_playback()
+            return
+        print(f"Continuing playback at step {index}")
+        self._start_sink(index)
+
     def init_midi(self, play_seq):
         """
         Convert the play sequence into MIDI note numbers and durations.
@@ -104,70 +255,275 @@ class AudioEngine(QObject):
         Args:
             play_seq: List of note sequences with (string, fret) tuples and durations
         """
-        # MIDI note numbers for open strings from low E to high e
-        open_string_midi = {
-            'E': 40, 'A': 45, 'D': 50, 'G': 55, 'B': 59, 'e': 64
-        }
+        self.midi, self.note_duration, self.bends = self._sequence_to_midi(play_seq)
+        print(f"Initialized MIDI notes: {self.midi}")
+
+    def _sequence_to_midi(self, play_seq):
+        """
+        Args:
+            play_seq: List of note sequences with (string, fret) or
+                      (string, fret, halftones) tuples and durations
 
-        self.midi = []
-        self.note_duration = []
+        Returns:
+            Tuple (midi, note_duration, bends): list of MIDI note lists for
+            each step, list of durations in ms, and for each step the
+            halftones each note is bent by (0 for unbent notes)
+        """
+        open_string_midi = self.tuning
+
+        midi = []
+        note_duration = []
+        bends = []
 
         for sublist in play_seq:
             pluck_list = []
+            bend_list = []
             for item in sublist:
                 if isinstance(item, tuple):
-                    string_name, fret = item
+                    string_name, fret = item[0], item[1]
                     if string_name in open_string_midi:
                         midi_note = open_string_midi[string_name] + fret
                         pluck_list.append(midi_note)
+                        bend_list.append(item[2] if len(item) > 2 else 0)
                 elif isinstance(item, int):  # Duration value
-                    self.note_duration.append(item)
-            self.midi.append(pluck_list)
+                    note_duration.append(item)
+            midi.append(pluck_list)
+            bends.append(bend_list)
 
-        print(f"Initialized MIDI notes: {self.midi}")
+        return midi, note_duration, bends
+
+    @property
+    def instrument(self):
+        """Name of the active instrument bank."""
+        return self.instruments.active_name
+
+    @property
+    def sample_bank(self):
+        """SampleBank of the active instrument."""
+        return self.instruments.active
+
+    @property
+    def sample_pack(self):
+        """Sample pack of the active instrument."""
+        return self.instruments.active.pack
+
+    def register_instrument(self, name, path, prefix='clean_'):
+        """
+        Register an additional instrument bank, e.g. the distortion samples.
+
+        Args:
+            name: Instrument name used by Lesson.instrument / Part.instrument
+            path: Sample folder or .llpack file
+            prefix: Filename prefix of the samples in a folder pack
+        """
+        self.instruments.register(name, path, prefix=prefix, index_dir=self.pack_index_dir)
+
+    def set_instrument(self, name, rerender=True):
+        """
+        Switch the active instrument bank.
+
+        The notes of the current lesson are prefetched from the target bank
+        in the background, and the loaded sequence is re-rendered.
+
+        Args:
+            name: Registered instrument name; empty selects the default
+            rerender: If True, re-render the loaded sequence with the new bank
+        """
+        name = name or self.default_instrument
+        if name not in self.instruments.names():
+            print(f"Warning: Unknown instrument '{name}', using '{self.default_instrument}'")
+            name = self.default_instrument
+        if name == self.instrument:
+            return
+
+        if self.is_playing:
+            self.stop_playback()
+
+        self.instruments.switch(name, prefetch_notes=self._warm_note_set)
+        print(f"Instrument: {name}")
+        if rerender and self.midi is not None:
+            self.create_sound_list()
+
+    def warm_notes(self, parts, background=True, instrument=''):
+        """
+        Load the samples used by a set of parts ahead of playback.
+
+        Each part is warmed in its own instrument bank (Part.instrument,
+        falling back to the given instrument and then the default one).
+
+        Args:
+            parts: Iterable of Part objects, e.g. lesson.parts
+            background: If True, load in a background thread
+            instrument: Instrument for parts that don't name their own
+        """
+        notes_by_bank = {}
+        all_notes = []
+        for part in parts:
+            name = part.instrument or instrument or self.default_instrument
+            if name not in self.instruments.names():
+                name = self.default_instrument
+            midi, _, _ = self._sequence_to_midi(part.play_sequence)
+            for step in midi:
+                notes_by_bank.setdefault(name, []).extend(step)
+                all_notes.extend(step)
+
+        self._warm_note_set = list(dict.fromkeys(all_notes))
+        for name, notes in notes_by_bank.items():
+            self.instruments.get(name).warm(notes, background=background)
 
     def create_sound_list(self):
         """
-        Load audio files, mix them with strum delay, and prepare byte arrays for playback.
+        Prepare byte arrays for playback, one per step.
+
+        The part timeline is taken from the render cache when available,
+        otherwise it is mixed from the samples and stored in the cache.
         """
+        key = None
+        cached = None
+        fingerprint = self._seen_pack_fingerprints.get(self.instrument)
+        if fingerprint is None:
+            fingerprint = self._refresh_pack_fingerprint(self.instrument)
+        if self.render_cache is not None and self.play_sequence is not None:
+            key = self.render_cache.make_key(
+                self.play_sequence, self.tuning, self.strum_delay_ms,
+                self.speed, self.samplerate, fingerprint, self.sample_pack.pack_id
+            )
+            cached = self.render_cache.load(key)
+
+        if cached is not None:
+            timeline, step_ends = cached
+            print("Sound list loaded from render cache.")
+        else:
+            timeline, step_ends = self._render_timeline()
+            if key is not None:
+                self.render_cache.store(key, timeline, step_ends)
+
+        step_starts = [0] + [int(end) for end in step_ends[:-1]] if len(step_ends) else []
+        self.step_onsets_ms = [start * 1000.0 / self.samplerate for start in step_starts]
+
+        # Convert to bytes for QAudioSink
         self.sound_list = []
+        start = 0
+        for end in step_ends:
+            self.sound_list.append(timeline[start:int(end)].tobytes())
+            start = int(end)
+
+        print(f"Sound list created with {len(self.sound_list)} items.")
+
+    def _render_timeline(self):
+        """
+        Load audio files, mix them with strum delay and join the steps.
 
+        Returns:
+            Tuple (timeline, step_ends): int16 array of the whole part and
+            an int64 array with the sample offset where each step ends
+        """
+        step_mixes = []
         for idx, item in enumerate(self.midi):
             note_data_list = []
-            for note_id in item:
-                data = self._load_audio_file(note_id)
+            for note_id, halftones in zip(item, self.bends[idx]):
+                if halftones:
+                    data = self._load_bent_audio(note_id, halftones)
+                else:
+                    data = self._load_audio_file(note_id)
                 note_data_list.append(data)
             note_mix = self._mix_notes(note_data_list)
 
-            # Truncate to the specified duration
-            duration_ms = self.note_duration[idx]
+            # Fit to the specified duration, stretched by the playback speed.
+            # Samples shorter than the step (bent notes are) end in silence,
+            # so every step lasts exactly its duration and later onsets stay put.
+            duration_ms = self.note_duration[idx] / self.speed
             num_samples = int(self.samplerate * (duration_ms / 1000.0))
-            truncated_mix = note_mix[:num_samples]
+            step_mix = note_mix[:num_samples]
+            if len(step_mix) < num_samples:
+                step_mix = np.pad(step_mix, (0, num_samples - len(step_mix)))
+            step_mixes.append(step_mix)
+
+        step_ends = np.cumsum([len(mix) for mix in step_mixes], dtype=np.int64)
+        if step_mixes:
+            timeline = np.concatenate(step_mixes)
+        else:
+            timeline = np.array([], dtype=np.int16)
+        return timeline, step_ends
+
+    def refresh_samples(self):
+        """
+        Rescan the sample packs that have been used, e.g. once per lesson load.
 
-            # Convert to bytes for QAudioSink
-            self.sound_list.append(truncated_mix.tobytes())
+        Packs are otherwise only scanned when an instrument is first used,
+        so renders (including speed changes) don't stat every sample. Call
+        this before warm_notes(), so a changed pack is cleared before the
+        new notes are warmed.
+        """
+        for name in list(self._seen_pack_fingerprints):
+            self._refresh_pack_fingerprint(name)
 
-        print(f"Sound list created with {len(self.sound_list)} items.")
+    def _refresh_pack_fingerprint(self, name):
+        """
+        Rescan an instrument's sample pack and drop loaded samples and
+        cached renders made from older samples.
+
+        Args:
+            name: Registered instrument name
+
+        Returns:
+            Current fingerprint of the sample pack
+        """
+        bank = self.instruments.get(name)
+        fingerprint = bank.pack.scan()
+        seen = self._seen_pack_fingerprints.get(name)
+        if fingerprint != seen:
+            if seen is not None:
+                print(f"Samples of '{name}' changed, reloading them")
+                bank.clear()
+                self._bent_samples = {
+                    key: data for key, data in self._bent_samples.items()
+                    if key[0] != name
+                }
+            if self.render_cache is not None:
+                self.render_cache.drop_stale(bank.pack.pack_id, fingerprint)
+            self._seen_pack_fingerprints[name] = fingerprint
+        return fingerprint
 
     def _load_audio_file(self, midi_note):
         """
-        Load a WAV file and return the numpy array.
+        Get the samples for a note from the sample bank.
 
         Args:
-            midi_note: MIDI note number (used to construct filename)
+            midi_note: MIDI note number
 
         Returns:
             numpy array of audio samples (int16)
         """
-        filename = f"clean_{midi_note}.wav"
-        file_path = os.path.abspath(os.path.join(self.audio_folder, filename))
         try:
-            samplerate, data = wavfile.read(file_path)
-            return data
+            return self.sample_bank.get(midi_note)
         except Exception as e:
-            print(f"Error loading {filename}: {e}")
+            print(f"Error loading {self.sample_pack.path_for(midi_note)}: {e}")
             return np.array([], dtype=np.int16)
 
+    def _load_bent_audio(self, midi_note, halftones):
+        """
+        Get a note with a rendered bend, gliding it on first use.
+
+        Rendered bends are kept per instrument, note and bend amount, so a
+        bend repeated in a part or re-rendered at another speed is only
+        glided once.
+
+        Args:
+            midi_note: MIDI note number of the picked note
+            halftones: Bend amount in halftones
+
+        Returns:
+            numpy array of audio samples (int16)
+        """
+        key = (self.instrument, midi_note, halftones)
+        data = self._bent_samples.get(key)
+        if data is None:
+            data = render_bend(self._load_audio_file(midi_note), self.samplerate, halftones)
+            if len(data):
+                self._bent_samples[key] = data
+        return data
+
     def _mix_notes(self, sound_data_list):
         """
         Mix multiple notes with strumming delay.
@@ -202,6 +558,27 @@ class AudioEngine(QObject):
         mixed_arr_int16 = (mixed_arr * np.iinfo(np.int16).max).astype(np.int16)
         return mixed_arr_int16
 
+    @Slot(float)
+    def set_speed(self, speed):
+        """
+        Set the playback speed and re-render the loaded sequence.
+
+        Step durations are divided by the speed, so 0.5x holds every
+        step twice as long.
+
+        Args:
+            speed: Speed factor, e.g. 0.5 for half speed
+        """
+        if speed <= 0 or speed == self.speed:
+            return
+
+        if self.is_playing:
+            self.stop_playback()
+
+        self.speed = speed
+        if self.midi is not None:
+            self.create_sound_list()
+
     @Slot()
     def start_playback(self):
         """Start audio playback."""
@@ -214,13 +591,34 @@ class AudioEngine(QObject):
 
         print("Starting playback...")
         self.is_playing = True
-        self.play_index = 0
+        self.reset_timing_stats()
+        self._start_sink(0)
+
+    def _start_sink(self, index):
+        """
+        Start the audio sink at the start of a step of the loaded sequence.
+
+        The sink's position restarts at 0, so the onsets sent to clock-driven
+        UIs are shifted to be relative to the step playback starts at.
+
+        Args:
+            index: Step to start playing from
+        """
+        self.play_index = index
+        self._start_index = index
+        self._sink_generation += 1
         self.current_sample_position = 0
+        self._last_clock_sync_ms = None
+        self._last_push_at = None
+        self._start_onset_ms = self.step_onsets_ms[index] if index else 0.0
 
         # Start the audio sink
         self.output_device = self.audio_sink.start()
         print("Audio sink started")
 
+        if self.clock_signals_enabled:
+            self.playback_started.emit([onset - self._start_onset_ms for onset in self.step_onsets_ms])
+
         # Start timer to push audio data
         self.push_timer.start(50)  # Check every 50ms
 
@@ -232,6 +630,7 @@ class AudioEngine(QObject):
 
         print("Stopping playback...")
         self.is_playing = False
+        self._sink_generation += 1
 
         # Stop the timer and audio sink
         self.push_timer.stop()
@@ -254,6 +653,14 @@ class AudioEngine(QObject):
         if not self.output_device or not self.is_playing:
             return
 
+        now = time.perf_counter()
+        if self._last_push_at is not None:
+            self._push_interval.add((now - self._last_push_at) * 1000.0)
+        self._last_push_at = now
+
+        if self.clock_signals_enabled:
+            self._sync_audio_clock()
+
         # Check if we've finished all samples
         if self.play_index >= len(self.sound_list):
             # Wait for buffer to empty before stopping
@@ -266,17 +673,22 @@ class AudioEngine(QObject):
         bytes_free = self.audio_sink.bytesFree()
         if bytes_free <= 0:
             return
+        started = self.play_index != self._start_index or self.current_sample_position
+        if bytes_free == self.audio_sink.bufferSize() and started:
+            # The sink ran dry in the middle of the part
+            self._underruns += 1
 
         # --- Handle UI update for new sample with latency compensation ---
-        if self.current_sample_position == 0:
+        if self.current_sample_position == 0 and self.step_signals_enabled:
             # Calculate dynamic latency based on buffer fullness
-            bytes_in_buffer = self.audio_sink.bufferSize() - self.audio_sink.bytesFree()
-            latency_us = self.audio_format.durationForBytes(bytes_in_buffer)
-            latency_ms = latency_us / 1000.0
+            latency_ms = self._buffered_audio_ms()
 
             # Schedule the UI update to sync with actual audio
             index = self.play_index
-            QTimer.singleShot(int(latency_ms), lambda: self._emit_highlight_signal(index))
+            due_at = now + latency_ms / 1000.0
+            generation = self._sink_generation
+            QTimer.singleShot(int(latency_ms),
+                              lambda: self._emit_highlight_signal(index, due_at, generation))
 
         # Get current buffer
         current_buffer = self.sound_list[self.play_index]
@@ -295,13 +707,78 @@ class AudioEngine(QObject):
             self.play_index += 1
             self.current_sample_position = 0
 
-    def _emit_highlight_signal(self, index):
+    def _buffered_audio_ms(self):
+        """Duration of the audio written to the sink but not yet played, in ms."""
+        bytes_in_buffer = self.audio_sink.bufferSize() - self.audio_sink.bytesFree()
+        return self.audio_format.durationForBytes(bytes_in_buffer) / 1000.0
+
+    def _sync_audio_clock(self):
+        """
+        Emit the audio position for clock-driven highlighting.
+
+        processedUSecs() counts audio handed to the sink, which runs ahead of
+        what is heard by the data still buffered, so that is subtracted - the
+        same latency the step signals are delayed by. The first position is
+        sent as soon as any audio has been heard, so the UI clock is anchored
+        to the real audio start; after that one is sent every
+        CLOCK_SYNC_INTERVAL_MS to correct drift.
+        """
+        position_ms = self.audio_sink.processedUSecs() / 1000.0 - self._buffered_audio_ms()
+        if position_ms <= 0:
+            return
+        if (self._last_clock_sync_ms is None
+                or position_ms - self._last_clock_sync_ms >= CLOCK_SYNC_INTERVAL_MS):
+            self._last_clock_sync_ms = position_ms
+            self.audio_clock.emit(position_ms)
+
+    def _emit_highlight_signal(self, index, due_at=None, generation=None):
         """
         Emit signal to highlight a note index.
         Called with latency compensation to sync with actual audio.
 
         Args:
             index: The play sequence index to highlight
+            due_at: time.perf_counter() value the signal was scheduled for
+            generation: _sink_generation when it was scheduled; the signal is
+                        dropped if the sink has been restarted or stopped since
         """
+        if generation is not None and generation != self._sink_generation:
+            return
         if self.is_playing:
+            if due_at is not None:
+                self._step_signal_late.add((time.perf_counter() - due_at) * 1000.0)
+            if self.audio_sink and index < len(self.step_onsets_ms):
+                position_ms = self.audio_sink.processedUSecs() / 1000.0
+                onset_ms = self.step_onsets_ms[index] - self._start_onset_ms
+                self._step_audio_offset.add(position_ms - onset_ms)
             self.highlight_note_index.emit(index)
+
+    def reset_timing_stats(self):
+        """Clear the stats of timing_stats(); done on every start_playback()."""
+        self._push_interval.reset()
+        self._step_signal_late.reset()
+        self._step_audio_offset.reset()
+        self._underruns = 0
+        self._last_push_at = None
+
+    def timing_stats(self):
+        """
+        Timing of the current or last playback.
+
+        Returns:
+            Dict with TimingStat summaries:
+            'push_interval': time between push_audio_data() calls (nominal 50 ms)
+            'step_signal_late': how late the latency-compensated step timers
+                fired compared to when they were scheduled for
+            'step_audio_offset': audio position (processedUSecs) minus the
+                step onset when each step signal was emitted; positive means
+                the sink had already consumed the step's start
+            and 'underruns', the number of times the sink buffer ran empty
+            before the part ended
+        """
+        return {
+            'push_interval': self._push_interval.summary(),
+            'step_signal_late': self._step_signal_late.summary(),
+            'step_audio_offset': self._step_audio_offset.summary(),
+            'underruns': self._underruns,
+        }
@@ -0,0 +1,20 @@
+"""
+Shared pytest fixtures.
+"""
+
+import os
+import pytest
+
+# Widget tests draw offscreen, no display needed
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """
+    The Qt application of the test session. Qt allows one per process, so
+    it is a QApplication for the widget tests and shared by the tests that
+    only need an event loop.
+    """
+    widgets = pytest.importorskip('PySide6.QtWidgets', exc_type=ImportError)
+    return widgets.QApplication.instance() or widgets.QApplication([])
@@ -29,6 +29,13 @@ STRING_MAP = {'e': 0, 'B': 1, 'G': 2, 'D': 3, 'A': 4, 'E': 5}
 STRING_ID = ['e', 'B', 'G', 'D', 'A', 'E']
 STRING_NAMES = ['e', 'B', 'G', 'D', 'A', 'E']
 
+# Bend envelope of a (string, fret, halftones) play sequence item: the pitch
+# rises to the target, holds and is released. The audio glide and the bend
+# animations use the same timing; keep BEND_TIMING in main.js in sync.
+BEND_RISE_MS = 250
+BEND_HOLD_MS = 500
+BEND_RELEASE_MS = 250
+
 #Contains all the possible notes of the fretboard.
 # FRETBOARD_NOTES_NAME = [
 #     # 0: High 'e' string
@@ -0,0 +1,168 @@
+'''
+Startup time and memory of the web and native fretboard views.
+
+Each renderer runs REPEATS times in a fresh subprocess, so Qt and Chromium
+start cold every time. A run measures:
+    startup     process start until the view emits view_loaded
+    first draw  view_loaded until a displayed pattern has been painted
+    RSS         resident memory of the process and all its children (the
+                QtWebEngineProcess helpers of the web view) once loaded
+
+RSS is read with psutil when it is installed, otherwise from /proc.
+
+Usage: python dev/bench_fretboard_view.py [web|native ...]
+'''
+
+import os
+import sys
+
+# Add the parent directory to the Python path to allow for package-like imports
+# Needed since this file is in a subdirectory.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import time
+import subprocess
+
+REPEATS = 5
+RENDERERS = ('web', 'native')
+TIMEOUT_S = 60
+
+# A pattern of the size of a two-octave scale
+PATTERN = [('E', 3), ('E', 5), ('A', 2), ('A', 3), ('A', 5), ('D', 2), ('D', 3), ('D', 5),
+           ('G', 2), ('G', 4), ('G', 5), ('B', 3), ('B', 5), ('e', 2), ('e', 3)]
+
+
+def _children(pid):
+    """All descendant pids of a process, from /proc."""
+    pids = []
+    stack = [pid]
+    while stack:
+        parent = stack.pop()
+        try:
+            for task in os.listdir(f'/proc/{parent}/task'):
+                with open(f'/proc/{parent}/task/{task}/children') as f:
+                    found = [int(p) for p in f.read().split()]
+                pids.extend(found)
+                stack.extend(found)
+        except OSError:
+            pass
+    return pids
+
+
+def tree_rss_bytes(pid=None):
+    """
+    Resident memory of a process and its children.
+
+    Args:
+        pid: Process id, defaults to the current process
+
+    Returns:
+        RSS in bytes, or None if it can't be measured on this platform
+    """
+    pid = pid or os.getpid()
+    try:
+        import psutil
+        proc = psutil.Process(pid)
+        return sum(p.memory_info().rss for p in [proc] + proc.children(recursive=True))
+    except ImportError:
+        pass
+
+    total = 0
+    for p in [pid] + _children(pid):
+        try:
+            with open(f'/proc/{p}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            pass
+    if total:
+        return total
+    try:
+        import resource
+        # Peak RSS of this process only; kB on Linux, bytes on macOS
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == 'darwin' else maxrss * 1024
+    except ImportError:
+        return None
+
+
+def run_child(renderer, spawned_at):
+    """Body of one measured subprocess; prints a JSON result line."""
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])
+    # Import inside the timed window, as main.create_fretboard_view does;
+    # main itself is not imported so the audio stack isn't measured
+    if renderer == 'web':
+        from ui.fretboard_view import FretboardView
+        view = FretboardView()
+    else:
+        from ui.native_fretboard_view import NativeFretboardView
+        view = NativeFretboardView()
+    view.resize(1400, 400)
+    view.show()
+    result = {'renderer': renderer}
+
+    def finish():
+        result['first_draw_ms'] = (time.time() - loaded_at[0]) * 1000.0
+        result['rss_bytes'] = tree_rss_bytes()
+        print(json.dumps(result), flush=True)
+        app.quit()
+
+    loaded_at = []
+
+    def on_loaded():
+        loaded_at.append(time.time())
+        result['startup_ms'] = (loaded_at[0] - spawned_at) * 1000.0
+        view.set_title('Benchmark')
+        view.display_notes(PATTERN, {'G': 'highlight1'})
+        view.highlight_notes(PATTERN[:3])
+        # Let the update reach the screen before measuring
+        QTimer.singleShot(50, lambda: (view.grab(), finish()))
+
+    view.view_loaded.connect(on_loaded)
+    app.exec()
+
+
+def measure(renderer):
+    """Run one subprocess and return its result dict, or None on failure."""
+    cmd = [sys.executable, os.path.abspath(__file__), '--child', renderer, repr(time.time())]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=TIMEOUT_S)
+    except subprocess.TimeoutExpired:
+        print(f"  {renderer}: timed out after {TIMEOUT_S} s")
+        return None
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith('{'):
+            return json.loads(line)
+    error = (proc.stderr.strip().splitlines() or ['no output'])[-1]
+    print(f"  {renderer}: failed ({error})")
+    return None
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        run_child(sys.argv[2], float(sys.argv[3]))
+        return
+
+    renderers = sys.argv[1:] or RENDERERS
+    print(f"{'renderer':<10}{'startup ms':>12}{'first draw ms':>15}{'RSS MB':>10}   (median of {REPEATS})")
+    for renderer in renderers:
+        results = [r for r in (measure(renderer) for _ in range(REPEATS)) if r]
+        if not results:
+            continue
+
+        def median(field):
+            values = sorted(r[field] for r in results if r.get(field) is not None)
+            return values[len(values) // 2] if values else float('nan')
+
+        print(f"{renderer:<10}{median('startup_ms'):>12.1f}{median('first_draw_ms'):>15.1f}"
+              f"{median('rss_bytes') / 1e6:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+'''
+Benchmark of sequential against parallel LessonLoader.load_all_lessons.
+
+Builds a synthetic library by copying every lesson of lessons/ COPIES times
+into a temporary directory, then loads it with a fresh loader sequentially
+and with a process pool at several sizes. Python lessons are executed and
+TOML lessons parsed in the workers, so the speedup is bounded by the number
+of CPUs.
+
+Usage: python dev/bench_load_lessons.py [copies]
+'''
+
+import os
+import sys
+
+# Add the parent directory to the Python path to allow for package-like imports
+# Needed since this file is in a subdirectory.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import io
+import glob
+import time
+import shutil
+import tempfile
+import contextlib
+from models.lesson_loader import LessonLoader
+
+LESSONS_DIR = os.path.join(os.path.dirname(__file__), '..', 'lessons')
+COPIES = 20
+REPEATS = 3
+WORKER_COUNTS = (2, 4, 8)
+
+
+def make_library(folder, copies):
+    for path in glob.glob(os.path.join(LESSONS_DIR, '*')):
+        name, ext = os.path.splitext(os.path.basename(path))
+        if name.startswith(('_', '.')) or ext not in ('.py', '.toml'):
+            continue
+        for i in range(copies):
+            shutil.copy(path, os.path.join(folder, f'{name}_{i}{ext}'))
+
+
+def time_load(folder, index_dir, parallel, max_workers=None):
+    best = None
+    for _ in range(REPEATS):
+        loader = LessonLoader(folder, index_dir=index_dir)
+        start = time.perf_counter()
+        # The loader prints one line per lesson
+        with contextlib.redirect_stdout(io.StringIO()):
+            lessons = loader.load_all_lessons(parallel=parallel, max_workers=max_workers)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(lessons), loader
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else COPIES
+    with tempfile.TemporaryDirectory() as folder, tempfile.TemporaryDirectory() as index_dir:
+        make_library(folder, copies)
+        print(f"{len(os.listdir(folder))} lesson files, {os.cpu_count()} CPU(s), best of {REPEATS}")
+
+        sequential, count, loader = time_load(folder, index_dir, parallel=False)
+        print(f"{'sequential':<14}{sequential:>10.1f} ms  {count} lessons")
+        for workers in WORKER_COUNTS:
+            elapsed, count, loader = time_load(folder, index_dir, True, workers)
+            print(f"{f'{workers} workers':<14}{elapsed:>10.1f} ms  {count} lessons"
+                  f"  x{sequential / elapsed:.2f}")
+
+        print()
+        loader.print_load_report(limit=5)
+
+
+if __name__ == '__main__':
+    main()
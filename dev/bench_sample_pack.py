@@ -0,0 +1,130 @@
+'''
+Benchmark of the sample pack formats: raw WAV folder, memory-mapped WAV
+folder and compressed .llpack (zlib and lzma).
+
+Reports bundle size, cold-start time (first note and whole pack available)
+and decode throughput. Cold runs drop the files from the OS page cache with
+posix_fadvise where the platform supports it; otherwise they are only as cold
+as the cache happens to be. Without a sample folder, a synthetic bank of
+49 two-second plucked notes is generated in a temporary directory.
+
+Usage: python dev/bench_sample_pack.py [sample_dir]
+'''
+
+import os
+import sys
+
+# Add the parent directory to the Python path to allow for package-like imports
+# Needed since this file is in a subdirectory.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import wavfile
+from sample_pack import SamplePack, CompressedPack, write_compressed_pack
+from sample_bank import SampleBank
+
+SAMPLE_DIR = 'clean'
+REPEATS = 3
+
+
+def make_synthetic_bank(folder, notes=range(40, 89), seconds=2.0, rate=44100):
+    """
+    Write decaying harmonic tones as clean_<midi>.wav files.
+
+    Unlike white noise, these compress roughly like real guitar samples,
+    so the compressed pack sizes stay meaningful.
+    """
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * rate)) / rate
+    for midi in notes:
+        freq = 440.0 * 2 ** ((midi - 69) / 12)
+        tone = sum(np.sin(2 * np.pi * freq * k * t) / k for k in range(1, 6))
+        tone *= np.exp(-3.0 * t)
+        tone += rng.standard_normal(len(t)) * 0.002
+        data = (tone / np.max(np.abs(tone)) * 20000).astype(np.int16)
+        wavfile.write(os.path.join(folder, f'clean_{midi}.wav'), rate, data)
+
+
+def drop_page_cache(paths):
+    """Ask the OS to evict files from the page cache. Returns False if unsupported."""
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+def time_load(pack, notes, mmap, max_workers, files, cold):
+    """Return (first_note_s, all_notes_s, decoded_bytes) for one run."""
+    if cold:
+        drop_page_cache(files)
+    bank = SampleBank(pack, mmap=mmap)
+    start = time.perf_counter()
+    bank.get(notes[0])
+    first = time.perf_counter() - start
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(bank.get, notes[1:]))
+    else:
+        for note in notes[1:]:
+            bank.get(note)
+    total = time.perf_counter() - start
+    return first, total, bank.loaded_bytes()
+
+
+def main(sample_dir):
+    folder_pack = SamplePack(sample_dir)
+    folder_pack.scan()
+    notes = folder_pack.notes()
+    if not notes:
+        synthetic_dir = tempfile.mkdtemp(prefix='llpack_bench_samples_')
+        print(f"No samples in '{sample_dir}', generating a synthetic bank in {synthetic_dir}")
+        make_synthetic_bank(synthetic_dir)
+        sample_dir = synthetic_dir
+        folder_pack = SamplePack(sample_dir, index_dir=os.path.join(synthetic_dir, 'index'))
+        folder_pack.scan()
+        notes = folder_pack.notes()
+    wav_files = [folder_pack.path_for(n) for n in notes]
+    wav_size = sum(os.path.getsize(p) for p in wav_files)
+
+    tmp_dir = tempfile.mkdtemp(prefix='llpack_bench_')
+    packs = []
+    for codec in ('zlib', 'lzma'):
+        path = os.path.join(tmp_dir, f'{codec}.llpack')
+        start = time.perf_counter()
+        size = write_compressed_pack(folder_pack, path, codec=codec)
+        print(f"Built {codec} pack in {time.perf_counter() - start:.2f}s")
+        packs.append((codec, CompressedPack(path), size, [path]))
+
+    cases = [
+        ('wav read', folder_pack, False, 1, wav_size, wav_files),
+        ('wav mmap', folder_pack, True, 1, wav_size, wav_files),
+    ]
+    workers = os.cpu_count() or 1
+    for codec, pack, size, files in packs:
+        cases.append((codec, pack, False, 1, size, files))
+        if workers > 1:
+            cases.append((f'{codec} x{workers}', pack, False, workers, size, files))
+
+    cold_supported = hasattr(os, 'posix_fadvise')
+    print(f"\n{len(notes)} notes from '{sample_dir}'. Cold cache: {'posix_fadvise' if cold_supported else 'unsupported'}")
+    print(f"{'format':<14}{'bundle MB':>10}{'cold first ms':>15}{'cold all ms':>13}{'warm all ms':>13}{'MB/s':>9}")
+    for name, pack, mmap, workers, size, files in cases:
+        cold = min((time_load(pack, notes, mmap, workers, files, cold=True) for _ in range(REPEATS)),
+                   key=lambda r: r[1])
+        warm = min((time_load(pack, notes, mmap, workers, files, cold=False) for _ in range(REPEATS)),
+                   key=lambda r: r[1])
+        throughput = warm[2] / warm[1] / 1e6 if warm[1] > 0 else float('inf')
+        print(f"{name:<14}{size/1e6:>10.2f}{cold[0]*1000:>15.2f}{cold[1]*1000:>13.2f}"
+              f"{warm[1]*1000:>13.2f}{throughput:>9.0f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else SAMPLE_DIR)
@@ -0,0 +1,188 @@
+'''
+Benchmark of wavfile.read and wavfile.write across read modes and formats.
+
+Read modes:
+    read        wavfile.read(path)
+    mmap        wavfile.read(path, mmap=True), with every page touched
+    stream      wavfile.read() on a non-seekable file object, which goes
+                through SeekEmulatingReader
+    as_float    wavfile.read(path, as_float=True)
+    read_into   wavfile.read_into() into a preallocated float32 buffer
+Write modes:
+    write       wavfile.write(path, rate, data)
+    writer      wavfile.WavWriter with 1 s blocks
+
+Every mode runs for 8/16/24/32-bit integer and 32-bit float files, mono and
+stereo, from 1 s up to 10 min. Throughput is the WAV file size divided by
+the best of REPEATS runs; allocations are the tracemalloc peak of a separate
+run, so tracing doesn't skew the timings. Reads are from a warm page cache.
+
+Usage: python dev/bench_wavfile.py [max_seconds]
+'''
+
+import os
+import sys
+
+# Add the parent directory to the Python path to allow for package-like imports
+# Needed since this file is in a subdirectory.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import io
+import time
+import struct
+import tempfile
+import tracemalloc
+import numpy as np
+import wavfile
+
+RATE = 44100
+REPEATS = 3
+LENGTHS_S = (1, 10, 60, 600)
+FORMATS = ('8-bit', '16-bit', '24-bit', '32-bit', 'float')
+CHANNELS = (1, 2)
+# 24-bit has no numpy dtype; it is written by hand and read back as int32
+FORMAT_DTYPES = {'8-bit': np.uint8, '16-bit': np.int16, '24-bit': np.int32,
+                 '32-bit': np.int32, 'float': np.float32}
+
+
+class NonSeekable(io.RawIOBase):
+    """File object without seek support, so wavfile wraps it in SeekEmulatingReader."""
+
+    def __init__(self, path):
+        self._f = open(path, 'rb')
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, b):
+        return self._f.readinto(b)
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+def make_signal(fmt, channels, seconds):
+    rng = np.random.default_rng(0)
+    shape = (int(seconds * RATE), channels) if channels > 1 else (int(seconds * RATE),)
+    if fmt == 'float':
+        return rng.uniform(-1, 1, shape).astype(np.float32)
+    if fmt == '8-bit':
+        return rng.integers(0, 256, shape, dtype=np.uint8)
+    if fmt == '24-bit':
+        return rng.integers(-2**23, 2**23, shape, dtype=np.int32) << 8
+    info = np.iinfo(FORMAT_DTYPES[fmt])
+    return rng.integers(info.min, info.max, shape, dtype=FORMAT_DTYPES[fmt])
+
+
+def write_24bit(path, data):
+    channels = 1 if data.ndim == 1 else data.shape[1]
+    raw = (data.reshape(-1) >> 8).astype('<i4').view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    fmt_chunk = struct.pack('<HHIIHH', 1, channels, RATE, RATE * 3 * channels, 3 * channels, 24)
+    body = b'WAVE' + b'fmt ' + struct.pack('<I', 16) + fmt_chunk
+    body += b'data' + struct.pack('<I', len(raw))
+    with open(path, 'wb') as f:
+        f.write(b'RIFF' + struct.pack('<I', len(body) + len(raw) + len(raw) % 2) + body)
+        f.write(raw)
+        if len(raw) % 2:
+            f.write(b'\x00')
+
+
+def read_plain(path, data):
+    wavfile.read(path)
+
+
+def read_mmap(path, data):
+    _, mapped = wavfile.read(path, mmap=True)
+    step = max(1, 4096 // mapped.itemsize)
+    np.add.reduce(mapped.reshape(-1)[::step], dtype=np.int64)
+
+
+def read_stream(path, data):
+    with NonSeekable(path) as f:
+        wavfile.read(f)
+
+
+def read_as_float(path, data):
+    wavfile.read(path, as_float=True)
+
+
+def read_into(path, data, _buffers={}):
+    # The destination is allocated once per shape, as a real ring buffer would be
+    out = _buffers.get(data.shape)
+    if out is None:
+        out = _buffers[data.shape] = np.empty(data.shape, dtype=np.float32)
+    wavfile.read_into(path, out)
+
+
+def write_plain(path, data):
+    wavfile.write(path, RATE, data)
+
+
+def write_writer(path, data):
+    channels = 1 if data.ndim == 1 else data.shape[1]
+    with wavfile.WavWriter(path, RATE, channels=channels, dtype=data.dtype) as out:
+        for start in range(0, len(data), RATE):
+            out.write(data[start:start + RATE])
+
+
+READ_MODES = [('read', read_plain), ('mmap', read_mmap), ('stream', read_stream),
+              ('as_float', read_as_float), ('read_into', read_into)]
+WRITE_MODES = [('write', write_plain), ('writer', write_writer)]
+
+
+def measure(func, path, data):
+    """Return (best_seconds, peak_alloc_bytes), or None if the mode doesn't support the file."""
+    try:
+        func(path, data)  # warm-up; also fills the page cache
+    except ValueError:
+        return None
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(path, data)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(path, data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main(max_seconds):
+    lengths = [s for s in LENGTHS_S if s <= max_seconds] or [max_seconds]
+    tmp_dir = tempfile.mkdtemp(prefix='wavfile_bench_')
+    print(f"{'mode':<10}{'format':<8}{'ch':>3}{'length':>8}{'file MB':>9}{'MB/s':>9}{'alloc MB':>10}")
+    for seconds in lengths:
+        for fmt in FORMATS:
+            for channels in CHANNELS:
+                data = make_signal(fmt, channels, seconds)
+                path = os.path.join(tmp_dir, f'{fmt}_{channels}ch_{seconds}s.wav')
+                if fmt == '24-bit':
+                    write_24bit(path, data)
+                    modes = READ_MODES
+                else:
+                    wavfile.write(path, RATE, data)
+                    modes = READ_MODES + WRITE_MODES
+                size_mb = os.path.getsize(path) / 1e6
+                for name, func in modes:
+                    # Write modes write next to the input instead of overwriting it
+                    target = path + '.out' if (name, func) in WRITE_MODES else path
+                    result = measure(func, target, data)
+                    if result is None:
+                        print(f"{name:<10}{fmt:<8}{channels:>3}{seconds:>7}s{size_mb:>9.2f}"
+                              f"{'-':>9}{'-':>10}")
+                        continue
+                    seconds_taken, peak = result
+                    print(f"{name:<10}{fmt:<8}{channels:>3}{seconds:>7}s{size_mb:>9.2f}"
+                          f"{size_mb / seconds_taken:>9.0f}{peak / 1e6:>10.2f}")
+                for suffix in ('', '.out'):
+                    if os.path.exists(path + suffix):
+                        os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else max(LENGTHS_S))
@@ -0,0 +1,178 @@
+'''
+Automatic reloading of edited lesson files.
+
+LessonWatcher watches the lessons directory with a QFileSystemWatcher and
+reloads lessons whose file changed on disk. changed_parts() and
+match_part() compare the reloaded lesson with the one on screen, so
+FretboardPlayer.reload_lesson only re-renders and re-displays the parts
+that actually changed.
+
+Only the lesson files are watched. Edits to modules that Python lessons
+import from (lesson_utils, scales.py) are not picked up.
+'''
+
+import os
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+from models.lesson_format import find_lesson_file
+
+# Editors often save in several writes (or write a temp file and rename it);
+# changes are collected for this long before reloading
+RELOAD_DEBOUNCE_MS = 200
+
+
+def changed_parts(old_lesson, new_lesson):
+    """
+    Indices of the parts of new_lesson whose content is new.
+
+    Parts are compared with Part.content_hash(), wherever they are in the
+    lesson, so parts that were only moved by inserting, removing or
+    reordering parts don't count as changed. A changed lesson instrument or
+    use_sharp setting changes how every part is played or displayed, so all
+    parts count as changed then.
+
+    Args:
+        old_lesson: Lesson currently loaded
+        new_lesson: Reloaded version of the lesson
+
+    Returns:
+        Sorted list of part indices into new_lesson.parts
+    """
+    if (old_lesson.instrument != new_lesson.instrument
+            or old_lesson.use_sharp != new_lesson.use_sharp):
+        return list(range(len(new_lesson.parts)))
+
+    old_hashes = {part.content_hash() for part in old_lesson.parts}
+    return [
+        index for index, part in enumerate(new_lesson.parts)
+        if part.content_hash() not in old_hashes
+    ]
+
+
+def match_part(old_lesson, new_lesson, index):
+    """
+    Find the part of new_lesson that corresponds to a part of old_lesson.
+
+    The part is looked up by content first (so an unchanged part that moved
+    is followed), then by name (an edited part), and otherwise the same
+    position is kept, clamped to the new part count.
+
+    Args:
+        old_lesson: Lesson currently loaded
+        new_lesson: Reloaded version of the lesson
+        index: Index of the part in old_lesson
+
+    Returns:
+        Index into new_lesson.parts
+    """
+    old_part = old_lesson.parts[index]
+    new_hashes = [part.content_hash() for part in new_lesson.parts]
+    old_hash = old_part.content_hash()
+    if index < len(new_hashes) and new_hashes[index] == old_hash:
+        return index
+    if old_hash in new_hashes:
+        return new_hashes.index(old_hash)
+
+    names = [part.name for part in new_lesson.parts]
+    if index < len(names) and names[index] == old_part.name:
+        return index
+    if old_part.name in names:
+        return names.index(old_part.name)
+    return min(index, len(new_lesson.parts) - 1)
+
+
+class LessonWatcher(QObject):
+    """
+    Reload lessons automatically when their files change.
+
+    Only lessons the loader has already loaded are reloaded; the others
+    are read from disk anyway when they are first opened. A lesson whose
+    reload fails (e.g. a syntax error in the middle of an edit) is retried
+    on its next change.
+
+    Example:
+        >>> watcher = LessonWatcher(loader)
+        >>> watcher.lesson_reloaded.connect(on_lesson_reloaded)
+    """
+
+    # Emitted with the lesson filename (without extension) and the new Lesson
+    lesson_reloaded = Signal(str, object)
+
+    def __init__(self, loader, parent=None):
+        """
+        Args:
+            loader: LessonLoader whose lessons directory is watched
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self.loader = loader
+        self._stats = self._scan()  # filename -> (size, mtime_ns)
+        self._failed = set()  # Lessons whose last reload failed
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(RELOAD_DEBOUNCE_MS)
+        self._reload_timer.timeout.connect(self.check)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._reload_timer.start)
+        self._watcher.fileChanged.connect(self._reload_timer.start)
+        if not self._watcher.addPath(str(self.loader.lessons_dir)):
+            print(f"Warning: Could not watch lessons directory '{self.loader.lessons_dir}'")
+        self._watch_files()
+
+    def _lesson_paths(self):
+        """Path of every available lesson, in the format the loader uses."""
+        paths = {}
+        for filename in self.loader.get_available_lesson_files():
+            path = find_lesson_file(self.loader.lessons_dir, filename)
+            if path is not None:
+                paths[filename] = path
+        return paths
+
+    def _scan(self):
+        stats = {}
+        for filename, path in self._lesson_paths().items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats[filename] = (st.st_size, st.st_mtime_ns)
+        return stats
+
+    def _watch_files(self):
+        # Files replaced by a rename drop out of the watch list; add them back
+        paths = [str(path) for path in self._lesson_paths().values()]
+        missing = [path for path in paths if path not in self._watcher.files()]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def check(self):
+        """
+        Reload the loaded lessons whose file changed since the last check.
+
+        Called automatically shortly after a change in the lessons directory.
+
+        Returns:
+            List of filenames that were reloaded
+        """
+        self._watch_files()
+        stats = self._scan()
+        changed = [
+            filename for filename, stat in stats.items()
+            if self._stats.get(filename) != stat
+        ]
+        self._stats = stats
+
+        reloaded = []
+        for filename in changed:
+            if not (self.loader.is_cached(filename) or filename in self._failed):
+                continue
+            print(f"Lesson file changed: {filename}")
+            lesson = self.loader.reload_lesson(filename)
+            if lesson is None:
+                self._failed.add(filename)
+                continue
+            self._failed.discard(filename)
+            reloaded.append(filename)
+            self.lesson_reloaded.emit(filename, lesson)
+        return reloaded
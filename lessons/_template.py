@@ -12,6 +12,9 @@ Note Format:
 - Fret numbers: 0-24 (0 = open string)
 - Tuples: (string_name, fret_number)
 - Duration: milliseconds (e.g., 500 = half second)
+
+Lessons can also be written as plain-data TOML files, which load without
+executing any code. See lessons/a_min_pentatonic.toml for an example.
 """
 
 from models.lesson_model import Part, Lesson
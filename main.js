@@ -46,12 +46,36 @@ const VIRTUAL_SCALE_LENGTH_PX = 5000;
 // This creates a smoother, more realistic overlap.
 const DOUBLE_BEND_OVERLAP_FACTOR = 0.3;
 
+// Bend envelope in ms. Must match BEND_RISE_MS/BEND_HOLD_MS/BEND_RELEASE_MS in
+// constants.py, which the audio engine uses to glide the pitch of bent notes.
+const BEND_TIMING = { riseMs: 250, holdMs: 500, releaseMs: 250 };
+
 // Letter spacing for notes with flat symbols (♭) to prevent them from looking too wide.
 const FLAT_SYMBOL_LETTER_SPACING = '-0.2em';
 
 // This will be populated by drawStringsAsSVG with the coordinates for each string.
 let STRING_GEOMETRY = [];
 
+// String name -> string index (0 = high e), built once.
+const STRING_NAME_TO_INDEX = Object.fromEntries(GUITAR_TUNING.map((stringInfo, index) => [stringInfo.name, index]));
+
+// "stringName:fret" -> note element of the current pattern. Populated by drawScalePattern
+// so highlight updates touch only the notes that change instead of querying the DOM.
+let NOTE_ELEMENTS = new Map();
+
+// Keys of the notes currently active (not faded).
+let ACTIVE_NOTE_KEYS = new Set();
+
+// Note keys of every step of the current part, uploaded once per part by Python.
+let STEP_NOTE_KEYS = [];
+
+// Bends of each step, as [stringIndex, fret, halftones], started by highlightStep()
+let STEP_BENDS = [];
+
+function noteKey(stringName, fret) {
+    return `${stringName}:${fret}`;
+}
+
 // --- New Data Structure for Positions ---
 const pentatonicPositions = [
     { position: 1, frets: { min: 2, max: 5 } },
@@ -229,16 +253,17 @@ function drawScale(scale) {
     }
 }
 
+// Pattern id -> note elements of a drawn pattern, kept detached while another
+// pattern is shown so that returning to a part doesn't rebuild its notes.
+const PATTERN_CACHE = new Map();
+
 /**
- * Draws a specific scale pattern received from an external source (like Python).
- * This function only draws the notes specified in the pattern.
- * @param {Array<Object>} pattern - An array of note objects, e.g., [{stringName: 'E', fret: 3, duration: 500}, ...]
+ * Removes all notes from the fretboard and restores the open string labels.
+ * Removed elements stay usable for PATTERN_CACHE.
  */
-function drawScalePattern(pattern) {
-    // Clear any existing notes from the fretboard
+function clearDrawnNotes() {
     document.querySelectorAll('.note, .open-string-note').forEach(n => n.remove());
 
-    //TODO: Shift this to a separate function. I may want an option to show the open string notes.
     // Restore open string labels (always visible, regardless of pattern)
     GUITAR_TUNING.forEach((stringInfo, index) => {
         const labelCell = document.querySelector(`td.string-label[data-string="${index}"]`);
@@ -247,14 +272,22 @@ function drawScalePattern(pattern) {
         }
     });
 
-    // Create a mapping from string name to its index for quick lookups.
-    const stringNameToIndex = GUITAR_TUNING.reduce((acc, stringInfo, index) => {
-        acc[stringInfo.name] = index;
-        return acc;
-    }, {});
+    NOTE_ELEMENTS = new Map();
+    ACTIVE_NOTE_KEYS = new Set();
+}
+
+/**
+ * Draws a specific scale pattern received from an external source (like Python).
+ * This function only draws the notes specified in the pattern.
+ * @param {Array<Object>} pattern - An array of note objects, e.g., [{stringName: 'E', fret: 3, duration: 500}, ...]
+ * @param {number} [patternId] - If given, the drawn notes are cached for showPattern(patternId).
+ */
+function drawScalePattern(pattern, patternId) {
+    //TODO: I may want an option to show the open string notes.
+    clearDrawnNotes();
 
     pattern.forEach(noteInfo => {
-        const stringIndex = stringNameToIndex[noteInfo.stringName];
+        const stringIndex = STRING_NAME_TO_INDEX[noteInfo.stringName];
         const fret = noteInfo.fret;
 
         if (stringIndex === undefined) {
@@ -282,6 +315,7 @@ function drawScalePattern(pattern) {
                 noteDiv.dataset.fret = 0;
                 noteDiv.dataset.duration = noteInfo.duration;
                 labelCell.appendChild(noteDiv);
+                NOTE_ELEMENTS.set(noteKey(noteInfo.stringName, fret), noteDiv);
             }
         } else {
             // Handle fretted notes (fret > 0)
@@ -300,9 +334,41 @@ function drawScalePattern(pattern) {
                 noteDiv.dataset.fret = fret;
                 noteDiv.dataset.duration = noteInfo.duration; // Store duration for future use
                 cell.appendChild(noteDiv);
+                NOTE_ELEMENTS.set(noteKey(noteInfo.stringName, fret), noteDiv);
             }
         }
     });
+
+    if (patternId !== undefined && patternId !== null) {
+        PATTERN_CACHE.set(patternId, [...NOTE_ELEMENTS].map(([key, noteDiv]) => [key, noteDiv, noteDiv.parentElement]));
+    }
+}
+
+/**
+ * Shows a pattern previously drawn with drawScalePattern(pattern, patternId),
+ * re-attaching its cached note elements in the inactive state.
+ * @param {number} patternId - Id the pattern was drawn with.
+ */
+function showPattern(patternId) {
+    const cached = PATTERN_CACHE.get(patternId);
+    if (!cached) {
+        console.warn(`showPattern: pattern ${patternId} is not cached`);
+        return;
+    }
+    clearDrawnNotes();
+    cached.forEach(([key, noteDiv, cell]) => {
+        noteDiv.classList.add('inactive');
+        if (noteDiv.classList.contains('open-string-note')) {
+            // Clear the plain text string name before adding the styled note div
+            cell.textContent = '';
+        }
+        cell.appendChild(noteDiv);
+        NOTE_ELEMENTS.set(key, noteDiv);
+    });
+}
+
+function forgetPattern(patternId) {
+    PATTERN_CACHE.delete(patternId);
 }
 
 
@@ -536,11 +602,13 @@ function animateNoteBendHalfTone(stringIndex, fret) {
     const startY = gsap.getProperty(noteToBend, "y");
     const endY = startY + bendDistance;
 
-    tl.to(noteToBend, { y: endY, duration: 0.25, ease: "power1.out" }) // Bend note
-      .to(bendProxy, { y: `+=${bendDistance}`, duration: 0.25, ease: "power1.out" }, "<") // Bend string path
-      .to({}, { duration: 0.5 }) // Hold (empty tween for a delay)
-      .to(noteToBend, { y: startY, duration: 0.25, ease: "power1.in" }) // Release note
-      .to(bendProxy, { y: nutY, duration: 0.25, ease: "power1.in" }, "<"); // Release string path
+    const rise = BEND_TIMING.riseMs / 1000;
+    const release = BEND_TIMING.releaseMs / 1000;
+    tl.to(noteToBend, { y: endY, duration: rise, ease: "power1.out" }) // Bend note
+      .to(bendProxy, { y: `+=${bendDistance}`, duration: rise, ease: "power1.out" }, "<") // Bend string path
+      .to({}, { duration: BEND_TIMING.holdMs / 1000 }) // Hold (empty tween for a delay)
+      .to(noteToBend, { y: startY, duration: release, ease: "power1.in" }) // Release note
+      .to(bendProxy, { y: nutY, duration: release, ease: "power1.in" }, "<"); // Release string path
 }
 
 /**
@@ -623,8 +691,8 @@ function animateNoteBendWholeTone(stringIndex, fret) {
     const primaryStartY = gsap.getProperty(primaryNote, "y");
     const secondaryStartY = secondaryNote ? gsap.getProperty(secondaryNote, "y") : 0;
 
-    const bendDuration = 0.25;
-    const holdDuration = 0.5;
+    const bendDuration = BEND_TIMING.riseMs / 1000;
+    const holdDuration = BEND_TIMING.holdMs / 1000;
 
     // --- BEND ---
     // Primary note/string bends for the full duration
@@ -646,14 +714,17 @@ function animateNoteBendWholeTone(stringIndex, fret) {
     tl.to({}, { duration: holdDuration });
 
     // --- RELEASE ---
-    // The release is the reverse of the bend
-    tl.to(primaryNote, { y: primaryStartY, duration: bendDuration, ease: "power1.in" });
-    tl.to(primaryBendProxy, { y: pNutY, duration: bendDuration, ease: "power1.in" }, "<");
+    // The release is the reverse of the bend, over the release time
+    const releaseDuration = BEND_TIMING.releaseMs / 1000;
+    const secondaryReleaseStartTime = releaseDuration * DOUBLE_BEND_OVERLAP_FACTOR;
+    const secondaryReleaseDuration = releaseDuration - secondaryReleaseStartTime;
+    tl.to(primaryNote, { y: primaryStartY, duration: releaseDuration, ease: "power1.in" });
+    tl.to(primaryBendProxy, { y: pNutY, duration: releaseDuration, ease: "power1.in" }, "<");
 
     if (secondaryNote) {
-        tl.to(secondaryNote, { y: secondaryStartY, duration: secondaryAnimationDuration, ease: "power1.in" }, "<" + secondaryAnimationStartTime);
+        tl.to(secondaryNote, { y: secondaryStartY, duration: secondaryReleaseDuration, ease: "power1.in" }, "<" + secondaryReleaseStartTime);
     }
-    tl.to(secondaryBendProxy, { y: sNutY, duration: secondaryAnimationDuration, ease: "power1.in" }, "<" + secondaryAnimationStartTime);
+    tl.to(secondaryBendProxy, { y: sNutY, duration: secondaryReleaseDuration, ease: "power1.in" }, "<" + secondaryReleaseStartTime);
 }
 
 // --- Execution ---
@@ -698,44 +769,80 @@ window.displayNotes = function(jsonData) {
     }
 };
 
+/**
+ * Activates and fades notes by key. Only the listed notes are touched, so the
+ * cost of a step scales with the number of changed notes, not the fretboard size.
+ * @param {Array<Array>} notesOn - [stringName, fret] pairs to activate
+ * @param {Array<Array>} notesOff - [stringName, fret] pairs to fade
+ */
+function updateHighlights(notesOn, notesOff) {
+    notesOff.forEach(([stringName, fret]) => {
+        const key = noteKey(stringName, fret);
+        NOTE_ELEMENTS.get(key)?.classList.add('inactive');
+        ACTIVE_NOTE_KEYS.delete(key);
+    });
+    notesOn.forEach(([stringName, fret]) => {
+        const key = noteKey(stringName, fret);
+        const noteElement = NOTE_ELEMENTS.get(key);
+        if (noteElement) {
+            noteElement.classList.remove('inactive');
+            ACTIVE_NOTE_KEYS.add(key);
+        }
+    });
+}
+
+/**
+ * Activates exactly the given notes and fades the previously active ones.
+ * @param {Array<Object>} notesToHighlight - e.g. [{stringName: 'G', fret: 7}, ...]
+ */
+function highlightNoteList(notesToHighlight) {
+    const wanted = new Set(notesToHighlight.map(n => noteKey(n.stringName, n.fret)));
+    const notesOff = [...ACTIVE_NOTE_KEYS].filter(key => !wanted.has(key)).map(splitNoteKey);
+    const notesOn = notesToHighlight.map(n => [n.stringName, n.fret]);
+    updateHighlights(notesOn, notesOff);
+}
+
+/**
+ * Stores the notes of every play sequence step of the current part.
+ * @param {Array<Array<Array>>} stepTable - per step, a list of [stringName, fret] pairs
+ * @param {Array<Array<Array>>} stepBends - per step, a list of [stringIndex, fret, halftones] bends
+ */
+function setStepTable(stepTable, stepBends = []) {
+    STEP_NOTE_KEYS = stepTable.map(notes => new Set(notes.map(([stringName, fret]) => noteKey(stringName, fret))));
+    STEP_BENDS = stepBends;
+}
+
+/**
+ * Activates the notes of one step of the step table and fades the rest,
+ * then starts the bends of that step. Steps are highlighted when they are
+ * heard, so the bend animation starts with the pitch glide of the audio.
+ * @param {number} index - play sequence step index
+ */
+function highlightStep(index) {
+    const stepKeys = STEP_NOTE_KEYS[index];
+    if (!stepKeys) {
+        console.warn(`highlightStep: no step ${index} in the step table`);
+        return;
+    }
+    const notesOff = [...ACTIVE_NOTE_KEYS].filter(key => !stepKeys.has(key)).map(splitNoteKey);
+    const notesOn = [...stepKeys].filter(key => !ACTIVE_NOTE_KEYS.has(key)).map(splitNoteKey);
+    updateHighlights(notesOn, notesOff);
+    for (const [stringIndex, fret, halftones] of STEP_BENDS[index] || []) {
+        window.handlePythonBendRequest(stringIndex, fret, halftones);
+    }
+}
+
+function splitNoteKey(key) {
+    const [stringName, fret] = key.split(':');
+    return [stringName, Number(fret)];
+}
 
 /* Similar to highlightNote() but can highlight multiple notes
 */
 window.highlightNotes = function(jsonData) {
     console.log("Received highlight request from Python.");
-    
-    // First, reset all notes on the fretboard to their inactive (faded) state.
-    document.querySelectorAll('.note, .open-string-note').forEach(note => {
-        note.classList.add('inactive');
-    });
-    
-    //Cycle through jsonData and call highlight note
     try {
-        const notesToHighlight = JSON.parse(jsonData);
-        const stringNameToIndex = GUITAR_TUNING.reduce((acc, stringInfo, index) => {
-            acc[stringInfo.name] = index;
-            return acc;
-        }, {});
-
-        notesToHighlight.forEach(noteInfo => {
-            const stringIndex = stringNameToIndex[noteInfo.stringName];
-            const fret = noteInfo.fret;
-
-            if (stringIndex !== undefined) {
-                let noteSelector;
-                if (fret === 0) {
-                    // Selector for an open string note
-                    noteSelector = `td.string-label[data-string="${stringIndex}"] .open-string-note`;
-                } else {
-                    // Selector for a fretted note
-                    noteSelector = `td.fret[data-string="${stringIndex}"][data-fret="${fret}"] .note`;
-                }
-                const noteElement = document.querySelector(noteSelector);
-                if (noteElement) {
-                    noteElement.classList.remove('inactive');
-                }
-            }
-        });
+        highlightNoteList(JSON.parse(jsonData));
     } catch (e) {
         console.error("Failed to parse notes to highlight from Python:", e);
     }
@@ -748,44 +855,265 @@ window.highlightNotes = function(jsonData) {
  * @param {number} fret - The fret number of the note to highlight.
  */
 window.highlightNote = function(stringName, fret) {
-    // First, reset all notes on the fretboard to their inactive (faded) state.
-    document.querySelectorAll('.note, .open-string-note').forEach(note => {
-        note.classList.add('inactive');
-    });
+    if (STRING_NAME_TO_INDEX[stringName] === undefined) {
+        console.warn(`highlightNote: Unknown string name '${stringName}'`);
+        return;
+    }
+    highlightNoteList([{ stringName, fret }]);
+};
 
-    // Create a mapping from string name to its index for quick lookups.
-    // This could be a global constant if used frequently.
-    const stringNameToIndex = GUITAR_TUNING.reduce((acc, stringInfo, index) => {
-        acc[stringInfo.name] = index;
-        return acc;
-    }, {});
+/**
+ * Called from Python when playback is stopped. 
+ */
+window.clearNoteHighlights = function() {
+    updateHighlights([], [...ACTIVE_NOTE_KEYS].map(splitNoteKey));
+}
 
-    const stringIndex = stringNameToIndex[stringName];
+// --- Page Clock ---
+// In page-clock mode Python sends the step onset times once when playback starts,
+// then the audio position (from QAudioSink.processedUSecs) every few hundred ms.
+// Highlights are driven from requestAnimationFrame against that clock, so no
+// per-step message crosses from Python to the page.
+
+// Corrections smaller than this are treated as jitter and ignored.
+const CLOCK_DRIFT_TOLERANCE_MS = 8;
+
+let playbackClock = null;
+
+function startClock(onsetsMs) {
+    stopClock();
+    playbackClock = {
+        onsets: onsetsMs,
+        anchor: null,   // { audioMs, perfMs }, set by the first syncClock
+        step: -1,
+        frame: null,
+        lastDriftMs: 0,
+    };
+}
 
-    if (stringIndex === undefined) {
-        console.warn(`highlightNote: Unknown string name '${stringName}'`);
+function syncClock(audioMs) {
+    if (!playbackClock) return;
+    const receivedAt = updateReceivedAt || performance.now();
+    if (!playbackClock.anchor) {
+        playbackClock.anchor = { audioMs, perfMs: receivedAt };
+        playbackClock.frame = requestAnimationFrame(tickClock);
         return;
     }
+    const predictedMs = playbackClock.anchor.audioMs + (receivedAt - playbackClock.anchor.perfMs);
+    playbackClock.lastDriftMs = audioMs - predictedMs;
+    if (statsTimer !== null) addStat(pageStats.clockDrift, Math.abs(playbackClock.lastDriftMs));
+    if (Math.abs(playbackClock.lastDriftMs) > CLOCK_DRIFT_TOLERANCE_MS) {
+        playbackClock.anchor = { audioMs, perfMs: receivedAt };
+    }
+}
 
-    // Construct a selector to find the note div within the correct table cell
-    const noteSelector = `td.fret[data-string="${stringIndex}"][data-fret="${fret}"] .note`;
-    const noteElement = document.querySelector(noteSelector);
+function tickClock(frameTime) {
+    if (!playbackClock) return;
+    const { anchor, onsets } = playbackClock;
+    const audioMs = anchor.audioMs + (frameTime - anchor.perfMs);
+    // Steps only move forward; a backwards correction never re-highlights an earlier step
+    let step = playbackClock.step;
+    while (step + 1 < onsets.length && onsets[step + 1] <= audioMs) {
+        step++;
+    }
+    if (step !== playbackClock.step) {
+        playbackClock.step = step;
+        highlightStep(step);
+        if (statsTimer !== null) addStat(pageStats.stepLateness, audioMs - onsets[step]);
+    }
+    playbackClock.frame = requestAnimationFrame(tickClock);
+}
 
-    if (noteElement) {
-        // Now, remove the inactive class from only the current note to highlight it.
-        noteElement.classList.remove('inactive');
+function stopClock() {
+    if (playbackClock && playbackClock.frame !== null) {
+        cancelAnimationFrame(playbackClock.frame);
     }
+    playbackClock = null;
+}
+
+// --- QWebChannel Bridge ---
+// Python (ui/fretboard_view.py) sends batches of [name, args] updates over the
+// 'fretboard' bridge object. Arguments arrive as native arrays/objects, so no
+// JSON parsing is needed. Batches are applied together in the next animation
+// frame, so several updates per frame cost a single layout/paint.
+const UPDATE_HANDLERS = {
+    displayNotes: (pattern, patternId) => drawScalePattern(pattern, patternId),
+    showPattern: patternId => showPattern(patternId),
+    forgetPattern: patternId => forgetPattern(patternId),
+    highlightNotes: notes => highlightNoteList(notes),
+    updateHighlights: (notesOn, notesOff) => updateHighlights(notesOn, notesOff),
+    setStepTable: (stepTable, stepBends) => setStepTable(stepTable, stepBends),
+    highlightStep: index => highlightStep(index),
+    startClock: onsetsMs => startClock(onsetsMs),
+    syncClock: audioMs => syncClock(audioMs),
+    stopClock: () => stopClock(),
+    setStatsInterval: intervalMs => setStatsInterval(intervalMs),
+    clearNoteHighlights: () => window.clearNoteHighlights(),
+    setTitle: title => { document.querySelector('.fretboard-title').textContent = title; },
+    setSubtitle: subtitle => { document.querySelector('.fretboard-subtitle').textContent = subtitle; },
+    bendNote: (stringIndex, fret, halftones) => window.handlePythonBendRequest(stringIndex, fret, halftones),
 };
 
-/**
- * Called from Python when playback is stopped. 
- */
-window.clearNoteHighlights = function() {
-    document.querySelectorAll('.note, .open-string-note').forEach(note => {
-        note.classList.add('inactive');
+let pendingUpdates = [];
+let updateFrameRequested = false;
+
+// Set by connectBridge(); used to report back to Python
+let pythonBridge = null;
+
+// performance.now() at which the update being applied arrived from Python.
+// Clock syncs use it so the frame wait doesn't skew the anchor.
+let updateReceivedAt = 0;
+
+function applyPendingUpdates() {
+    updateFrameRequested = false;
+    const updates = pendingUpdates;
+    pendingUpdates = [];
+    const appliedAt = performance.now();
+    updates.forEach(([name, args, receivedAt]) => {
+        const handler = UPDATE_HANDLERS[name];
+        if (!handler) {
+            console.warn(`Unknown update from Python: ${name}`);
+            return;
+        }
+        updateReceivedAt = receivedAt;
+        const start = performance.now();
+        try {
+            handler(...args);
+        } catch (e) {
+            console.error(`Update ${name} failed:`, e);
+        }
+        if (statsTimer !== null) {
+            addStat(pageStats.queueDelay, appliedAt - receivedAt);
+            addStat(handlerStat(name), performance.now() - start);
+        }
+    });
+}
+
+function queueUpdates(updates) {
+    const receivedAt = performance.now();
+    updates.forEach(([name, args]) => {
+        if (name === 'ping') {
+            // Answered on receipt, not in the next frame, to measure the bridge alone
+            pythonBridge.pong(args[0]);
+            return;
+        }
+        pendingUpdates.push([name, args, receivedAt]);
     });
+    if (pendingUpdates.length && !updateFrameRequested) {
+        updateFrameRequested = true;
+        requestAnimationFrame(applyPendingUpdates);
+    }
 }
 
+function connectBridge() {
+    if (typeof QWebChannel === 'undefined' || !window.qt || !qt.webChannelTransport) {
+        console.warn("QWebChannel not available; Python updates are disabled.");
+        return;
+    }
+    new QWebChannel(qt.webChannelTransport, channel => {
+        const bridge = channel.objects.fretboard;
+        pythonBridge = bridge;
+        bridge.updates.connect(queueUpdates);
+        // Tell Python the fretboard is drawn and updates can be sent
+        bridge.page_ready();
+    });
+}
+
+// --- Timing Stats ---
+// Enabled from Python with setStatsInterval(ms). The page then times every
+// update handler, the wait from receiving an update to applying it in a frame,
+// the frame intervals, and in page-clock mode how late each step is highlighted
+// relative to its onset. Aggregates are sent to Python every interval and reset.
+
+// Frames longer than this count as long frames (missed 60 Hz deadlines)
+const LONG_FRAME_MS = 20;
+
+let statsTimer = null;
+let statsFrame = null;
+let lastFrameTime = null;
+let pageStats = newPageStats();
+
+function newStat() {
+    return { count: 0, totalMs: 0, maxMs: 0 };
+}
+
+function addStat(stat, ms) {
+    stat.count++;
+    stat.totalMs += ms;
+    if (ms > stat.maxMs) stat.maxMs = ms;
+}
+
+function summarizeStat(stat) {
+    return {
+        count: stat.count,
+        mean_ms: stat.count ? stat.totalMs / stat.count : 0,
+        max_ms: stat.maxMs,
+    };
+}
+
+function newPageStats() {
+    return {
+        startedAt: performance.now(),
+        handlers: {},
+        queueDelay: newStat(),
+        frames: newStat(),
+        longFrames: 0,
+        stepLateness: newStat(),
+        clockDrift: newStat(),
+    };
+}
+
+function handlerStat(name) {
+    if (!pageStats.handlers[name]) {
+        pageStats.handlers[name] = newStat();
+    }
+    return pageStats.handlers[name];
+}
+
+function statsFrameLoop(frameTime) {
+    if (lastFrameTime !== null) {
+        const frameMs = frameTime - lastFrameTime;
+        addStat(pageStats.frames, frameMs);
+        if (frameMs > LONG_FRAME_MS) pageStats.longFrames++;
+    }
+    lastFrameTime = frameTime;
+    statsFrame = requestAnimationFrame(statsFrameLoop);
+}
+
+function reportStats() {
+    const handlers = {};
+    for (const [name, stat] of Object.entries(pageStats.handlers)) {
+        handlers[name] = summarizeStat(stat);
+    }
+    pythonBridge.report_stats({
+        interval_ms: performance.now() - pageStats.startedAt,
+        handlers,
+        queue_delay: summarizeStat(pageStats.queueDelay),
+        frames: summarizeStat(pageStats.frames),
+        long_frames: pageStats.longFrames,
+        step_lateness: summarizeStat(pageStats.stepLateness),
+        clock_drift: summarizeStat(pageStats.clockDrift),
+    });
+    pageStats = newPageStats();
+}
+
+function setStatsInterval(intervalMs) {
+    if (statsTimer !== null) {
+        clearInterval(statsTimer);
+        cancelAnimationFrame(statsFrame);
+        statsTimer = null;
+        statsFrame = null;
+    }
+    lastFrameTime = null;
+    pageStats = newPageStats();
+    if (intervalMs > 0 && pythonBridge) {
+        statsTimer = setInterval(reportStats, intervalMs);
+        statsFrame = requestAnimationFrame(statsFrameLoop);
+    }
+}
+
+connectBridge();
+
 
 
 // --- Animation Trigger ---
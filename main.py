@@ -4,16 +4,91 @@ Coordinates audio playback and fretboard visualization.
 '''
 
 import os
+import threading
 from PySide6.QtCore import QObject, Slot, Signal
 from PySide6.QtWidgets import QApplication
 from ui.main_window import MainWindow
-from ui.fretboard_view import FretboardView
 from audio_engine import AudioEngine
+from render_cache import RenderCache
+from lesson_watcher import LessonWatcher, changed_parts, match_part
 
 # Configuration
 NOTE_FOLDER = 'clean'
+DISTORTION_FOLDER = 'distortion'  # Created by utils/disortion.py
 SAMPLERATE = 44100
 STRUM_DELAY_MS = 10
+# 'steps': Python sends every step index as it is heard. 'page_clock': the
+# page highlights steps from its own clock, anchored to the audio position
+# minus the buffered latency.
+HIGHLIGHT_MODE = 'steps'
+# 'web': fretboard.html in QWebEngineView. 'native': QGraphicsScene drawing,
+# which starts faster and without a Chromium process. --native-fretboard on
+# the command line overrides this.
+FRETBOARD_RENDERER = 'web'
+# Print page, bridge and audio timing stats after every playback.
+# --timing-stats on the command line turns this on.
+TIMING_STATS = False
+# Reload the open lesson when its file is edited, re-rendering only the
+# parts that changed
+HOT_RELOAD_LESSONS = True
+
+
+def create_fretboard_view(renderer='web'):
+    """
+    Create the fretboard view for a renderer.
+
+    The view module is imported here so the native renderer never loads
+    QtWebEngine.
+
+    Args:
+        renderer: 'web' for FretboardView or 'native' for NativeFretboardView
+
+    Returns:
+        The new view widget
+    """
+    if renderer == 'web':
+        from ui.fretboard_view import FretboardView
+        return FretboardView()
+    if renderer == 'native':
+        from ui.native_fretboard_view import NativeFretboardView
+        return NativeFretboardView()
+    raise ValueError(f"Unknown fretboard renderer '{renderer}'. Supported: web, native")
+
+
+class LessonLoadTask(QObject):
+    """
+    Load a lesson in a worker thread and deliver it on the GUI thread.
+
+    Executing a lesson module can take a while, so it runs alongside the
+    fretboard view startup. The result is passed through a queued signal,
+    so finished is only emitted once the event loop is running again and
+    receivers connected after start() still get it.
+    """
+
+    # Emitted on the GUI thread with the Lesson, or None if loading failed
+    finished = Signal(object)
+
+    # Worker thread -> GUI thread
+    _loaded = Signal(object)
+
+    def __init__(self, loader, parent=None):
+        super().__init__(parent)
+        self.loader = loader
+        self._loaded.connect(self.finished)
+        self._thread = None
+
+    def start(self, filename):
+        """
+        Start loading a lesson in the background.
+
+        Args:
+            filename: Lesson filename, as accepted by LessonLoader.load_lesson
+        """
+        self._thread = threading.Thread(
+            target=lambda: self._loaded.emit(self.loader.load_lesson(filename)),
+            name='LessonLoad', daemon=True
+        )
+        self._thread.start()
 
 
 class FretboardPlayer(QObject):
@@ -29,7 +104,7 @@ class FretboardPlayer(QObject):
     # Signal emitted when a part is loaded with its name for subtitle display
     subtitle_changed = Signal(str)  # part_name
 
-    def __init__(self, fretboard_view, audio_engine, parent=None):
+    def __init__(self, fretboard_view, audio_engine, highlight_mode='steps', parent=None):
         super().__init__(parent)
 
         # Store references
@@ -41,10 +116,33 @@ class FretboardPlayer(QObject):
         self.current_part_index = 0
         self._current_part = None
 
+        # Display calls wait until the view has emitted view_loaded;
+        # on_fretboard_loaded then sends the current lesson and part
+        self._view_ready = False
+
         # Connect signals
         self.fretboard_view.view_loaded.connect(self.on_fretboard_loaded)
         self.audio_engine.highlight_note_index.connect(self.on_highlight_note_index)
         self.audio_engine.playback_stopped.connect(self.on_playback_stopped)
+        self.audio_engine.playback_started.connect(self.fretboard_view.start_clock)
+        self.audio_engine.audio_clock.connect(self.fretboard_view.sync_clock)
+        self.set_highlight_mode(highlight_mode)
+
+    def set_highlight_mode(self, mode):
+        """
+        Choose how playback highlights reach the fretboard.
+
+        Args:
+            mode: 'steps' to send each step index from Python as it is heard,
+                  or 'page_clock' to send the step onset times once and let
+                  the page follow its own clock, with periodic corrections
+                  from the audio position
+        """
+        if mode not in ('steps', 'page_clock'):
+            raise ValueError(f"Unknown highlight mode '{mode}'. Supported: steps, page_clock")
+        self.highlight_mode = mode
+        self.audio_engine.step_signals_enabled = mode == 'steps'
+        self.audio_engine.clock_signals_enabled = mode == 'page_clock'
 
     def load_lesson(self, lesson, part_index=0):
         """
@@ -64,11 +162,18 @@ class FretboardPlayer(QObject):
 
         self.current_lesson = lesson
         self.current_part_index = part_index
+        if self._view_ready:
+            self.fretboard_view.set_title(lesson.name)
 
         print(f"Loading lesson: {lesson.name}")
         print(f"  Parts: {lesson.get_part_count()}")
         print(f"  Starting with part {part_index+1}: {lesson.parts[part_index].name}")
 
+        # Pick up re-recorded samples, then map the samples of every part in
+        # the background while the first part renders
+        self.audio_engine.refresh_samples()
+        self.audio_engine.warm_notes(lesson.parts, instrument=lesson.instrument)
+
         # Load the specified part
         self.load_part(lesson.parts[part_index])
 
@@ -76,12 +181,54 @@ class FretboardPlayer(QObject):
         self.part_changed.emit(self.current_part_index, len(self.current_lesson.parts))
 
 
-    def load_part(self, part):
+    def reload_lesson(self, lesson):
+        """
+        Switch to an edited version of the current lesson.
+
+        Only the parts whose content changed are re-rendered: the current part
+        is reloaded and re-displayed if it changed, keeping playback going from
+        the step that was playing, and the samples of other changed parts are
+        warmed. The current part stays selected, following it by content or
+        name if parts were added, removed or reordered.
+
+        Args:
+            lesson: Reloaded Lesson object
+        """
+        old_lesson = self.current_lesson
+        if old_lesson is None or not lesson or not lesson.parts:
+            self.load_lesson(lesson)
+            return
+
+        changed = changed_parts(old_lesson, lesson)
+        part_index = match_part(old_lesson, lesson, self.current_part_index)
+        self.current_lesson = lesson
+        self.current_part_index = part_index
+        print(f"Reloaded lesson: {lesson.name}, changed parts: "
+              f"{', '.join(str(index + 1) for index in changed) or 'none'}")
+
+        if self._view_ready and lesson.name != old_lesson.name:
+            self.fretboard_view.set_title(lesson.name)
+
+        other_parts = [lesson.parts[index] for index in changed if index != part_index]
+        if other_parts:
+            self.audio_engine.warm_notes(other_parts, instrument=lesson.instrument)
+
+        if part_index in changed:
+            self.load_part(lesson.parts[part_index], keep_playing=True)
+        else:
+            self._current_part = lesson.parts[part_index]
+
+        # The part count or the current index may have changed
+        self.part_changed.emit(self.current_part_index, len(self.current_lesson.parts))
+
+    def load_part(self, part, keep_playing=False):
         """
         Load and display a single part.
 
         Args:
             part: Part object to load
+            keep_playing: Continue playback in the new part from the step that
+                          was playing, for a reloaded version of the current part
         """
         if not part:
             print("Error: Cannot load None part")
@@ -90,10 +237,14 @@ class FretboardPlayer(QObject):
         self._current_part = part
 
         # Load audio sequence
-        self.audio_engine.load_part(part)
+        instrument = self.current_lesson.instrument if self.current_lesson else ''
+        if keep_playing:
+            self.audio_engine.reload_part(part, instrument=instrument)
+        else:
+            self.audio_engine.load_part(part, instrument=instrument)
 
         # Update fretboard display if it's already loaded
-        if self.fretboard_view.isVisible():
+        if self._view_ready:
             # Get use_sharp setting from current lesson, default to True
             use_sharp = self.current_lesson.use_sharp if self.current_lesson else True
             self.fretboard_view.display_notes(
@@ -101,6 +252,7 @@ class FretboardPlayer(QObject):
                 part.highlight_classes,
                 use_sharp=use_sharp
             )
+            self.fretboard_view.set_step_table(part.play_sequence)
 
         print(f"Loaded part: {part.name}")
         print(f"  Notes to highlight: {len(part.notes_to_highlight)}")
@@ -197,13 +349,9 @@ class FretboardPlayer(QObject):
         if index >= len(self._current_part.play_sequence):
             return
 
-        notes_to_highlight = []
-        for item in self._current_part.play_sequence[index]:
-            if isinstance(item, tuple):
-                notes_to_highlight.append(item)
-
-        self.fretboard_view.highlight_notes(notes_to_highlight)
-        print(f"Highlighting notes for index {index}: {notes_to_highlight}")
+        # The step table was uploaded in load_part; only the index crosses the bridge
+        self.fretboard_view.highlight_step(index)
+        print(f"Highlighting step {index}")
 
     @Slot()
     def on_playback_stopped(self):
@@ -211,8 +359,50 @@ class FretboardPlayer(QObject):
         Handle playback stopped signal from audio engine.
         Clears highlights on the fretboard.
         """
+        if self.highlight_mode == 'page_clock':
+            self.fretboard_view.stop_clock()
         self.fretboard_view.clear_note_highlights()
 
+    def timing_report(self):
+        """
+        Timing stats of the fretboard view and the audio engine side by side,
+        so highlight lag can be attributed to audio scheduling (audio), the
+        bridge between Python and the page (bridge_round_trip) or the page's
+        own work (page handlers, queue delay and frames).
+
+        Returns:
+            Dict with 'audio' (AudioEngine.timing_stats()) and the keys of
+            FretboardView.timing_stats()
+        """
+        report = {'audio': self.audio_engine.timing_stats()}
+        report.update(self.fretboard_view.timing_stats())
+        return report
+
+    def print_timing_report(self):
+        """Print timing_report() in a readable form."""
+        def line(label, stat):
+            if stat:
+                print(f"  {label:<28} n={stat['count']:<5} mean={stat['mean_ms']:7.2f} ms"
+                      f"  max={stat['max_ms']:7.2f} ms")
+
+        report = self.timing_report()
+        audio = report['audio']
+        print("Timing stats:")
+        line('audio push interval', audio['push_interval'])
+        line('audio step signal late', audio['step_signal_late'])
+        line('audio offset at step signal', audio['step_audio_offset'])
+        print(f"  {'audio underruns':<28} {audio['underruns']}")
+        line('bridge round trip', report['bridge_round_trip'])
+        page = report['page']
+        if page:
+            line('page queue delay', page['queue_delay'])
+            line('page frames', page['frames'])
+            print(f"  {'page long frames':<28} {page['long_frames']}")
+            line('page step lateness', page['step_lateness'])
+            line('page clock drift', page['clock_drift'])
+            for name, stat in sorted(page['handlers'].items()):
+                line(f"page handler {name}", stat)
+
     @Slot()
     def on_fretboard_loaded(self):
         """
@@ -220,6 +410,9 @@ class FretboardPlayer(QObject):
         Sends initial data to display on the fretboard.
         """
         print("Fretboard loaded.")
+        self._view_ready = True
+        if self.current_lesson:
+            self.fretboard_view.set_title(self.current_lesson.name)
         if self._current_part:
             print(f"Displaying part: {self._current_part.name}")
             # Get use_sharp setting from current lesson, default to True
@@ -229,6 +422,7 @@ class FretboardPlayer(QObject):
                 self._current_part.highlight_classes,
                 use_sharp=use_sharp
             )
+            self.fretboard_view.set_step_table(self._current_part.play_sequence)
             # Emit subtitle signal now that the view is loaded
             self.subtitle_changed.emit(self._current_part.name)
 
@@ -236,87 +430,118 @@ class FretboardPlayer(QObject):
 # --- Application entry point ---
 if __name__ == "__main__":
     import sys
+    import time
+    from PySide6.QtCore import Qt, QTimer
+    from PySide6.QtWidgets import QLabel
     from models.lesson_loader import LessonLoader
 
+    started_at = time.perf_counter()
+
+    def elapsed_ms():
+        return (time.perf_counter() - started_at) * 1000.0
+
     os.environ["QTWEBENGINE_REMOTE_DEBUGGING"] = "8080"
     app = QApplication(sys.argv)
 
-    # Create main window with toolbar
+    # Show the window and toolbar right away; the fretboard view, audio
+    # engine and lesson are set up once the event loop is running
     main_window = MainWindow()
+    placeholder = QLabel("Loading fretboard...")
+    placeholder.setAlignment(Qt.AlignCenter)
+    main_window.set_central_content(placeholder)
+    main_window.show()
+    print(f"Window shown after {elapsed_ms():.0f} ms")
+
+    renderer = 'native' if '--native-fretboard' in sys.argv else FRETBOARD_RENDERER
+    lesson_task = LessonLoadTask(LessonLoader())
+    app_state = {}
+
+    def start_app():
+        # Import and run the default lesson module while the view starts
+        # default_lesson_name = "beginner_c_major"
+        # default_lesson_name = "g_maj_pentatonic"
+        default_lesson_name = "bflat_maj_triad"
+        # default_lesson_name = "c_maj_triad"
+        lesson_task.start(default_lesson_name)
+        app_state['lesson_filename'] = default_lesson_name
+
+        # Create fretboard view. The web view loads its page asynchronously
+        # and queues display calls until view_loaded.
+        fretboard_view = create_fretboard_view(renderer)
+        fretboard_view.view_loaded.connect(
+            lambda: print(f"Fretboard ready after {elapsed_ms():.0f} ms")
+        )
 
-    # Create fretboard view
-    fretboard_view = FretboardView()
-
-    # Create audio engine
-    audio_engine = AudioEngine(
-        audio_folder=NOTE_FOLDER,
-        samplerate=SAMPLERATE,
-        strum_delay_ms=STRUM_DELAY_MS
-    )
+        # Create audio engine
+        audio_engine = AudioEngine(
+            audio_folder=NOTE_FOLDER,
+            samplerate=SAMPLERATE,
+            strum_delay_ms=STRUM_DELAY_MS,
+            render_cache=RenderCache()
+        )
+        if os.path.isdir(DISTORTION_FOLDER):
+            # utils/disortion.py keeps the note_<midi>.wav names of its input
+            audio_engine.register_instrument('distortion', DISTORTION_FOLDER, prefix='note_')
+
+        # Create coordinator that connects audio and visuals
+        player = FretboardPlayer(fretboard_view, audio_engine, highlight_mode=HIGHLIGHT_MODE)
+        app_state['player'] = player
+
+        if TIMING_STATS or '--timing-stats' in sys.argv:
+            fretboard_view.enable_stats()
+            audio_engine.playback_stopped.connect(player.print_timing_report)
+
+        # Set fretboard view as central widget
+        main_window.set_central_content(fretboard_view)
+
+        # Connect toolbar signals to audio engine
+        main_window.play_clicked.connect(audio_engine.start_playback)
+        main_window.stop_clicked.connect(audio_engine.stop_playback)
+        main_window.speed_changed.connect(audio_engine.set_speed)
+
+        # Connect audio engine signals to main window
+        audio_engine.playback_stopped.connect(lambda: main_window.update_playback_state(False))
+
+        # Connect navigation signals
+        main_window.previous_part_clicked.connect(player.previous_part)
+        main_window.next_part_clicked.connect(player.next_part)
+
+        # Connect part_changed signal to update navigation button states
+        # IMPORTANT: This must be connected BEFORE loading the lesson
+        player.part_changed.connect(
+            lambda idx, total: main_window.enable_navigation_buttons(
+                idx > 0,  # can go previous
+                idx < total - 1  # can go next
+            )
+        )
 
-    # Create coordinator that connects audio and visuals
-    player = FretboardPlayer(fretboard_view, audio_engine)
-    player
+        # Connect subtitle_changed signal to update fretboard subtitle
+        player.subtitle_changed.connect(fretboard_view.set_subtitle)
 
-    # Set fretboard view as central widget
-    main_window.set_central_content(fretboard_view)
+        # The lesson may arrive before or after the view is ready;
+        # FretboardPlayer holds the display calls until view_loaded
+        lesson_task.finished.connect(on_lesson_loaded)
 
-    # Connect toolbar signals to audio engine
-    main_window.play_clicked.connect(audio_engine.start_playback)
-    main_window.stop_clicked.connect(audio_engine.stop_playback)
+        if HOT_RELOAD_LESSONS:
+            watcher = LessonWatcher(lesson_task.loader, parent=player)
+            watcher.lesson_reloaded.connect(on_lesson_reloaded)
 
-    # Connect audio engine signals to main window
-    audio_engine.playback_stopped.connect(lambda: main_window.update_playback_state(False))
+    def on_lesson_reloaded(filename, lesson):
+        if filename == app_state.get('lesson_filename'):
+            app_state['player'].reload_lesson(lesson)
 
-    # Connect navigation signals
-    main_window.previous_part_clicked.connect(player.previous_part)
-    main_window.next_part_clicked.connect(player.next_part)
+    def on_lesson_loaded(lesson):
+        print("\n" + "="*70)
+        if lesson:
+            # Samples of every part are warmed in the background from here
+            app_state['player'].load_lesson(lesson)
+            print(f"✓ Successfully loaded: {lesson.name} ({elapsed_ms():.0f} ms)")
+        else:
+            print("⚠️  Warning: Could not load default lesson")
+            print("   The application will start but no lesson will be loaded.")
+            print("   You can load a lesson later using File > Load Lesson")
+        print("="*70 + "\n")
 
-    # Connect part_changed signal to update navigation button states
-    # IMPORTANT: This must be connected BEFORE loading the lesson
-    player.part_changed.connect(
-        lambda idx, total: main_window.enable_navigation_buttons(
-            idx > 0,  # can go previous
-            idx < total - 1  # can go next
-        )
-    )
-
-    # Connect subtitle_changed signal to update fretboard subtitle
-    player.subtitle_changed.connect(fretboard_view.set_subtitle)
-
-    # Load default lesson (after all signal connections are set up)
-    loader = LessonLoader()
-    print("\n" + "="*70)
-    print("LOADING DEFAULT LESSON")
-    print("="*70)
-
-    # default_lesson = loader.load_lesson("beginner_c_major")
-    # default_lesson = loader.load_lesson("g_maj_pentatonic")
-    default_lesson = loader.load_lesson("bflat_maj_triad")
-    # default_lesson = loader.load_lesson("c_maj_triad")
-    if default_lesson:
-        player.load_lesson(default_lesson)
-        print(f"✓ Successfully loaded: {default_lesson.name}")
-        fretboard_view.view_loaded.connect(
-            lambda: fretboard_view.set_title(default_lesson.name)
-        )
-    else:
-        print("⚠️  Warning: Could not load default lesson")
-        print("   The application will start but no lesson will be loaded.")
-        print("   You can load a lesson later using File > Load Lesson")
-
-    print("="*70 + "\n")
-
-    # Set title and subtitle once the fretboard view has loaded its content.
-    # This ensures the JavaScript functions are available to be called.
-    # fretboard_view.view_loaded.connect(
-    #     lambda: fretboard_view.set_title('D Major Triads')
-    # )
-    # fretboard_view.view_loaded.connect(
-    #     lambda: fretboard_view.set_subtitle('Strings G, B, e')
-    # )
-
-    # Show the main window
-    main_window.show()
+    QTimer.singleShot(0, start_app)
 
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
@@ -0,0 +1,241 @@
+"""
+Declarative lesson files.
+
+Besides Python modules, lessons can be written as TOML files that describe
+a Lesson and its Parts as plain data. They are parsed with tomllib instead
+of being executed, so they load fast and are safe to load from anywhere.
+
+The layout mirrors the Lesson and Part constructors; notes are
+[string, fret] arrays and bends [string, fret, halftones]:
+
+    name = "A Minor Pentatonic"
+    description = "Position 1 around fret 5"
+    author = "Guitar Teacher"
+    use_sharp = true            # optional, default true
+    instrument = "clean"        # optional
+
+    [metadata]                  # optional, any values
+    difficulty = "beginner"
+
+    [[parts]]
+    name = "Position 1"
+    description = "Root on the low E string"      # optional
+    instrument = "distortion"                     # optional
+    notes = [["E", 5], ["E", 8], ["A", 5], ["A", 7]]
+    highlight_classes = { A = "highlight1" }      # optional
+    play_sequence = [
+        [["E", 5], 500],
+        [["E", 8], ["A", 7], 1000],  # chord
+        [["A", 7, 2], 1000],         # bend up 2 halftones
+    ]
+
+Every step ends with its duration in milliseconds. Unknown keys are
+rejected, so a typo fails loudly instead of being ignored.
+"""
+
+import tomllib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from constants import STRING_NAMES
+from models.lesson_model import Lesson, Part
+
+# Supported lesson file extensions. If a lesson exists in several formats,
+# the first one in this order is used.
+LESSON_EXTENSIONS = ('.py', '.toml')
+
+MAX_FRET = 24
+HIGHLIGHT_CLASSES = ('highlight1', 'highlight2', 'highlight3')
+
+LESSON_KEYS = {'name', 'description', 'author', 'use_sharp', 'instrument', 'metadata', 'parts'}
+PART_KEYS = {'name', 'description', 'instrument', 'notes', 'highlight_classes', 'play_sequence'}
+
+
+class LessonFormatError(ValueError):
+    """A declarative lesson file doesn't match the lesson schema."""
+
+
+def strip_lesson_extension(filename: str) -> str:
+    """
+    Lesson filename without a supported extension.
+
+    Args:
+        filename: Lesson filename, e.g. 'scale', 'scale.py' or 'scale.toml'
+
+    Returns:
+        Filename without the extension, e.g. 'scale'
+    """
+    for ext in LESSON_EXTENSIONS:
+        if filename.endswith(ext):
+            return filename[:-len(ext)]
+    return filename
+
+
+def find_lesson_file(lessons_dir: Path, filename: str) -> Optional[Path]:
+    """
+    Path of a lesson file in any supported format.
+
+    Args:
+        lessons_dir: Directory containing the lesson files
+        filename: Lesson filename without extension
+
+    Returns:
+        Path of the first existing file in LESSON_EXTENSIONS order, or None
+    """
+    for ext in LESSON_EXTENSIONS:
+        path = Path(lessons_dir) / f"{filename}{ext}"
+        if path.is_file():
+            return path
+    return None
+
+
+def _check_keys(table: Dict[str, Any], allowed: set, where: str):
+    unknown = sorted(set(table) - allowed)
+    if unknown:
+        raise LessonFormatError(
+            f"{where}: unknown key(s) {', '.join(unknown)}. "
+            f"Allowed: {', '.join(sorted(allowed))}"
+        )
+
+
+def _check_type(value: Any, expected: type, where: str):
+    # bool is an int subclass, but true is never a valid fret or duration
+    if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+        raise LessonFormatError(f"{where}: expected {expected.__name__}, got {value!r}")
+
+
+def _note(value: Any, where: str, allow_bend: bool = False) -> Tuple:
+    """Convert a [string, fret] (or [string, fret, halftones]) array to a tuple."""
+    sizes = (2, 3) if allow_bend else (2,)
+    if not isinstance(value, list) or len(value) not in sizes:
+        shape = '[string, fret] or [string, fret, halftones]' if allow_bend else '[string, fret]'
+        raise LessonFormatError(f"{where}: expected {shape}, got {value!r}")
+    string_name, fret = value[0], value[1]
+    if string_name not in STRING_NAMES:
+        raise LessonFormatError(
+            f"{where}: invalid string {string_name!r}, must be one of {', '.join(STRING_NAMES)}"
+        )
+    _check_type(fret, int, f"{where} fret")
+    if not 0 <= fret <= MAX_FRET:
+        raise LessonFormatError(f"{where}: fret {fret} must be between 0 and {MAX_FRET}")
+    if len(value) == 3:
+        _check_type(value[2], int, f"{where} halftones")
+        if value[2] not in (1, 2):
+            raise LessonFormatError(f"{where}: bend halftones {value[2]} must be 1 or 2")
+    return tuple(value)
+
+
+def _step(value: Any, where: str) -> List[Union[Tuple, int]]:
+    """Convert a [note, ..., duration] array to a play sequence step."""
+    if not isinstance(value, list) or len(value) < 2:
+        raise LessonFormatError(f"{where}: expected [note, ..., duration_ms], got {value!r}")
+    duration = value[-1]
+    _check_type(duration, int, f"{where} duration")
+    if duration <= 0:
+        raise LessonFormatError(f"{where}: duration {duration} must be positive")
+    notes = [_note(note, f"{where}[{i}]", allow_bend=True) for i, note in enumerate(value[:-1])]
+    return notes + [duration]
+
+
+def _part(table: Any, where: str) -> Part:
+    if not isinstance(table, dict):
+        raise LessonFormatError(f"{where}: expected a table, got {table!r}")
+    _check_keys(table, PART_KEYS, where)
+    for key in ('name', 'notes', 'play_sequence'):
+        if key not in table:
+            raise LessonFormatError(f"{where}: missing required key '{key}'")
+
+    name = table['name']
+    _check_type(name, str, f"{where}.name")
+    notes = table['notes']
+    _check_type(notes, list, f"{where}.notes")
+    sequence = table['play_sequence']
+    _check_type(sequence, list, f"{where}.play_sequence")
+    if not notes or not sequence:
+        raise LessonFormatError(f"{where}: notes and play_sequence must not be empty")
+
+    highlight_classes = table.get('highlight_classes', {})
+    _check_type(highlight_classes, dict, f"{where}.highlight_classes")
+    for note_name, css_class in highlight_classes.items():
+        if css_class not in HIGHLIGHT_CLASSES:
+            raise LessonFormatError(
+                f"{where}.highlight_classes.{note_name}: {css_class!r} must be one of "
+                f"{', '.join(HIGHLIGHT_CLASSES)}"
+            )
+
+    for key in ('description', 'instrument'):
+        _check_type(table.get(key, ''), str, f"{where}.{key}")
+
+    try:
+        return Part(
+            name=name,
+            notes_to_highlight=[_note(note, f"{where}.notes[{i}]") for i, note in enumerate(notes)],
+            play_sequence=[_step(step, f"{where}.play_sequence[{i}]") for i, step in enumerate(sequence)],
+            highlight_classes=dict(highlight_classes),
+            description=table.get('description', ''),
+            instrument=table.get('instrument', ''),
+        )
+    except LessonFormatError:
+        raise
+    except ValueError as e:
+        raise LessonFormatError(f"{where}: {e}") from e
+
+
+def lesson_from_dict(data: Dict[str, Any]) -> Lesson:
+    """
+    Build a Lesson from parsed declarative lesson data.
+
+    Args:
+        data: Dict in the layout described in this module's docstring
+
+    Returns:
+        Lesson object
+
+    Raises:
+        LessonFormatError: If the data doesn't match the lesson schema
+    """
+    _check_keys(data, LESSON_KEYS, 'lesson')
+    for key in ('name', 'parts'):
+        if key not in data:
+            raise LessonFormatError(f"lesson: missing required key '{key}'")
+    _check_type(data['name'], str, 'name')
+    for key in ('description', 'author', 'instrument'):
+        _check_type(data.get(key, ''), str, key)
+    _check_type(data.get('use_sharp', True), bool, 'use_sharp')
+    _check_type(data.get('metadata', {}), dict, 'metadata')
+    _check_type(data['parts'], list, 'parts')
+
+    parts = [_part(table, f"parts[{i}]") for i, table in enumerate(data['parts'])]
+    try:
+        return Lesson(
+            name=data['name'],
+            parts=parts,
+            description=data.get('description', ''),
+            author=data.get('author', ''),
+            use_sharp=data.get('use_sharp', True),
+            instrument=data.get('instrument', ''),
+            metadata=data.get('metadata', {}),
+        )
+    except ValueError as e:
+        raise LessonFormatError(str(e)) from e
+
+
+def load_toml_lesson(path: Union[str, Path]) -> Lesson:
+    """
+    Load a lesson from a TOML file.
+
+    Args:
+        path: Path of the .toml lesson file
+
+    Returns:
+        Lesson object
+
+    Raises:
+        OSError: If the file can't be read
+        LessonFormatError: If it isn't valid TOML or doesn't match the schema
+    """
+    with open(path, 'rb') as f:
+        try:
+            data = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise LessonFormatError(f"invalid TOML: {e}") from e
+    return lesson_from_dict(data)
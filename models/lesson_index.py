@@ -0,0 +1,219 @@
+"""
+Persistent index of lesson metadata.
+
+Listing lessons used to import and execute every lesson module just to read
+its name, author and part count. The index stores that metadata per lesson
+file in a JSON file under ConfigManager.get_configdir()/cache/lessons, with
+the file's size and mtime. Listing stats the lesson files and only loads
+the lessons that are new or changed since the index was written.
+
+Only the lesson file itself is tracked. If a lesson builds its parts from a
+shared module (lesson_utils, scales.py) that changes, call
+LessonLoader.rebuild_index().
+"""
+
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+from settings import ConfigManager
+from models.lesson_format import LESSON_EXTENSIONS, find_lesson_file
+
+LESSON_INDEX_SUBDIR = os.path.join('cache', 'lessons')
+
+# Bump when the stored info changes shape, so old indexes are rebuilt
+LESSON_INDEX_VERSION = 1
+
+
+def lesson_info(filename: str, lesson) -> Dict[str, Any]:
+    """
+    Metadata of a loaded lesson, as stored in the index.
+
+    Args:
+        filename: Lesson filename without extension
+        lesson: Lesson object
+
+    Returns:
+        Dict with filename, name, description, author, part_count,
+        total_duration_ms, part_names, instrument, use_sharp and metadata
+        (omitted if it isn't JSON serializable)
+    """
+    info = {
+        'filename': filename,
+        'name': lesson.name,
+        'description': lesson.description,
+        'author': lesson.author,
+        'part_count': lesson.get_part_count(),
+        'total_duration_ms': lesson.get_total_duration_ms(),
+        'part_names': [part.name for part in lesson.parts],
+        'instrument': lesson.instrument,
+        'use_sharp': lesson.use_sharp,
+    }
+    try:
+        json.dumps(lesson.metadata)
+        info['metadata'] = lesson.metadata
+    except (TypeError, ValueError):
+        pass
+    return info
+
+
+class LessonIndex:
+    """
+    Metadata of every lesson file in a directory, persisted between runs.
+
+    Each entry records the file's size and mtime and the lesson_info() of
+    the lesson it defines, or None if the module failed to load, so broken
+    files are not re-executed on every listing either.
+
+    Example:
+        >>> index = LessonIndex(Path('lessons'))
+        >>> infos = index.refresh(loader.lesson_for_index)
+        >>> infos['beginner_c_major']['part_count']
+        2
+    """
+
+    def __init__(self, lessons_dir: Path, index_dir: Optional[str] = None):
+        """
+        Args:
+            lessons_dir: Directory containing the lesson files
+            index_dir: Directory for the persisted index. Defaults to
+                       ConfigManager.get_configdir()/cache/lessons
+        """
+        self.lessons_dir = Path(lessons_dir)
+        if index_dir is None:
+            index_dir = os.path.join(ConfigManager.get_configdir(), LESSON_INDEX_SUBDIR)
+        self.index_dir = index_dir
+        self._entries = None  # filename -> {'size', 'mtime_ns', 'info'}
+
+    @property
+    def index_id(self) -> str:
+        """Stable identifier for the lessons directory, safe to use in filenames."""
+        folder = str(self.lessons_dir.resolve())
+        name = re.sub(r'[^A-Za-z0-9_]', '_', self.lessons_dir.name) or 'lessons'
+        digest = hashlib.sha1(folder.encode('utf-8')).hexdigest()[:8]
+        return f"{name}_{digest}"
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.index_dir, f"{self.index_id}.json")
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if stored.get('version') != LESSON_INDEX_VERSION:
+            return {}
+        return stored.get('files', {})
+
+    def _write_index(self):
+        index = {
+            'version': LESSON_INDEX_VERSION,
+            'folder': str(self.lessons_dir.resolve()),
+            'files': self._entries,
+        }
+        try:
+            os.makedirs(self.index_dir, exist_ok=True)
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Warning: Could not write lesson index {self.index_path}: {e}")
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = self._read_index()
+
+    def _update_entry(self, filename: str, st: os.stat_result, load_lesson) -> bool:
+        """Re-read one file's entry if its size or mtime changed; True if it did."""
+        old = self._entries.get(filename)
+        if old and old['size'] == st.st_size and old['mtime_ns'] == st.st_mtime_ns:
+            return False
+        lesson = load_lesson(filename, st.st_size, st.st_mtime_ns)
+        self._entries[filename] = {
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'info': lesson_info(filename, lesson) if lesson is not None else None,
+        }
+        return True
+
+    def refresh(self, load_lesson) -> Dict[str, Dict[str, Any]]:
+        """
+        Stat every lesson file and update the entries of new or changed ones.
+
+        Args:
+            load_lesson: Callable (filename, size, mtime_ns) -> Lesson or None,
+                         called only for files whose entry is missing or stale
+
+        Returns:
+            Dict mapping filename to lesson_info() for every lesson that
+            loads, in filename order
+        """
+        self._load()
+        changed = False
+        # filename -> (LESSON_EXTENSIONS rank, DirEntry) of the file that is loaded
+        found = {}
+        try:
+            with os.scandir(self.lessons_dir) as it:
+                for entry in it:
+                    filename, ext = os.path.splitext(entry.name)
+                    if ext not in LESSON_EXTENSIONS or entry.name.startswith(('_', '.')):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    rank = LESSON_EXTENSIONS.index(ext)
+                    if filename not in found or rank < found[filename][0]:
+                        found[filename] = (rank, entry)
+        except OSError as e:
+            print(f"Warning: Could not scan lessons directory '{self.lessons_dir}': {e}")
+
+        for filename, (_, entry) in found.items():
+            changed |= self._update_entry(filename, entry.stat(), load_lesson)
+        for filename in set(self._entries) - set(found):
+            del self._entries[filename]
+            changed = True
+        if changed:
+            self._write_index()
+
+        return {
+            filename: self._entries[filename]['info']
+            for filename in sorted(self._entries)
+            if self._entries[filename]['info'] is not None
+        }
+
+    def info(self, filename: str, load_lesson) -> Optional[Dict[str, Any]]:
+        """
+        Metadata of one lesson, refreshing only that file's entry.
+
+        Args:
+            filename: Lesson filename without extension
+            load_lesson: See refresh()
+
+        Returns:
+            lesson_info() dict, or None if the file is missing or fails to load
+        """
+        self._load()
+        path = find_lesson_file(self.lessons_dir, filename)
+        try:
+            if path is None:
+                raise FileNotFoundError(filename)
+            st = os.stat(path)
+        except OSError:
+            if self._entries.pop(filename, None) is not None:
+                self._write_index()
+            return None
+        if self._update_entry(filename, st, load_lesson):
+            self._write_index()
+        return self._entries[filename]['info']
+
+    def clear(self):
+        """Forget every entry, so the next refresh() executes every lesson."""
+        self._entries = {}
+        try:
+            os.remove(self.index_path)
+        except OSError:
+            pass
@@ -2,31 +2,92 @@
 Lesson loading and discovery system.
 
 This module provides functionality to discover and load lesson files
-from the lessons directory.
+from the lessons directory. Lessons are either Python modules or declarative
+TOML files (see models.lesson_format).
 """
 
 import os
 import sys
+import time
+import threading
 import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, Set, Tuple
 from models.lesson_model import Lesson
+from models.lesson_index import LessonIndex
+from models.lesson_format import (LESSON_EXTENSIONS, LessonFormatError, find_lesson_file,
+                                  load_toml_lesson, strip_lesson_extension)
+
+
+def read_lesson_file(file_path: Path) -> Lesson:
+    """
+    Read the lesson defined in a Python or TOML lesson file, without caching.
+
+    Args:
+        file_path: Path of the .py or .toml file
+
+    Returns:
+        Lesson object
+
+    Raises:
+        OSError: If the file can't be read
+        LessonFormatError: If the file doesn't define a valid lesson
+        Exception: Whatever executing a Python lesson module raises
+    """
+    if file_path.suffix == '.toml':
+        return load_toml_lesson(file_path)
+
+    # Dynamically import the lesson module
+    spec = importlib.util.spec_from_file_location(file_path.stem, file_path)
+    if spec is None or spec.loader is None:
+        raise LessonFormatError(f"Could not load module spec for '{file_path}'")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # Extract the lesson object
+    if not hasattr(module, 'lesson'):
+        raise LessonFormatError(f"Lesson file '{file_path.name}' must export a 'lesson' variable")
+    if not isinstance(module.lesson, Lesson):
+        raise LessonFormatError(f"'lesson' in '{file_path.name}' must be a Lesson instance")
+    return module.lesson
+
+
+def _read_lesson_timed(file_path: str) -> Tuple[Optional[Lesson], Optional[str], float]:
+    """
+    Process pool worker: read_lesson_file() with its error and duration.
+
+    Returns:
+        (lesson or None, error message or None, load time in ms)
+    """
+    start = time.perf_counter()
+    try:
+        lesson, error = read_lesson_file(Path(file_path)), None
+    except Exception as e:
+        lesson, error = None, f"{type(e).__name__}: {e}"
+    return lesson, error, (time.perf_counter() - start) * 1000.0
 
 
 class LessonLoader:
     """
     Discovers and loads lesson files from the lessons directory.
 
-    Supports loading lessons from Python (.py) files. Each lesson file
-    must export a 'lesson' variable containing a Lesson object.
+    Supports loading lessons from Python (.py) and TOML (.toml) files, side
+    by side. A Python lesson file must export a 'lesson' variable containing
+    a Lesson object; a TOML file describes the lesson as data and is parsed
+    without executing anything. If both exist for the same name, the .py
+    file is used.
     """
 
-    def __init__(self, lessons_dir: str = "lessons"):
+    def __init__(self, lessons_dir: str = "lessons", index_dir: Optional[str] = None):
         """
         Initialize the lesson loader.
 
         Args:
             lessons_dir: Path to the lessons directory (relative or absolute)
+            index_dir: Directory for the lesson metadata index. Defaults to
+                       ConfigManager.get_configdir()/cache/lessons
         """
         self.lessons_dir = Path(lessons_dir)
         if not self.lessons_dir.is_absolute():
@@ -34,34 +95,48 @@ class LessonLoader:
             self.lessons_dir = Path.cwd() / self.lessons_dir
 
         self._lesson_cache: Dict[str, Lesson] = {}
+        # (size, mtime_ns) of each cached lesson file when it was executed
+        self._cache_stats: Dict[str, Tuple[int, int]] = {}
+        # Per-file {'filename', 'ms', 'error'} of the last load_all_lessons()
+        self.load_report: List[Dict[str, Any]] = []
+        self.index = LessonIndex(self.lessons_dir, index_dir)
+        # The app loads lessons on a worker thread while the lesson watcher
+        # reloads them on the GUI thread; guards the cache and the index.
+        # Reentrant, as the public methods call each other.
+        self._lock = threading.RLock()
 
     def get_available_lesson_files(self) -> List[str]:
         """
         Get a list of available lesson files in the lessons directory.
 
         Returns:
-            List of lesson filenames (without .py extension)
+            List of lesson filenames (without extension)
             Files starting with _ or . are excluded
         """
         if not self.lessons_dir.exists():
             print(f"Warning: Lessons directory '{self.lessons_dir}' does not exist")
             return []
 
-        lesson_files = []
-        for file_path in self.lessons_dir.glob("*.py"):
-            filename = file_path.stem
-            # Skip template files and private modules
-            if not filename.startswith('_') and not filename.startswith('.'):
-                lesson_files.append(filename)
+        lesson_files = set()
+        for ext in LESSON_EXTENSIONS:
+            for file_path in self.lessons_dir.glob(f"*{ext}"):
+                filename = file_path.stem
+                # Skip template files and private modules
+                if filename.startswith('_') or filename.startswith('.'):
+                    continue
+                if filename in lesson_files:
+                    print(f"Warning: Lesson '{filename}' exists in several formats, "
+                          f"using {find_lesson_file(self.lessons_dir, filename).name}")
+                lesson_files.add(filename)
 
         return sorted(lesson_files)
 
     def load_lesson(self, filename: str) -> Optional[Lesson]:
         """
-        Load a lesson from a Python file.
+        Load a lesson from a Python or TOML file.
 
         Args:
-            filename: Lesson filename (with or without .py extension)
+            filename: Lesson filename (with or without extension)
 
         Returns:
             Lesson object if successful, None if loading failed
@@ -72,66 +147,164 @@ class LessonLoader:
             >>> print(lesson.name)
             Beginner C Major
         """
-        # Remove .py extension if present
-        if filename.endswith('.py'):
-            filename = filename[:-3]
-
-        # Check cache first
-        if filename in self._lesson_cache:
-            return self._lesson_cache[filename]
+        with self._lock:
+            filename = strip_lesson_extension(filename)
 
-        file_path = self.lessons_dir / f"{filename}.py"
+            # Check cache first
+            if filename in self._lesson_cache:
+                return self._lesson_cache[filename]
 
-        if not file_path.exists():
-            print(f"Error: Lesson file '{file_path}' not found")
-            return None
-
-        try:
-            # Dynamically import the lesson module
-            spec = importlib.util.spec_from_file_location(filename, file_path)
-            if spec is None or spec.loader is None:
-                print(f"Error: Could not load module spec for '{file_path}'")
-                return None
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            # Extract the lesson object
-            if not hasattr(module, 'lesson'):
-                print(f"Error: Lesson file '{filename}.py' must export a 'lesson' variable")
-                return None
+            return self._read_into_cache(filename)
 
-            lesson = module.lesson
+    def _read_into_cache(self, filename: str) -> Optional[Lesson]:
+        """
+        Read a lesson file and cache the result. The cached lesson is only
+        replaced if the file loads; on failure it is left as it was.
 
-            if not isinstance(lesson, Lesson):
-                print(f"Error: 'lesson' in '{filename}.py' must be a Lesson instance")
-                return None
+        Args:
+            filename: Lesson filename without extension
 
-            # Cache the lesson
-            self._lesson_cache[filename] = lesson
-            print(f"Successfully loaded lesson: {lesson.name}")
-            return lesson
+        Returns:
+            Lesson object if successful, None if loading failed
+        """
+        file_path = find_lesson_file(self.lessons_dir, filename)
+        try:
+            if file_path is None:
+                raise FileNotFoundError(filename)
+            st = file_path.stat()
+        except OSError:
+            print(f"Error: Lesson file '{self.lessons_dir / filename}' not found")
+            return None
 
+        try:
+            lesson = read_lesson_file(file_path)
+        except (OSError, LessonFormatError) as e:
+            print(f"Error loading lesson '{file_path.name}': {e}")
+            return None
         except Exception as e:
             print(f"Error loading lesson '{filename}': {e}")
             import traceback
             traceback.print_exc()
             return None
 
-    def load_all_lessons(self) -> List[Lesson]:
+        # Cache the lesson
+        self._lesson_cache[filename] = lesson
+        self._cache_stats[filename] = (st.st_size, st.st_mtime_ns)
+        print(f"Successfully loaded lesson: {lesson.name}")
+        return lesson
+
+    def load_all_lessons(self, parallel: bool = False,
+                         max_workers: Optional[int] = None) -> List[Lesson]:
         """
         Load all available lessons from the lessons directory.
 
+        The load time and error of every file are recorded in load_report,
+        see print_load_report().
+
+        Args:
+            parallel: Load the files that aren't cached yet in a process pool
+                      instead of one after another
+            max_workers: Number of worker processes for parallel loading.
+                         Defaults to the number of CPUs.
+
         Returns:
             List of successfully loaded Lesson objects
         """
-        lessons = []
-        for filename in self.get_available_lesson_files():
-            lesson = self.load_lesson(filename)
-            if lesson is not None:
-                lessons.append(lesson)
+        with self._lock:
+            filenames = self.get_available_lesson_files()
+            self.load_report = []
+            failed = self._load_parallel(filenames, max_workers) if parallel else set()
+
+            lessons = []
+            for filename in filenames:
+                if filename in failed:
+                    continue
+                if filename in self._lesson_cache:
+                    lesson = self._lesson_cache[filename]
+                else:
+                    start = time.perf_counter()
+                    lesson = self.load_lesson(filename)
+                    self.load_report.append({
+                        'filename': filename,
+                        'ms': (time.perf_counter() - start) * 1000.0,
+                        'error': None if lesson is not None else 'failed to load, see log',
+                    })
+                if lesson is not None:
+                    lessons.append(lesson)
+
+            return lessons
+
+    def _load_parallel(self, filenames: List[str], max_workers: Optional[int] = None) -> Set[str]:
+        """
+        Read the lesson files that aren't cached in a process pool and merge
+        the results into the cache. Lessons are plain dataclasses, so they
+        come back from the workers pickled.
+
+        Files that fail in a worker are reported in load_report and left
+        uncached. Files whose result can't be sent back (e.g. a lesson whose
+        metadata doesn't pickle) are left for load_all_lessons() to load in
+        this process.
 
-        return lessons
+        Returns:
+            Filenames that failed to load in a worker
+        """
+        failed = set()
+        pending = {}
+        for filename in filenames:
+            if filename in self._lesson_cache:
+                continue
+            # A file that is gone since it was listed is left to load_lesson(),
+            # which reports it
+            file_path = find_lesson_file(self.lessons_dir, filename)
+            if file_path is None:
+                continue
+            try:
+                pending[filename] = (file_path, file_path.stat())
+            except OSError:
+                continue
+        if not pending:
+            return failed
+
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                filename: pool.submit(_read_lesson_timed, str(file_path))
+                for filename, (file_path, _) in pending.items()
+            }
+            for filename, future in futures.items():
+                try:
+                    lesson, error, ms = future.result()
+                except Exception as e:
+                    print(f"Warning: Could not load lesson '{filename}' in a worker "
+                          f"process ({e}), loading it here")
+                    continue
+
+                self.load_report.append({'filename': filename, 'ms': ms, 'error': error})
+                if lesson is None:
+                    print(f"Error loading lesson '{filename}': {error}")
+                    failed.add(filename)
+                    continue
+                st = pending[filename][1]
+                self._lesson_cache[filename] = lesson
+                self._cache_stats[filename] = (st.st_size, st.st_mtime_ns)
+                print(f"Successfully loaded lesson: {lesson.name}")
+        return failed
+
+    def print_load_report(self, limit: Optional[int] = None):
+        """
+        Print the per-file load times and errors of the last load_all_lessons(),
+        slowest first.
+
+        Args:
+            limit: Only list this many of the slowest files
+        """
+        report = sorted(self.load_report, key=lambda entry: entry['ms'], reverse=True)
+        print(f"{'lesson':<32}{'ms':>10}  error")
+        for entry in report[:limit]:
+            print(f"{entry['filename']:<32}{entry['ms']:>10.1f}  {entry['error'] or ''}")
+        total = sum(entry['ms'] for entry in report)
+        errors = sum(1 for entry in report if entry['error'])
+        print(f"{len(report)} file(s) loaded in {total:.1f} ms of load time, {errors} error(s)")
 
     def reload_lesson(self, filename: str) -> Optional[Lesson]:
         """
@@ -140,48 +313,100 @@ class LessonLoader:
         Useful for development when lesson files are being edited.
 
         Args:
-            filename: Lesson filename (with or without .py extension)
+            filename: Lesson filename (with or without extension)
 
         Returns:
             Lesson object if successful, None if loading failed
         """
-        # Remove .py extension if present
-        if filename.endswith('.py'):
-            filename = filename[:-3]
+        with self._lock:
+            filename = strip_lesson_extension(filename)
+
+            # Clear from cache
+            if filename in self._lesson_cache:
+                del self._lesson_cache[filename]
+            self._cache_stats.pop(filename, None)
 
-        # Clear from cache
-        if filename in self._lesson_cache:
-            del self._lesson_cache[filename]
+            # Reload
+            return self.load_lesson(filename)
 
-        # Reload
-        return self.load_lesson(filename)
+    def is_cached(self, filename: str) -> bool:
+        """
+        Check if a lesson has been loaded and is held in the cache.
+
+        Args:
+            filename: Lesson filename (with or without extension)
+        """
+        with self._lock:
+            return strip_lesson_extension(filename) in self._lesson_cache
 
     def clear_cache(self):
         """Clear the lesson cache, forcing reload on next access."""
-        self._lesson_cache.clear()
+        with self._lock:
+            self._lesson_cache.clear()
+            self._cache_stats.clear()
 
-    def get_lesson_info(self, filename: str) -> Optional[Dict[str, any]]:
+    def lesson_for_index(self, filename: str, size: int, mtime_ns: int) -> Optional[Lesson]:
         """
-        Get basic information about a lesson without fully loading it.
+        Load a lesson for the metadata index. A cached lesson is returned as
+        is if it was executed from the file as it is now. A stale one is
+        re-read, and only replaced once the file loads, so the Lesson the
+        player has open isn't dropped by listing.
 
         Args:
-            filename: Lesson filename (with or without .py extension)
+            filename: Lesson filename without extension
+            size: Current file size in bytes
+            mtime_ns: Current file mtime in ns
 
         Returns:
-            Dict with lesson info (name, description, part_count) or None
+            Lesson object if successful, None if loading failed
         """
-        lesson = self.load_lesson(filename)
-        if lesson is None:
-            return None
+        with self._lock:
+            if self._cache_stats.get(filename) == (size, mtime_ns):
+                return self._lesson_cache[filename]
+            return self._read_into_cache(filename)
 
-        return {
-            'filename': filename,
-            'name': lesson.name,
-            'description': lesson.description,
-            'author': lesson.author,
-            'part_count': lesson.get_part_count(),
-            'total_duration_ms': lesson.get_total_duration_ms(),
-        }
+    def list_lessons(self) -> List[Dict[str, Any]]:
+        """
+        Get the info of every available lesson from the metadata index.
+
+        Only lesson files that are new or changed since the index was
+        written are executed; everything else is a single index read.
+
+        Returns:
+            List of get_lesson_info() dicts, sorted by filename. Lessons that
+            fail to load are left out.
+        """
+        with self._lock:
+            return list(self.index.refresh(self.lesson_for_index).values())
+
+    def rebuild_index(self):
+        """
+        Re-execute every lesson and rewrite the metadata index, e.g. after
+        a shared module that lessons import from has changed.
+        """
+        with self._lock:
+            self.index.clear()
+            self.clear_cache()
+            self.index.refresh(self.lesson_for_index)
+
+    def get_lesson_info(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Get basic information about a lesson without fully loading it.
+
+        The info comes from the metadata index; the lesson module is only
+        executed if the file is new or changed since it was indexed.
+
+        Args:
+            filename: Lesson filename (with or without extension)
+
+        Returns:
+            Dict with lesson info (filename, name, description, author,
+            part_count, total_duration_ms, part_names, instrument, use_sharp
+            and metadata) or None
+        """
+        with self._lock:
+            filename = strip_lesson_extension(filename)
+            return self.index.info(filename, self.lesson_for_index)
 
 
 # Global loader instance for convenience
@@ -213,6 +438,11 @@ def load_lesson(filename: str) -> Optional[Lesson]:
     return get_default_loader().load_lesson(filename)
 
 
-def load_all_lessons() -> List[Lesson]:
-    """Load all available lessons."""
-    return get_default_loader().load_all_lessons()
+def load_all_lessons(parallel: bool = False) -> List[Lesson]:
+    """Load all available lessons, optionally in a process pool."""
+    return get_default_loader().load_all_lessons(parallel)
+
+
+def list_lessons() -> List[Dict[str, Any]]:
+    """Get the info of every available lesson from the metadata index."""
+    return get_default_loader().list_lessons()
@@ -5,6 +5,7 @@ A Lesson consists of multiple Parts. Each Part represents a single scale,
 riff section, or exercise that can be played independently.
 """
 
+import hashlib
 from dataclasses import dataclass, field
 from typing import List, Tuple, Dict, Any, Union
 
@@ -24,10 +25,14 @@ class Part:
         play_sequence: The actual sequence of notes to play. Format:
                       - Single notes: [[('A', 3), 500], [('A', 5), 500], ...]
                       - Chords: [[('e', 0), ('B', 1), ('G', 0), 1000], ...]
+                      - Bends: [[('G', 7, 2), 1000], ...] picks G7 and bends it
+                        up by 2 halftones (1 or 2), then releases it
                       Last element in each sublist is duration in milliseconds
         highlight_classes: Optional dict mapping note names to CSS classes
                           e.g., {'C': 'highlight1', 'E': 'highlight2'}
         description: Optional string describing this part
+        instrument: Optional instrument bank to play this part with
+                   (e.g. 'distortion'). Empty uses the lesson's instrument.
 
     Examples:
         >>> # Single note sequence
@@ -49,6 +54,7 @@ class Part:
     play_sequence: List[Union[List, Tuple]]
     highlight_classes: Dict[str, str] = field(default_factory=dict)
     description: str = ""
+    instrument: str = ""
 
     def __post_init__(self):
         """Validate the part data."""
@@ -75,6 +81,28 @@ class Part:
                     f"Must be integer between 0 and 24"
                 )
 
+        # Validate the notes of each step: (string, fret) or a bend
+        # (string, fret, halftones) on a note shown on the fretboard
+        highlighted = {tuple(note) for note in self.notes_to_highlight}
+        for step in self.play_sequence:
+            for item in step[:-1]:
+                if not isinstance(item, tuple) or len(item) not in (2, 3):
+                    raise ValueError(
+                        f"Invalid note {item!r} in part '{self.name}'. "
+                        f"Must be (string, fret) or (string, fret, halftones)"
+                    )
+                if len(item) == 3:
+                    if item[2] not in (1, 2):
+                        raise ValueError(
+                            f"Invalid bend {item} in part '{self.name}'. "
+                            f"Halftones must be 1 or 2"
+                        )
+                    if item[:2] not in highlighted:
+                        raise ValueError(
+                            f"Bend {item} in part '{self.name}' must be on a note "
+                            f"in notes_to_highlight"
+                        )
+
     def get_duration_ms(self) -> int:
         """
         Calculate total duration of this part in milliseconds.
@@ -97,6 +125,31 @@ class Part:
         """
         return len(self.play_sequence)
 
+    def content_hash(self) -> str:
+        """
+        Hash of everything that is displayed or played for this part.
+
+        Lists and tuples hash the same, so a part built from a Python
+        lesson and the same part from a TOML lesson are equal.
+
+        Returns:
+            Hex digest that changes whenever the part's content changes
+        """
+        def freeze(value):
+            if isinstance(value, (list, tuple)):
+                return tuple(freeze(item) for item in value)
+            return value
+
+        content = (
+            self.name,
+            freeze(self.notes_to_highlight),
+            freeze(self.play_sequence),
+            tuple(sorted(self.highlight_classes.items())),
+            self.description,
+            self.instrument,
+        )
+        return hashlib.sha1(repr(content).encode('utf-8')).hexdigest()
+
 
 @dataclass
 class Lesson:
@@ -115,6 +168,9 @@ class Lesson:
                    If False, display notes with flat notation (Db, Eb, etc.)
                    Defaults to True for backward compatibility
                    TODO: Future enhancement - allow per-Part override
+        instrument: Optional instrument bank for all parts (e.g. 'clean',
+                    'distortion'). Empty uses the audio engine's default.
+                    Parts can override it with Part.instrument.
         metadata: Optional dict for additional info (tags, difficulty, etc.)
 
     Example:
@@ -131,6 +187,7 @@ class Lesson:
     description: str = ""
     author: str = ""
     use_sharp: bool = True  # Default to sharp notation for backward compatibility
+    instrument: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
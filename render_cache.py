@@ -0,0 +1,225 @@
+"""
+Persistent on-disk cache of rendered part timelines.
+
+A rendered part is a single int16 timeline (all steps mixed, fitted to
+their durations and put back to back) plus the sample offset at which each
+step ends. Both arrays are stored as .npy files under
+ConfigManager.get_configdir()/cache and are loaded memory-mapped, so
+reopening a lesson after a restart costs a file map instead of a re-mix.
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import numpy as np
+from settings import ConfigManager
+
+CACHE_SUBDIR = 'cache'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+STEPS_SUFFIX = '_steps.npy'
+# Bump when rendering changes, so timelines rendered the old way aren't reused
+RENDER_VERSION = 3
+
+
+class RenderCache:
+    """
+    Size-capped store of rendered timelines with LRU eviction by atime.
+
+    Each entry is a pair of files named after its key:
+        <key>.npy        int16 timeline
+        <key>_steps.npy  int64 sample offsets where each step ends
+
+    Access times are bumped explicitly on every hit, so eviction order is
+    correct even on filesystems mounted with noatime/relatime.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory holding the cache files. Defaults to
+                       ConfigManager.get_configdir()/cache
+            max_bytes: Total size cap in bytes. Oldest entries are evicted
+                       once a store pushes the cache over this limit.
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(ConfigManager.get_configdir(), CACHE_SUBDIR)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(play_sequence, tuning, strum_delay_ms, speed, samplerate, pack_fingerprint,
+                 pack_id=''):
+        """
+        Build the cache key for a rendered part.
+
+        Args:
+            play_sequence: Part.play_sequence
+            tuning: Dict mapping string name to open-string MIDI note
+            strum_delay_ms: Strum delay between notes of a chord
+            speed: Playback speed factor
+            samplerate: Output sample rate the part is rendered at
+            pack_fingerprint: Fingerprint of the sample pack used for mixing
+            pack_id: Optional SamplePack.pack_id. When given, the key is
+                     prefixed with the pack id and fingerprint so that
+                     drop_stale() can find entries built from old samples.
+
+        Returns:
+            Key string identifying the rendered output
+        """
+        payload = json.dumps({
+            'play_sequence': play_sequence,
+            'tuning': tuning,
+            'strum_delay_ms': strum_delay_ms,
+            'speed': speed,
+            'samplerate': samplerate,
+            'pack': pack_fingerprint,
+            'version': RENDER_VERSION,
+        }, sort_keys=True, separators=(',', ':'))
+        digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+        if pack_id:
+            return f"{pack_id}-{pack_fingerprint[:16]}-{digest}"
+        return digest
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return base + '.npy', base + STEPS_SUFFIX
+
+    def load(self, key):
+        """
+        Map a cached timeline into memory.
+
+        Args:
+            key: Key returned by make_key()
+
+        Returns:
+            Tuple (timeline, step_ends) of read-only memory-mapped arrays,
+            or None on a cache miss
+        """
+        timeline_path, steps_path = self._paths(key)
+        try:
+            timeline = np.load(timeline_path, mmap_mode='r')
+            step_ends = np.load(steps_path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+
+        now = time.time()
+        for path in (timeline_path, steps_path):
+            try:
+                os.utime(path, (now, os.stat(path).st_mtime))
+            except OSError:
+                pass
+        return timeline, step_ends
+
+    def store(self, key, timeline, step_ends):
+        """
+        Write a rendered timeline to the cache and enforce the size cap.
+
+        Files are written to a temporary name first and renamed into place,
+        so a crash mid-write never leaves a truncated entry behind.
+
+        Args:
+            key: Key returned by make_key()
+            timeline: 1-D int16 array of the mixed part
+            step_ends: 1-D integer array of sample offsets where each step ends
+        """
+        timeline_path, steps_path = self._paths(key)
+        try:
+            self._atomic_save(steps_path, np.asarray(step_ends, dtype=np.int64))
+            self._atomic_save(timeline_path, np.asarray(timeline))
+        except OSError as e:
+            print(f"Warning: Could not write render cache entry {key}: {e}")
+            return
+        self.evict()
+
+    def _atomic_save(self, path, array):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _entries(self):
+        """
+        Group cache files by key.
+
+        Returns:
+            Dict mapping key to (last_access_time, total_bytes, [paths])
+        """
+        entries = {}
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.is_file() or not entry.name.endswith('.npy'):
+                    continue
+                if entry.name.endswith(STEPS_SUFFIX):
+                    key = entry.name[:-len(STEPS_SUFFIX)]
+                else:
+                    key = entry.name[:-len('.npy')]
+                st = entry.stat()
+                atime, size, paths = entries.get(key, (0.0, 0, []))
+                paths.append(entry.path)
+                entries[key] = (max(atime, st.st_atime), size + st.st_size, paths)
+        return entries
+
+    def size_bytes(self):
+        """Total size of all cache entries in bytes."""
+        return sum(size for _, size, _ in self._entries().values())
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries.values())
+        if total <= self.max_bytes:
+            return
+
+        for key, (atime, size, paths) in sorted(entries.items(), key=lambda kv: kv[1][0]):
+            if total <= self.max_bytes:
+                break
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            print(f"Render cache: evicted {key} ({size} bytes)")
+
+    def drop_stale(self, pack_id, pack_fingerprint):
+        """
+        Remove entries rendered from an older version of a sample pack.
+
+        Args:
+            pack_id: SamplePack.pack_id
+            pack_fingerprint: Current fingerprint of that pack
+
+        Returns:
+            Number of entries removed
+        """
+        prefix = f"{pack_id}-"
+        current = f"{pack_id}-{pack_fingerprint[:16]}-"
+        removed = 0
+        for key, (_, _, paths) in self._entries().items():
+            if key.startswith(prefix) and not key.startswith(current):
+                for path in paths:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                removed += 1
+        if removed:
+            print(f"Render cache: dropped {removed} entries for changed pack {pack_id}")
+        return removed
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        for _, _, paths in self._entries().values():
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
@@ -0,0 +1,360 @@
+"""
+Lazy access to the note samples of a sample pack.
+
+Notes are mapped on first use instead of being read eagerly at startup, so
+a lesson that only uses 8 of the 49 samples only pays for those 8. The notes
+of the current lesson can be warmed in a background thread, and every first
+touch is timed so the warm-up policy can be tuned from real numbers.
+
+Several banks (clean, distortion, ...) can be registered at once in
+InstrumentBanks. They share one MemoryBudget, which evicts the least
+recently used notes across all banks when the budget is exceeded.
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from sample_pack import CompressedPack, open_pack
+
+# Touch one element per page when faulting in a memory-mapped sample
+PAGE_SIZE = 4096
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024  # 64 MB shared by all banks
+
+
+class MemoryBudget:
+    """
+    Byte budget shared by several SampleBanks with LRU eviction across banks.
+
+    Banks report every loaded note with add() and every hit with touch().
+    When the total exceeds max_bytes, the least recently used notes of any
+    bank are evicted, except the note that was just added.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_BUDGET_BYTES):
+        self.max_bytes = max_bytes
+        self._lru = OrderedDict()  # (bank, midi) -> nbytes
+        self._used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def used_bytes(self):
+        return self._used
+
+    def touch(self, bank, midi_note):
+        with self._lock:
+            key = (bank, midi_note)
+            if key in self._lru:
+                self._lru.move_to_end(key)
+
+    def add(self, bank, midi_note, nbytes):
+        evicted = []
+        with self._lock:
+            key = (bank, midi_note)
+            self._used -= self._lru.pop(key, 0)
+            self._lru[key] = nbytes
+            self._used += nbytes
+            while self._used > self.max_bytes and len(self._lru) > 1:
+                old_key, old_bytes = self._lru.popitem(last=False)
+                if old_key == key:
+                    # Never evict the note being added; keep it most recent
+                    self._lru[key] = old_bytes
+                    continue
+                self._used -= old_bytes
+                evicted.append(old_key)
+        for old_bank, old_note in evicted:
+            old_bank._evict(old_note)
+
+    def remove(self, bank, midi_note):
+        with self._lock:
+            self._used -= self._lru.pop((bank, midi_note), 0)
+
+
+class SampleBank:
+    """
+    Per-note sample cache on top of a SamplePack.
+
+    Example:
+        >>> bank = SampleBank(SamplePack('clean'))
+        >>> bank.warm([52, 55, 59])      # background thread
+        >>> data = bank.get(52)          # int16 array, mapped on first use
+        >>> bank.latency_stats()['mean_ms']
+    """
+
+    def __init__(self, pack, mmap=True, budget=None, name=''):
+        """
+        Args:
+            pack: SamplePack or CompressedPack providing the samples
+            mmap: If True, samples are memory-mapped with wavfile.read(mmap=True)
+                  and their pages faulted in on first touch. Falls back to a
+                  normal read for formats that can't be mapped (e.g. 24-bit).
+                  Ignored for compressed packs, which always decode to memory.
+            budget: Optional MemoryBudget shared with other banks
+            name: Bank name, used in log messages
+        """
+        self.pack = pack
+        self.mmap = mmap
+        self.budget = budget
+        self.name = name
+        self._samples = {}  # midi -> numpy array
+        self._first_touch = {}  # midi -> (latency_ms, source)
+        self._pending = {}  # midi -> threading.Event while a load is in flight
+        self._lock = threading.Lock()
+        self._warm_thread = None
+        self._warm_cancel = threading.Event()
+
+    def get(self, midi_note):
+        """
+        Get the samples for a MIDI note, loading them on first use.
+
+        Args:
+            midi_note: MIDI note number
+
+        Returns:
+            numpy array of audio samples
+
+        Raises:
+            OSError, ValueError: If the sample can't be read
+        """
+        data = self._samples.get(midi_note)
+        if data is not None:
+            if self.budget is not None:
+                self.budget.touch(self, midi_note)
+            return data
+        return self._load(midi_note, source='demand')
+
+    def _load(self, midi_note, source):
+        # Only one thread loads a given note; others wait for its result
+        with self._lock:
+            data = self._samples.get(midi_note)
+            if data is not None:
+                return data
+            pending = self._pending.get(midi_note)
+            if pending is None:
+                pending = self._pending[midi_note] = threading.Event()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            pending.wait()
+            data = self._samples.get(midi_note)
+            if data is None:
+                raise OSError(f"Sample {midi_note} failed to load in another thread")
+            return data
+
+        try:
+            start = time.perf_counter()
+            try:
+                data = self.pack.read(midi_note, mmap=self.mmap)
+            except ValueError:
+                if not self.mmap:
+                    raise
+                # Container size can't be memory-mapped; read it normally
+                data = self.pack.read(midi_note)
+            if isinstance(data, np.memmap):
+                self._fault_in(data)
+            latency_ms = (time.perf_counter() - start) * 1000.0
+
+            with self._lock:
+                self._samples[midi_note] = data
+                self._first_touch[midi_note] = (latency_ms, source)
+            if self.budget is not None:
+                self.budget.add(self, midi_note, data.nbytes)
+            return data
+        finally:
+            with self._lock:
+                del self._pending[midi_note]
+            pending.set()
+
+    @staticmethod
+    def _fault_in(data):
+        """Read one element per page so later mixing doesn't page-fault."""
+        step = max(1, PAGE_SIZE // data.itemsize)
+        np.add.reduce(data.reshape(-1)[::step], dtype=np.int64)
+
+    def is_loaded(self, midi_note):
+        return midi_note in self._samples
+
+    def warm(self, midi_notes, background=True, max_workers=None):
+        """
+        Load a set of notes ahead of use.
+
+        Args:
+            midi_notes: Iterable of MIDI note numbers
+            background: If True, load in a daemon thread and return immediately
+            max_workers: Number of notes loaded in parallel. Defaults to one
+                         per CPU for compressed packs, whose decoders release
+                         the GIL, and to 1 for folder packs, which are only
+                         mapped.
+
+        Returns:
+            The warm-up thread if background is True, otherwise None
+        """
+        notes = [n for n in dict.fromkeys(midi_notes) if n not in self._samples]
+        if not notes:
+            return None
+        self._warm_cancel.clear()
+        if max_workers is None:
+            max_workers = (os.cpu_count() or 1) if isinstance(self.pack, CompressedPack) else 1
+        max_workers = min(max_workers, len(notes))
+
+        def load(note):
+            if self._warm_cancel.is_set():
+                return
+            try:
+                self._load(note, source='warm')
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: Could not warm sample {note}: {e}")
+
+        def run():
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    list(pool.map(load, notes))
+            else:
+                for note in notes:
+                    load(note)
+
+        if not background:
+            run()
+            return None
+
+        self._warm_thread = threading.Thread(target=run, name='SampleBankWarm', daemon=True)
+        self._warm_thread.start()
+        return self._warm_thread
+
+    def stop_warm(self):
+        """Stop a background warm-up after the note it is loading and wait for it."""
+        thread = self._warm_thread
+        if thread is None:
+            return
+        self._warm_cancel.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        self._warm_thread = None
+
+    def latency_stats(self):
+        """
+        First-touch latency of every loaded note.
+
+        Returns:
+            Dict with 'count', 'mean_ms', 'max_ms', 'demand_count' (notes first
+            touched on the playback path rather than by warm()) and 'per_note',
+            mapping MIDI note to {'latency_ms', 'source'}
+        """
+        per_note = {
+            note: {'latency_ms': latency, 'source': source}
+            for note, (latency, source) in sorted(self._first_touch.items())
+        }
+        latencies = [latency for latency, _ in self._first_touch.values()]
+        return {
+            'count': len(latencies),
+            'mean_ms': float(np.mean(latencies)) if latencies else 0.0,
+            'max_ms': max(latencies) if latencies else 0.0,
+            'demand_count': sum(1 for _, source in self._first_touch.values() if source == 'demand'),
+            'per_note': per_note,
+        }
+
+    def loaded_bytes(self):
+        """Total size of the loaded samples in bytes."""
+        return sum(data.nbytes for data in list(self._samples.values()))
+
+    def _evict(self, midi_note):
+        """Drop one note; called by the MemoryBudget."""
+        with self._lock:
+            self._samples.pop(midi_note, None)
+
+    def clear(self):
+        """
+        Drop all loaded samples, e.g. after the pack fingerprint changed.
+
+        A running warm-up is stopped first, so it can't put samples of the
+        old pack back into the bank.
+        """
+        self.stop_warm()
+        with self._lock:
+            notes = list(self._samples)
+            self._samples.clear()
+            self._first_touch.clear()
+        if self.budget is not None:
+            for note in notes:
+                self.budget.remove(self, note)
+
+
+class InstrumentBanks:
+    """
+    Named sample banks registered side by side under one memory budget.
+
+    Example:
+        >>> banks = InstrumentBanks()
+        >>> banks.register('clean', 'clean')
+        >>> banks.register('distortion', 'distortion', prefix='note_')
+        >>> bank = banks.switch('distortion', prefetch_notes=[52, 55, 59])
+    """
+
+    def __init__(self, max_bytes=DEFAULT_BUDGET_BYTES):
+        """
+        Args:
+            max_bytes: Memory budget in bytes shared by all registered banks
+        """
+        self.budget = MemoryBudget(max_bytes)
+        self._banks = {}
+        self.active_name = None
+
+    def register(self, name, path, prefix='clean_', mmap=True, index_dir=None):
+        """
+        Register a sample pack as a named bank. Nothing is loaded yet.
+
+        Args:
+            name: Instrument name, e.g. 'clean' or 'distortion'
+            path: Sample folder or .llpack file
+            prefix: Filename prefix of the samples in a folder pack
+            mmap: See SampleBank
+            index_dir: Directory for the pack index, see open_pack()
+
+        Returns:
+            The new SampleBank
+        """
+        pack = open_pack(path, index_dir=index_dir, prefix=prefix)
+        bank = SampleBank(pack, mmap=mmap, budget=self.budget, name=name)
+        self._banks[name] = bank
+        if self.active_name is None:
+            self.active_name = name
+        return bank
+
+    def names(self):
+        return list(self._banks)
+
+    def get(self, name):
+        """
+        Raises:
+            KeyError: If no bank is registered under that name
+        """
+        return self._banks[name]
+
+    @property
+    def active(self):
+        return self._banks[self.active_name]
+
+    def switch(self, name, prefetch_notes=(), max_workers=None):
+        """
+        Make a bank active and start prefetching its notes in the background.
+
+        Args:
+            name: Registered instrument name
+            prefetch_notes: MIDI notes to load ahead of use
+            max_workers: See SampleBank.warm
+
+        Returns:
+            The active SampleBank
+
+        Raises:
+            KeyError: If no bank is registered under that name
+        """
+        bank = self._banks[name]
+        self.active_name = name
+        bank.warm(prefetch_notes, background=True, max_workers=max_workers)
+        return bank
@@ -0,0 +1,423 @@
+"""
+Sample pack indexing, fingerprinting and compressed packs.
+
+A sample pack is a folder of per-note WAV files named <prefix><midi>.wav,
+e.g. clean/clean_52.wav. The pack index records the size, mtime and format
+(read header-only with wavfile.info) of every sample, plus an optional
+content hash, and a fingerprint derived from them.
+Any cache built from the samples (rendered timelines, resampled notes, ...)
+includes the fingerprint in its key, so re-running utils/truncate_notes.py
+invalidates those caches automatically.
+
+CompressedPack stores the same samples losslessly in a single .llpack file
+for smaller app bundles; open_pack() picks the right class for a path.
+"""
+
+import os
+import re
+import json
+import lzma
+import zlib
+import struct
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import wavfile
+from settings import ConfigManager
+
+PACK_INDEX_SUBDIR = os.path.join('cache', 'packs')
+PACK_EXTENSION = '.llpack'
+PACK_MAGIC = b'LLFPACK1'
+
+
+def _pack_id(path):
+    """Stable identifier for a pack at path, safe to use in filenames."""
+    name = re.sub(r'[^A-Za-z0-9_]', '_', os.path.basename(path)) or 'pack'
+    digest = hashlib.sha1(path.encode('utf-8')).hexdigest()[:8]
+    return f"{name}_{digest}"
+
+
+class SamplePack:
+    """
+    Index of the note samples in one folder.
+
+    Example:
+        >>> pack = SamplePack('clean')
+        >>> fingerprint = pack.scan()
+        >>> pack.path_for(52)
+        '/.../clean/clean_52.wav'
+    """
+
+    def __init__(self, folder, prefix='clean_', content_hash=False, index_dir=None):
+        """
+        Args:
+            folder: Folder containing the sample files
+            prefix: Filename prefix before the MIDI number
+            content_hash: If True, include a SHA-1 of each file's bytes in the
+                          fingerprint. Hashes are stored in the index and only
+                          recomputed for files whose size or mtime changed.
+            index_dir: Directory for the persisted pack index. Defaults to
+                       ConfigManager.get_configdir()/cache/packs
+        """
+        self.folder = os.path.abspath(folder)
+        self.prefix = prefix
+        self.content_hash = content_hash
+        if index_dir is None:
+            index_dir = os.path.join(ConfigManager.get_configdir(), PACK_INDEX_SUBDIR)
+        self.index_dir = index_dir
+
+        self._name_re = re.compile(re.escape(prefix) + r'(\d+)\.wav$')
+        self.files = {}  # filename -> {'midi', 'size', 'mtime_ns', 'rate', 'channels', 'frames'[, 'sha1']}
+        self.fingerprint = None
+        self.previous_fingerprint = None
+
+    @property
+    def pack_id(self):
+        """Stable identifier for this pack, safe to use in filenames."""
+        return _pack_id(self.folder)
+
+    @property
+    def index_path(self):
+        return os.path.join(self.index_dir, f"{self.pack_id}.json")
+
+    @property
+    def changed(self):
+        """True if the last scan() produced a different fingerprint than the stored index."""
+        return self.fingerprint != self.previous_fingerprint
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self):
+        index = {
+            'folder': self.folder,
+            'prefix': self.prefix,
+            'fingerprint': self.fingerprint,
+            'files': self.files,
+        }
+        try:
+            os.makedirs(self.index_dir, exist_ok=True)
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Warning: Could not write pack index {self.index_path}: {e}")
+
+    @staticmethod
+    def _hash_file(path):
+        h = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        return h.hexdigest()
+
+    @staticmethod
+    def _read_format(path):
+        try:
+            wav = wavfile.info(path)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read header of {path}: {e}")
+            return {'rate': None, 'channels': None, 'frames': None}
+        return {'rate': wav.rate, 'channels': wav.channels, 'frames': wav.frames}
+
+    def scan(self):
+        """
+        Stat every sample with os.scandir and recompute the fingerprint.
+
+        The format of new or modified files is read from their headers with
+        wavfile.info; unchanged files reuse the stored values. The index is
+        only rewritten when something in it changed.
+
+        Returns:
+            Hex digest fingerprint of the pack
+        """
+        stored = self._read_index()
+        stored_files = stored.get('files', {})
+        self.previous_fingerprint = stored.get('fingerprint')
+
+        files = {}
+        try:
+            with os.scandir(self.folder) as it:
+                for entry in it:
+                    match = self._name_re.match(entry.name)
+                    if not match or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    info = {
+                        'midi': int(match.group(1)),
+                        'size': st.st_size,
+                        'mtime_ns': st.st_mtime_ns,
+                    }
+                    old = stored_files.get(entry.name, {})
+                    unchanged = (old.get('size') == info['size']
+                                 and old.get('mtime_ns') == info['mtime_ns'])
+                    if unchanged and 'frames' in old:
+                        info.update((k, old[k]) for k in ('rate', 'channels', 'frames'))
+                    else:
+                        info.update(self._read_format(entry.path))
+                    if self.content_hash:
+                        if unchanged and old.get('sha1'):
+                            info['sha1'] = old['sha1']
+                        else:
+                            info['sha1'] = self._hash_file(entry.path)
+                    files[entry.name] = info
+        except OSError as e:
+            print(f"Warning: Could not scan sample pack '{self.folder}': {e}")
+
+        h = hashlib.sha1(self.folder.encode('utf-8'))
+        for name in sorted(files):
+            info = files[name]
+            h.update(f"{name}:{info['size']}:{info['mtime_ns']}:{info.get('sha1', '')};".encode('utf-8'))
+
+        self.files = files
+        self.fingerprint = h.hexdigest()
+        if self.changed or files != stored_files:
+            self._write_index()
+        return self.fingerprint
+
+    def path_for(self, midi_note):
+        """
+        Get the path of the sample for a MIDI note.
+
+        Args:
+            midi_note: MIDI note number
+
+        Returns:
+            Absolute path of the sample file (which may not exist)
+        """
+        return os.path.join(self.folder, f"{self.prefix}{midi_note}.wav")
+
+    def notes(self):
+        """Sorted list of MIDI notes found by the last scan()."""
+        return sorted(info['midi'] for info in self.files.values())
+
+    def duration_ms(self, midi_note):
+        """
+        Length of a note's sample from the pack index, without reading it.
+
+        Returns:
+            Duration in milliseconds, or None if the note was not indexed
+        """
+        info = self.files.get(os.path.basename(self.path_for(midi_note)))
+        if not info or not info.get('rate'):
+            return None
+        return info['frames'] * 1000.0 / info['rate']
+
+    def read(self, midi_note, mmap=False):
+        """
+        Read the samples of one note.
+
+        Args:
+            midi_note: MIDI note number
+            mmap: If True, memory-map the data (see wavfile.read)
+
+        Returns:
+            numpy array of audio samples
+        """
+        _, data = wavfile.read(self.path_for(midi_note), mmap=mmap)
+        return data
+
+
+class CompressedPack:
+    """
+    Lossless single-file sample pack for smaller app bundles.
+
+    Each note is stored as delta-coded int16 samples whose low and high bytes
+    are split into separate planes before zlib or LZMA compression. Decoding
+    is plain numpy (frombuffer + cumsum) after decompression, and both zlib
+    and lzma release the GIL, so notes decode in parallel in a thread pool.
+
+    File layout:
+        PACK_MAGIC | uint32 header length | JSON header | note blobs
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Path of the .llpack file
+        """
+        self.path = os.path.abspath(path)
+        self.folder = self.path
+        self.header = None
+        self.fingerprint = None
+        self.previous_fingerprint = None
+        self._data_start = 0
+
+    @property
+    def pack_id(self):
+        """Stable identifier for this pack, safe to use in filenames."""
+        return _pack_id(self.path)
+
+    @property
+    def changed(self):
+        return self.fingerprint != self.previous_fingerprint
+
+    def scan(self):
+        """
+        Read the pack header and fingerprint the file.
+
+        A missing or unreadable pack file leaves the pack empty with a
+        warning, as SamplePack does for a missing folder.
+
+        Returns:
+            Hex digest fingerprint of the pack
+        """
+        self.previous_fingerprint = self.fingerprint
+        h = hashlib.sha1(self.path.encode('utf-8'))
+        try:
+            st = os.stat(self.path)
+            with open(self.path, 'rb') as f:
+                magic = f.read(len(PACK_MAGIC))
+                if magic != PACK_MAGIC:
+                    raise ValueError("not a compressed sample pack")
+                header_len = struct.unpack('<I', f.read(4))[0]
+                self.header = json.loads(f.read(header_len).decode('utf-8'))
+            self._data_start = len(PACK_MAGIC) + 4 + header_len
+            h.update(f"{st.st_size}:{st.st_mtime_ns}:{self.header.get('source_fingerprint', '')}".encode('utf-8'))
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Warning: Could not read sample pack '{self.path}': {e}")
+            self.header = {'codec': None, 'notes': {}}
+            self._data_start = 0
+        self.fingerprint = h.hexdigest()
+        return self.fingerprint
+
+    def _ensure_header(self):
+        if self.header is None:
+            self.scan()
+
+    def notes(self):
+        self._ensure_header()
+        return sorted(int(n) for n in self.header['notes'])
+
+    def path_for(self, midi_note):
+        return f"{self.path}#{midi_note}"
+
+    def read(self, midi_note, mmap=False):
+        """
+        Decode the samples of one note.
+
+        Args:
+            midi_note: MIDI note number
+            mmap: Ignored; compressed notes are always decoded into memory
+
+        Returns:
+            int16 numpy array of audio samples
+
+        Raises:
+            KeyError: If the note is not in the pack
+        """
+        self._ensure_header()
+        entry = self.header['notes'][str(midi_note)]
+        with open(self.path, 'rb') as f:
+            f.seek(self._data_start + entry['offset'])
+            blob = f.read(entry['length'])
+        return _decode_note(blob, self.header['codec'], entry['frames'])
+
+    def decode_all(self, max_workers=None):
+        """
+        Decode every note in a thread pool.
+
+        Args:
+            max_workers: Thread pool size (default: ThreadPoolExecutor's default)
+
+        Returns:
+            Dict mapping MIDI note to int16 numpy array
+        """
+        notes = self.notes()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(zip(notes, pool.map(self.read, notes)))
+
+
+def _encode_note(data, codec, level):
+    data = np.ascontiguousarray(data, dtype='<i2')
+    delta = np.empty_like(data)
+    delta[:1] = data[:1]
+    np.subtract(data[1:], data[:-1], out=delta[1:])  # wraps modulo 2**16
+    planes = delta.view(np.uint8).reshape(-1, 2).T.tobytes()
+    if codec == 'zlib':
+        return zlib.compress(planes, level)
+    elif codec == 'lzma':
+        return lzma.compress(planes, preset=level)
+    raise ValueError(f"Unknown pack codec '{codec}'. Supported: zlib, lzma")
+
+
+def _decode_note(blob, codec, frames):
+    if codec == 'zlib':
+        planes = zlib.decompress(blob)
+    elif codec == 'lzma':
+        planes = lzma.decompress(blob)
+    else:
+        raise ValueError(f"Unknown pack codec '{codec}'. Supported: zlib, lzma")
+    delta = np.frombuffer(planes, dtype=np.uint8).reshape(2, frames).T.copy().view('<i2').reshape(-1)
+    return np.cumsum(delta, dtype=np.int16)
+
+
+def write_compressed_pack(pack, out_path, codec='zlib', level=6, max_workers=None):
+    """
+    Compress a folder pack into a single .llpack file.
+
+    Args:
+        pack: SamplePack to compress (mono 16-bit samples)
+        out_path: Output file path
+        codec: 'zlib' or 'lzma'
+        level: Compression level (zlib level or lzma preset)
+        max_workers: Thread pool size used for encoding
+
+    Returns:
+        Size of the written file in bytes
+    """
+    source_fingerprint = pack.scan()
+    notes = pack.notes()
+
+    def encode(note):
+        rate, data = wavfile.read(pack.path_for(note))
+        if data.dtype != np.int16 or data.ndim != 1:
+            raise ValueError(f"Note {note}: only mono int16 samples can be packed, got "
+                             f"{data.dtype} with shape {data.shape}")
+        return rate, len(data), _encode_note(data, codec, level)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        encoded = list(pool.map(encode, notes))
+
+    header = {'codec': codec, 'source_fingerprint': source_fingerprint, 'notes': {}}
+    offset = 0
+    for note, (rate, frames, blob) in zip(notes, encoded):
+        header['notes'][str(note)] = {
+            'offset': offset, 'length': len(blob), 'frames': frames, 'rate': rate,
+        }
+        offset += len(blob)
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(PACK_MAGIC)
+        f.write(struct.pack('<I', len(header_bytes)))
+        f.write(header_bytes)
+        for _, _, blob in encoded:
+            f.write(blob)
+    os.replace(tmp_path, out_path)
+    return os.path.getsize(out_path)
+
+
+def open_pack(path, index_dir=None, **kwargs):
+    """
+    Open a sample pack from a folder or a compressed .llpack file.
+
+    Args:
+        path: Sample folder or .llpack file
+        index_dir: Directory for a folder pack's persisted index, see
+                   SamplePack. A compressed pack keeps its index in the file.
+        **kwargs: Passed to the SamplePack constructor; folder options
+                  such as prefix don't apply to a compressed pack
+
+    Returns:
+        SamplePack or CompressedPack
+    """
+    if str(path).endswith(PACK_EXTENSION):
+        return CompressedPack(path)
+    return SamplePack(path, index_dir=index_dir, **kwargs)
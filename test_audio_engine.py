@@ -0,0 +1,62 @@
+"""
+Tests for rendering parts in the audio engine.
+Run with: python -m pytest test_audio_engine.py
+"""
+
+import numpy as np
+import pytest
+import wavfile
+from models.lesson_model import Part
+
+# The engine needs a working Qt Multimedia backend
+pytest.importorskip('PySide6.QtMultimedia', exc_type=ImportError)
+
+from audio_engine import AudioEngine, render_bend
+
+RATE = 8000
+
+
+@pytest.fixture
+def engine(tmp_path, qapp):
+    rng = np.random.default_rng(0)
+    for midi in range(40, 80):
+        # One second per note, shorter than the steps below
+        data = (rng.standard_normal(RATE) * 3000).astype(np.int16)
+        wavfile.write(tmp_path / f'clean_{midi}.wav', RATE, data)
+    yield AudioEngine(audio_folder=str(tmp_path), samplerate=RATE,
+                      pack_index_dir=str(tmp_path / 'index'))
+
+
+def test_render_bend_is_shorter():
+    data = np.ones(RATE, dtype=np.int16)
+    assert len(render_bend(data, RATE, 2)) < RATE
+
+
+def test_bent_step_lasts_its_duration(engine):
+    part = Part(
+        name='Bend',
+        notes_to_highlight=[('G', 7), ('B', 8)],
+        play_sequence=[[('G', 7, 2), 1500], [('B', 8), 500], [('G', 7, 1), ('B', 8), 1200]],
+    )
+    engine.load_part(part)
+    lengths = [len(step) // 2 for step in engine.sound_list]
+    assert lengths == [1500 * RATE // 1000, 500 * RATE // 1000, 1200 * RATE // 1000]
+    assert engine.step_onsets_ms == [0.0, 1500.0, 2000.0]
+
+
+def test_stale_step_signals_are_dropped(engine):
+    part = Part(name='Steps', notes_to_highlight=[('A', 5)],
+                play_sequence=[[('A', 5), 500], [('A', 5), 500]])
+    engine.load_part(part)
+    emitted = []
+    engine.highlight_note_index.connect(emitted.append)
+    engine.is_playing = True
+
+    # Scheduled before the sink was restarted, e.g. by a hot reload
+    generation = engine._sink_generation
+    engine._sink_generation += 1
+    engine._emit_highlight_signal(1, generation=generation)
+    assert emitted == []
+
+    engine._emit_highlight_signal(1, generation=engine._sink_generation)
+    assert emitted == [1]
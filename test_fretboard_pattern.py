@@ -0,0 +1,32 @@
+"""
+Tests for the note payloads shared by the fretboard views.
+Run with: python -m pytest test_fretboard_pattern.py
+"""
+
+from ui.fretboard_pattern import build_pattern, pattern_key
+
+
+def test_pattern_key_is_order_insensitive_for_highlights():
+    key = pattern_key([('E', 2), ('A', 3)], {'F#': 'highlight1', 'C': 'highlight2'})
+    assert key == pattern_key([('E', 2), ('A', 3)], {'C': 'highlight2', 'F#': 'highlight1'})
+    assert key != pattern_key([('E', 2), ('A', 3)], {'F#': 'highlight1', 'C': 'highlight2'}, use_sharp=False)
+
+
+def test_sharp_and_flat_spelling():
+    sharp = build_pattern(*pattern_key([('E', 2), ('E', 3)], {'F#': 'highlight1'}, use_sharp=True))
+    assert sharp == (
+        {'stringName': 'E', 'fret': 2, 'highlight': 'highlight1', 'noteName': 'F♯', 'hasFlat': False},
+        {'stringName': 'E', 'fret': 3, 'highlight': None, 'noteName': 'G', 'hasFlat': False},
+    )
+
+    # Highlights are looked up by the spelling in use, before the symbol conversion
+    flat = build_pattern(*pattern_key([('E', 2)], {'F#': 'highlight1', 'Gb': 'highlight2'}, use_sharp=False))
+    assert flat == (
+        {'stringName': 'E', 'fret': 2, 'highlight': 'highlight2', 'noteName': 'G♭', 'hasFlat': True},
+    )
+
+
+def test_build_pattern_is_memoized():
+    key = pattern_key([('D', 1)], {'D#': 'highlight3'})
+    assert build_pattern(*key) is build_pattern(*key)
+    assert build_pattern(*key)[0]['highlight'] == 'highlight3'
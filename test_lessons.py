@@ -3,17 +3,42 @@ Test script for lesson loading system.
 Run this to verify lessons are loading correctly.
 """
 
+import os
+from pathlib import Path
+import pytest
 from models.lesson_loader import LessonLoader
+from models.lesson_model import Part
+from models.lesson_format import LessonFormatError, lesson_from_dict
+
+LESSON_SOURCE = """
+from models.lesson_model import Lesson, Part
+with open(__file__ + '.runs', 'a') as f:
+    f.write('x')
+lesson = Lesson(name={name!r}, author='Test', parts=[
+    Part(name='Part 1', notes_to_highlight=[('A', 3)], play_sequence=[[('A', 3), 500]]),
+])
+"""
+
+LESSON_TOML = """
+name = "Scale"
+author = "Test"
+
+[[parts]]
+name = "Part 1"
+notes = [["A", 3], ["A", 5], ["G", 7]]
+highlight_classes = { C = "highlight1" }
+play_sequence = [[["A", 3], 500], [["A", 5], ["G", 7, 2], 1000]]
+"""
 
-def test_lesson_loading():
+def test_lesson_loading(tmp_path):
     """Test the lesson loading functionality."""
 
     print("=" * 70)
     print("LESSON LOADING TEST")
     print("=" * 70)
 
-    # Create loader
-    loader = LessonLoader()
+    # Create loader, keeping its index out of the user's config dir
+    loader = LessonLoader(index_dir=str(tmp_path / 'index'))
 
     # Test 1: Discover lesson files
     print("\n1. Discovering lesson files...")
@@ -45,7 +70,7 @@ def test_lesson_loading():
         print(f"      Notes to highlight: {len(part.notes_to_highlight)}")
         print(f"      Play sequence steps: {part.get_note_count()}")
         print(f"      Duration: {part.get_duration_ms()}ms")
-        print(f"      Metadata: {part.metadata}")
+        print(f"      Description: {part.description}")
 
     # Test 4: Load all lessons
     print("\n4. Loading all available lessons...")
@@ -70,5 +95,158 @@ def test_lesson_loading():
     print("=" * 70)
 
 
+def test_part_bend_validation():
+    """Steps hold (string, fret) notes or bends on a highlighted note."""
+    notes = [('G', 7), ('B', 8)]
+    Part(name='Bend', notes_to_highlight=notes, play_sequence=[[('G', 7, 2), ('B', 8), 1000]])
+    for step, message in [
+        ([('G', 7, 3), 1000], 'Halftones must be 1 or 2'),
+        ([('G', 7, 2, 1), 1000], 'Invalid note'),
+        ([('G',), 1000], 'Invalid note'),
+        ([('G', 5, 2), 1000], 'notes_to_highlight'),
+    ]:
+        with pytest.raises(ValueError, match=message):
+            Part(name='Bend', notes_to_highlight=notes, play_sequence=[step])
+
+
+def test_lesson_index(tmp_path):
+    """Listing executes a lesson module only when its file is new or changed."""
+    lessons_dir = tmp_path / 'lessons'
+    lessons_dir.mkdir()
+    lesson_path = lessons_dir / 'scale.py'
+    lesson_path.write_text(LESSON_SOURCE.format(name='Scale'))
+    (lessons_dir / 'broken.py').write_text('raise RuntimeError("broken lesson")\n')
+
+    def runs():
+        return len((lessons_dir / 'scale.py.runs').read_text())
+
+    loader = LessonLoader(str(lessons_dir), index_dir=str(tmp_path / 'index'))
+    infos = loader.list_lessons()
+    assert [info['name'] for info in infos] == ['Scale']
+    assert infos[0]['part_count'] == 1 and infos[0]['total_duration_ms'] == 500
+    assert runs() == 1
+
+    # A new loader reads the persisted index without executing anything
+    loader = LessonLoader(str(lessons_dir), index_dir=str(tmp_path / 'index'))
+    assert loader.get_lesson_info('scale')['name'] == 'Scale'
+    assert [info['filename'] for info in loader.list_lessons()] == ['scale']
+    assert runs() == 1
+
+    # Opening the lesson executes it; the index is not invalidated by that
+    lesson = loader.load_lesson('scale')
+    assert lesson.name == 'Scale'
+    assert runs() == 2
+
+    # Refreshing an index that has no entry for it reuses the open lesson
+    loader.index.clear()
+    assert loader.list_lessons()[0]['name'] == 'Scale'
+    assert runs() == 2
+    assert loader.load_lesson('scale') is lesson
+
+    # A changed file is re-executed once
+    lesson_path.write_text(LESSON_SOURCE.format(name='Scale v2'))
+    st = lesson_path.stat()
+    os.utime(lesson_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert loader.list_lessons()[0]['name'] == 'Scale v2'
+    assert loader.get_lesson_info('scale')['name'] == 'Scale v2'
+    assert runs() == 3
+
+    lesson_path.unlink()
+    assert loader.list_lessons() == []
+
+
+def test_toml_lesson(tmp_path):
+    """TOML lessons load like Python lessons and are validated against the schema."""
+    lessons_dir = tmp_path / 'lessons'
+    lessons_dir.mkdir()
+    (lessons_dir / 'scale.toml').write_text(LESSON_TOML)
+    (lessons_dir / 'chords.py').write_text(LESSON_SOURCE.format(name='Chords'))
+
+    loader = LessonLoader(str(lessons_dir), index_dir=str(tmp_path / 'index'))
+    assert loader.get_available_lesson_files() == ['chords', 'scale']
+    lesson = loader.load_lesson('scale')
+    assert lesson.author == 'Test' and lesson.use_sharp
+    part = lesson.parts[0]
+    assert part.notes_to_highlight == [('A', 3), ('A', 5), ('G', 7)]
+    assert part.play_sequence == [[('A', 3), 500], [('A', 5), ('G', 7, 2), 1000]]
+    assert part.highlight_classes == {'C': 'highlight1'}
+    assert [info['name'] for info in loader.list_lessons()] == ['Chords', 'Scale']
+
+    valid = {'name': 'Scale', 'parts': [{'name': 'Part 1', 'notes': [['A', 3]],
+                                         'play_sequence': [[['A', 3], 500]]}]}
+    lesson_from_dict(valid)
+    for broken, message in [
+        ({**valid, 'auther': 'Typo'}, 'unknown key'),
+        ({'name': 'Scale'}, "missing required key 'parts'"),
+        ({**valid, 'parts': [{**valid['parts'][0], 'notes': [['X', 3]]}]}, 'invalid string'),
+        ({**valid, 'parts': [{**valid['parts'][0], 'notes': [['A', 25]]}]}, 'fret 25'),
+        ({**valid, 'parts': [{**valid['parts'][0], 'play_sequence': [[['A', 3]]]}]}, 'expected'),
+        ({**valid, 'parts': [{**valid['parts'][0], 'play_sequence': [[['A', 3, 3], 500]]}]}, 'halftones'),
+    ]:
+        with pytest.raises(LessonFormatError, match=message):
+            lesson_from_dict(broken)
+
+    # A broken TOML file fails to load without raising
+    (lessons_dir / 'scale.toml').write_text('name = "Scale"\nparts = [')
+    assert loader.reload_lesson('scale') is None
+
+
+def test_load_all_lessons_parallel(tmp_path):
+    """Lessons loaded in a process pool end up in the cache, with a per-file report."""
+    lessons_dir = tmp_path / 'lessons'
+    lessons_dir.mkdir()
+    (lessons_dir / 'scale.toml').write_text(LESSON_TOML)
+    (lessons_dir / 'chords.py').write_text(LESSON_SOURCE.format(name='Chords'))
+    (lessons_dir / 'broken.py').write_text('raise RuntimeError("broken lesson")\n')
+
+    loader = LessonLoader(str(lessons_dir), index_dir=str(tmp_path / 'index'))
+    lessons = loader.load_all_lessons(parallel=True, max_workers=2)
+    assert [lesson.name for lesson in lessons] == ['Chords', 'Scale']
+    assert loader.load_lesson('chords') is lessons[0]
+
+    report = {entry['filename']: entry for entry in loader.load_report}
+    assert set(report) == {'broken', 'chords', 'scale'}
+    assert 'broken lesson' in report['broken']['error']
+    assert report['scale']['error'] is None and report['scale']['ms'] >= 0
+
+
+def test_lesson_watcher(tmp_path, qapp):
+    """Edited lesson files are reloaded and diffed part by part."""
+    from lesson_watcher import LessonWatcher, changed_parts, match_part
+
+    lessons_dir = tmp_path / 'lessons'
+    lessons_dir.mkdir()
+    lesson_path = lessons_dir / 'scale.toml'
+    lesson_path.write_text(LESSON_TOML)
+    (lessons_dir / 'other.toml').write_text(LESSON_TOML)
+
+    loader = LessonLoader(str(lessons_dir), index_dir=str(tmp_path / 'index'))
+    old = loader.load_lesson('scale')
+    watcher = LessonWatcher(loader)
+    reloaded = []
+    watcher.lesson_reloaded.connect(lambda filename, lesson: reloaded.append((filename, lesson)))
+
+    # Insert a part before the first one and touch a lesson that isn't loaded
+    second_part = LESSON_TOML[LESSON_TOML.index('[[parts]]'):].replace('Part 1', 'Part 0')
+    lesson_path.write_text(LESSON_TOML.replace('[[parts]]', second_part + '\n[[parts]]', 1))
+    (lessons_dir / 'other.toml').write_text(LESSON_TOML.replace('Scale', 'Other'))
+    assert watcher.check() == ['scale']
+    new = reloaded[0][1]
+    assert [part.name for part in new.parts] == ['Part 0', 'Part 1']
+    assert changed_parts(old, new) == [0]
+    assert match_part(old, new, 0) == 1
+
+    # A broken edit is retried on the next change
+    lesson_path.write_text('name = ')
+    assert watcher.check() == [] and not loader.is_cached('scale')
+    lesson_path.write_text(LESSON_TOML.replace('"Scale"', '"Scale v2"').replace('500]', '400]'))
+    assert watcher.check() == ['scale']
+    newest = reloaded[-1][1]
+    assert newest.name == 'Scale v2' and changed_parts(new, newest) == [0]
+    assert match_part(new, newest, 1) == 0
+
+
 if __name__ == "__main__":
-    test_lesson_loading()
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_lesson_loading(Path(tmp_dir))
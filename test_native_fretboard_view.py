@@ -0,0 +1,128 @@
+"""
+Tests for the QGraphicsScene fretboard view, drawn offscreen.
+Run with: python -m pytest test_native_fretboard_view.py
+"""
+
+import pytest
+
+pytest.importorskip('PySide6.QtWidgets', exc_type=ImportError)
+
+from ui.native_fretboard_view import NativeFretboardView
+
+SCALE = [('E', 5), ('E', 8), ('A', 5), ('A', 7)]
+CHORD = [('D', 7), ('G', 7)]
+
+
+@pytest.fixture
+def view(qapp):
+    view = NativeFretboardView()
+    yield view
+    view.deleteLater()
+
+
+def _record_states(view):
+    """Record the (note, active) calls of _set_note_state()."""
+    calls = []
+    set_note_state = view._set_note_state
+
+    def recording(key, active):
+        calls.append((key, active))
+        set_note_state(key, active)
+
+    view._set_note_state = recording
+    return calls
+
+
+def _is_active(view, key):
+    item, note = view._current[key]
+    expected = view._note_pixmap(note['highlight'], True, note['noteName'], note['hasFlat'])
+    return item.pixmap().cacheKey() == expected.cacheKey()
+
+
+def test_display_notes_reuses_cached_patterns(view):
+    view.display_notes(SCALE, {'A': 'highlight1'})
+    scale_items = {key: item for key, (item, _) in view._current.items()}
+    assert set(scale_items) == set(SCALE)
+    assert all(item.isVisible() for item in scale_items.values())
+
+    view.display_notes(CHORD)
+    assert set(view._current) == set(CHORD)
+    assert not any(item.isVisible() for item in scale_items.values())
+
+    view.display_notes(SCALE, {'A': 'highlight1'})
+    assert {key: item for key, (item, _) in view._current.items()} == scale_items
+    assert all(item.isVisible() for item in scale_items.values())
+    assert len(view._patterns) == 2
+
+    # The same notes with other highlights are another pattern
+    view.display_notes(SCALE)
+    assert len(view._patterns) == 3
+
+
+def test_highlight_notes_only_updates_changed_notes(view):
+    view.display_notes(SCALE)
+    calls = _record_states(view)
+
+    view.highlight_notes([('E', 5), ('A', 5)])
+    assert sorted(calls) == [(('A', 5), True), (('E', 5), True)]
+    assert _is_active(view, ('E', 5)) and not _is_active(view, ('E', 8))
+
+    calls.clear()
+    view.highlight_notes([('A', 5), ('A', 7, 2)])
+    assert sorted(calls) == [(('A', 7), True), (('E', 5), False)]
+    assert not _is_active(view, ('E', 5)) and _is_active(view, ('A', 7))
+
+    calls.clear()
+    view.clear_note_highlights()
+    assert sorted(calls) == [(('A', 5), False), (('A', 7), False)]
+
+    # Redisplaying a pattern starts with every note inactive
+    view.highlight_notes([('E', 8)])
+    view.display_notes(SCALE)
+    assert not any(_is_active(view, key) for key in SCALE)
+
+
+def test_highlight_step(view):
+    view.display_notes(SCALE)
+    view.set_step_table([[('E', 5), 500], [('E', 8), ('A', 7, 2), 1000], [('A', 5), 500]])
+
+    view.highlight_step(1)
+    assert view._active_notes == {('E', 8), ('A', 7)}
+    assert len(view._bend_animations) == 1
+
+    view.highlight_step(2)
+    assert view._active_notes == {('A', 5)}
+
+    # Out of range indices are ignored
+    view.highlight_step(3)
+    view.highlight_step(-1)
+    assert view._active_notes == {('A', 5)}
+
+
+def test_clock_steps_forward(view):
+    view.display_notes(SCALE)
+    view.set_step_table([[note, 100] for note in SCALE])
+    view.start_clock([0, 100, 200, 300])
+    assert view._next_step == 0
+
+    # The first sync anchors the clock and catches up to the current step
+    view.sync_clock(150)
+    assert view._next_step == 2 and view._active_notes == {('E', 8)}
+    assert view._clock_timer.isActive()
+
+    # Small drift is tolerated; a large one moves the clock
+    origin = view._clock_origin_ms
+    view.sync_clock(view._clock_ms())
+    assert view._clock_origin_ms == origin
+    view.sync_clock(250)
+    view._tick_clock()
+    assert view._next_step == 3 and view._active_notes == {('A', 5)}
+
+    view.sync_clock(1000)
+    view._tick_clock()
+    assert view._next_step == 4 and view._active_notes == {('A', 7)}
+    assert not view._clock_timer.isActive()
+
+    view.stop_clock()
+    view.sync_clock(0)
+    assert view._clock_origin_ms is None
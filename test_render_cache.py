@@ -0,0 +1,79 @@
+"""
+Tests for the on-disk render cache (keys, store/load, eviction, stale packs).
+Run with: python -m pytest test_render_cache.py
+"""
+
+import os
+import numpy as np
+from render_cache import RenderCache
+
+SEQUENCE = [[('A', 3), 500], [('A', 5), ('D', 2), 1000]]
+TUNING = {'E': 40, 'A': 45, 'D': 50, 'G': 55, 'B': 59, 'e': 64}
+RATE = 44100
+
+
+def _timeline(value, n=1000):
+    return np.full(n, value, dtype=np.int16), np.array([n // 2, n], dtype=np.int64)
+
+
+def _entry_bytes(cache, key):
+    return cache._entries()[key][1]
+
+
+def test_make_key_sensitivity():
+    key = RenderCache.make_key(SEQUENCE, TUNING, 10, 1.0, RATE, 'abc')
+    assert key == RenderCache.make_key(list(SEQUENCE), dict(TUNING), 10, 1.0, RATE, 'abc')
+    assert key != RenderCache.make_key(SEQUENCE, TUNING, 10, 0.5, RATE, 'abc')
+    assert key != RenderCache.make_key(SEQUENCE, dict(TUNING, E=38), 10, 1.0, RATE, 'abc')
+    assert key != RenderCache.make_key(SEQUENCE, TUNING, 20, 1.0, RATE, 'abc')
+    assert key != RenderCache.make_key(SEQUENCE, TUNING, 10, 1.0, RATE, 'abd')
+    assert key != RenderCache.make_key(SEQUENCE, TUNING, 10, 1.0, RATE // 2, 'abc')
+
+    with_pack = RenderCache.make_key(SEQUENCE, TUNING, 10, 1.0, RATE, 'abc', pack_id='clean_1234')
+    assert with_pack.startswith('clean_1234-abc-')
+    assert with_pack != RenderCache.make_key(SEQUENCE, TUNING, 10, 1.0, RATE, 'abc', pack_id='dist_5678')
+
+
+def test_store_and_load(tmp_path):
+    cache = RenderCache(str(tmp_path))
+    assert cache.load('missing') is None
+
+    timeline, step_ends = _timeline(7)
+    cache.store('key', timeline, step_ends)
+    loaded_timeline, loaded_ends = cache.load('key')
+    assert isinstance(loaded_timeline, np.memmap)
+    np.testing.assert_array_equal(loaded_timeline, timeline)
+    np.testing.assert_array_equal(loaded_ends, step_ends)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_evicts_least_recently_loaded(tmp_path):
+    cache = RenderCache(str(tmp_path))
+    cache.store('a', *_timeline(1))
+    cache.store('b', *_timeline(2))
+    entry = _entry_bytes(cache, 'a')
+
+    # Age both entries, then touch 'a' so 'b' is the least recently used
+    for name in os.listdir(tmp_path):
+        path = os.path.join(tmp_path, name)
+        os.utime(path, (1_000_000, os.stat(path).st_mtime))
+    assert cache.load('a') is not None
+
+    cache.max_bytes = 2 * entry
+    cache.store('c', *_timeline(3))
+    assert cache.load('b') is None
+    assert cache.load('a') is not None and cache.load('c') is not None
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_drop_stale(tmp_path):
+    cache = RenderCache(str(tmp_path))
+    old = RenderCache.make_key(SEQUENCE, TUNING, 10, 1.0, RATE, 'old' * 8, pack_id='clean_1')
+    new = RenderCache.make_key(SEQUENCE, TUNING, 10, 1.0, RATE, 'new' * 8, pack_id='clean_1')
+    other = RenderCache.make_key(SEQUENCE, TUNING, 10, 1.0, RATE, 'old' * 8, pack_id='dist_2')
+    for key in (old, new, other):
+        cache.store(key, *_timeline(1))
+
+    assert cache.drop_stale('clean_1', 'new' * 8) == 1
+    assert cache.load(old) is None
+    assert cache.load(new) is not None and cache.load(other) is not None
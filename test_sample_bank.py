@@ -0,0 +1,137 @@
+"""
+Tests for lazy sample banks and the memory budget shared by instrument banks.
+Run with: python -m pytest test_sample_bank.py
+"""
+
+import os
+import threading
+import numpy as np
+import pytest
+import wavfile
+from sample_pack import SamplePack, CompressedPack, write_compressed_pack
+from sample_bank import SampleBank, MemoryBudget, InstrumentBanks
+
+RATE = 8000
+FRAMES = 800
+
+
+@pytest.fixture
+def pack(tmp_path):
+    folder = tmp_path / 'clean'
+    folder.mkdir()
+    for midi in range(40, 46):
+        wavfile.write(os.path.join(folder, f'clean_{midi}.wav'), RATE,
+                      np.full(FRAMES, midi, dtype=np.int16))
+    pack = SamplePack(str(folder), index_dir=str(tmp_path / 'index'))
+    pack.scan()
+    return pack
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_get_loads_lazily(pack, mmap):
+    bank = SampleBank(pack, mmap=mmap)
+    assert bank.loaded_bytes() == 0 and not bank.is_loaded(40)
+
+    data = bank.get(40)
+    np.testing.assert_array_equal(data, np.full(FRAMES, 40, dtype=np.int16))
+    assert isinstance(data, np.memmap) == mmap
+    assert bank.is_loaded(40) and not bank.is_loaded(41)
+    assert bank.get(40) is data
+    assert bank.loaded_bytes() == FRAMES * 2
+
+    with pytest.raises(OSError):
+        bank.get(99)
+
+
+def test_latency_stats(pack):
+    bank = SampleBank(pack)
+    assert bank.latency_stats()['count'] == 0
+
+    bank.warm([41, 42], background=False)
+    bank.get(40)
+    bank.get(41)
+    stats = bank.latency_stats()
+    assert stats['count'] == 3 and stats['demand_count'] == 1
+    assert {note: entry['source'] for note, entry in stats['per_note'].items()} == {
+        40: 'demand', 41: 'warm', 42: 'warm'}
+    assert 0.0 <= stats['mean_ms'] <= stats['max_ms']
+
+
+def _record_read_threads(pack):
+    threads = []
+    read = pack.read
+
+    def recording_read(midi_note, **kwargs):
+        threads.append(threading.current_thread())
+        return read(midi_note, **kwargs)
+
+    pack.read = recording_read
+    return threads
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason='needs several CPUs')
+def test_warm_decodes_compressed_pack_in_parallel(pack, tmp_path):
+    path = str(tmp_path / 'clean.llpack')
+    write_compressed_pack(pack, path)
+    compressed = CompressedPack(path)
+    compressed.scan()
+
+    threads = _record_read_threads(compressed)
+    bank = SampleBank(compressed)
+    bank.warm(range(40, 46), background=False)
+    assert all(bank.is_loaded(note) for note in range(40, 46))
+    assert threading.current_thread() not in threads
+
+    # Folder packs are only mapped, so they are warmed one after another
+    threads = _record_read_threads(pack)
+    SampleBank(pack).warm(range(40, 46), background=False)
+    assert threads == [threading.current_thread()] * 6
+
+
+def test_clear_stops_warm_up(pack):
+    bank = SampleBank(pack, mmap=False)
+    bank.warm(range(40, 46))
+    bank.clear()
+    assert bank.loaded_bytes() == 0 and bank.latency_stats()['count'] == 0
+    assert bank._warm_thread is None
+
+
+def test_budget_evicts_across_banks(pack, tmp_path):
+    note_bytes = FRAMES * 2
+    budget = MemoryBudget(max_bytes=3 * note_bytes)
+    clean = SampleBank(pack, mmap=False, budget=budget, name='clean')
+    other = SampleBank(SamplePack(pack.folder, index_dir=str(tmp_path / 'index2')),
+                       mmap=False, budget=budget, name='other')
+
+    clean.get(40)
+    clean.get(41)
+    other.get(40)
+    clean.get(40)  # hit: 41 is now the least recently used note
+    other.get(41)  # over budget: evicts clean's 41
+
+    assert budget.used_bytes == 3 * note_bytes
+    assert clean.is_loaded(40) and not clean.is_loaded(41)
+    assert other.is_loaded(40) and other.is_loaded(41)
+
+    # A note larger than the whole budget evicts everything else but is kept
+    budget.max_bytes = note_bytes // 2
+    clean.get(42)
+    assert clean.is_loaded(42) and budget.used_bytes == note_bytes
+    assert not clean.is_loaded(40) and not other.is_loaded(40) and not other.is_loaded(41)
+
+    clean.clear()
+    assert budget.used_bytes == 0
+
+
+def test_instrument_banks_share_budget(pack):
+    banks = InstrumentBanks(max_bytes=FRAMES * 2)
+    banks.register('clean', pack.folder, index_dir=pack.index_dir)
+    banks.register('other', pack.folder, index_dir=pack.index_dir)
+    assert banks.get('other').pack.index_dir == pack.index_dir
+    assert banks.names() == ['clean', 'other'] and banks.active_name == 'clean'
+
+    banks.active.get(40)
+    bank = banks.switch('other', prefetch_notes=[41])
+    bank.warm([41], background=False)  # waits for the prefetch
+    assert banks.active is bank and bank.is_loaded(41)
+    assert not banks.get('clean').is_loaded(40)
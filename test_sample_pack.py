@@ -0,0 +1,125 @@
+"""
+Tests for sample pack indexing, fingerprinting and compressed packs.
+Run with: python -m pytest test_sample_pack.py
+"""
+
+import os
+import numpy as np
+import pytest
+import wavfile
+from sample_pack import (SamplePack, CompressedPack, open_pack, write_compressed_pack,
+                         _encode_note, _decode_note)
+
+RATE = 8000
+
+
+def _write_note(folder, midi, value=1000, frames=800):
+    path = os.path.join(folder, f'clean_{midi}.wav')
+    wavfile.write(path, RATE, np.full(frames, value, dtype=np.int16))
+    return path
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_scan_indexes_notes(tmp_path):
+    folder = tmp_path / 'clean'
+    folder.mkdir()
+    for midi in (40, 52, 45):
+        _write_note(folder, midi)
+    (folder / 'readme.txt').write_text('not a sample')
+
+    pack = SamplePack(str(folder), index_dir=str(tmp_path / 'index'))
+    pack.scan()
+    assert pack.notes() == [40, 45, 52]
+    assert pack.duration_ms(45) == 100.0
+    assert pack.duration_ms(99) is None
+    assert os.path.exists(pack.index_path)
+
+
+def test_fingerprint_detects_modified_file(tmp_path):
+    folder = tmp_path / 'clean'
+    folder.mkdir()
+    _write_note(folder, 40)
+    path = _write_note(folder, 45)
+    index_dir = str(tmp_path / 'index')
+
+    pack = SamplePack(str(folder), index_dir=index_dir)
+    first = pack.scan()
+    assert pack.changed  # no stored index yet
+
+    # A new instance reads the stored index: nothing changed
+    pack = SamplePack(str(folder), index_dir=index_dir)
+    assert pack.scan() == first and not pack.changed
+
+    # Re-rendered sample: new length and mtime
+    _write_note(folder, 45, frames=400)
+    _bump_mtime(path)
+    second = pack.scan()
+    assert second != first and pack.changed
+    assert pack.duration_ms(45) == 50.0
+
+    # A removed sample changes the fingerprint too
+    os.remove(path)
+    assert pack.scan() != second and pack.notes() == [40]
+
+
+@pytest.mark.parametrize('codec', ['zlib', 'lzma'])
+def test_note_codec_round_trip(codec):
+    rng = np.random.default_rng(0)
+    # Full range, so the deltas wrap around modulo 2**16
+    data = rng.integers(-32768, 32767, 1001, dtype=np.int16)
+    data[:4] = [32767, -32768, 32767, 0]
+    decoded = _decode_note(_encode_note(data, codec, 1), codec, len(data))
+    assert decoded.dtype == np.int16
+    np.testing.assert_array_equal(decoded, data)
+
+    with pytest.raises(ValueError, match='Unknown pack codec'):
+        _encode_note(data, 'zip', 1)
+
+
+@pytest.mark.parametrize('codec', ['zlib', 'lzma'])
+def test_compressed_pack_matches_folder(tmp_path, codec):
+    folder = tmp_path / 'clean'
+    folder.mkdir()
+    for midi in (40, 45):
+        _write_note(folder, midi, value=midi * 10)
+    pack = SamplePack(str(folder), index_dir=str(tmp_path / 'index'))
+    path = str(tmp_path / f'{codec}.llpack')
+    write_compressed_pack(pack, path, codec=codec)
+
+    compressed = open_pack(path)
+    assert isinstance(compressed, CompressedPack)
+    compressed.scan()
+    assert compressed.notes() == [40, 45]
+    for midi, data in compressed.decode_all().items():
+        np.testing.assert_array_equal(data, pack.read(midi))
+
+
+@pytest.mark.parametrize('data', [
+    np.zeros((100, 2), dtype=np.int16),
+    np.zeros(100, dtype=np.float32),
+])
+def test_compressed_pack_rejects_non_mono_int16(tmp_path, data):
+    folder = tmp_path / 'clean'
+    folder.mkdir()
+    wavfile.write(str(folder / 'clean_40.wav'), RATE, data)
+    pack = SamplePack(str(folder), index_dir=str(tmp_path / 'index'))
+    with pytest.raises(ValueError, match='only mono int16'):
+        write_compressed_pack(pack, str(tmp_path / 'out.llpack'))
+
+
+def test_missing_or_corrupt_compressed_pack_is_empty(tmp_path):
+    missing = CompressedPack(str(tmp_path / 'missing.llpack'))
+    missing.scan()
+    assert missing.notes() == []
+
+    corrupt = tmp_path / 'corrupt.llpack'
+    corrupt.write_bytes(b'not a pack')
+    pack = CompressedPack(str(corrupt))
+    pack.scan()
+    assert pack.notes() == []
+    with pytest.raises(KeyError):
+        pack.read(40)
@@ -0,0 +1,22 @@
+"""
+Tests for timing aggregates.
+Run with: python -m pytest test_timing_stats.py
+"""
+
+from timing_stats import TimingStat
+
+
+def test_empty_summary():
+    assert TimingStat().summary() == {'count': 0, 'mean_ms': 0.0, 'max_ms': 0.0, 'p95_ms': 0.0}
+
+
+def test_negative_values():
+    stat = TimingStat()
+    for ms in (-3.0, -1.0, -2.0):
+        stat.add(ms)
+    summary = stat.summary()
+    assert summary['count'] == 3 and summary['mean_ms'] == -2.0
+    assert summary['max_ms'] == -1.0
+
+    stat.reset()
+    assert stat.summary()['max_ms'] == 0.0
@@ -0,0 +1,221 @@
+"""
+Tests for the wavfile additions (block iteration, header info, parallel
+and buffered reads, streaming writes).
+Run with: python -m pytest test_wavfile.py
+"""
+
+import io
+import struct
+import numpy as np
+import pytest
+import wavfile
+
+
+def _pcm24_bytes(samples):
+    """Build a mono 24-bit PCM WAV file in memory from int32 samples."""
+    raw = b''.join(struct.pack('<i', int(s))[:3] for s in samples)
+    fmt_chunk = struct.pack('<HHIIHH', 1, 1, 8000, 8000 * 3, 3, 24)
+    body = b'WAVE' + b'fmt ' + struct.pack('<I', 16) + fmt_chunk
+    body += b'data' + struct.pack('<I', len(raw)) + raw
+    if len(raw) % 2:
+        body += b'\x00'
+    return b'RIFF' + struct.pack('<I', len(body)) + body
+
+
+def _to_rf64(wav_bytes):
+    """Rewrite a plain RIFF file (no fact chunk) as RF64 with a ds64 chunk."""
+    fmt_size = struct.unpack('<I', wav_bytes[16:20])[0]
+    fmt_end = 20 + fmt_size
+    data_size = struct.unpack('<I', wav_bytes[fmt_end + 4:fmt_end + 8])[0]
+    data = wav_bytes[fmt_end + 8:]
+    ds64 = struct.pack('<QQQI', 0, data_size, 0, 0)
+    body = (b'WAVE' + b'ds64' + struct.pack('<I', len(ds64)) + ds64
+            + wav_bytes[12:fmt_end] + b'data' + b'\xff\xff\xff\xff' + data)
+    ds64_file_size = struct.pack('<Q', len(body) + 4)
+    body = body[:12] + ds64_file_size + body[20:]
+    return b'RF64' + b'\xff\xff\xff\xff' + body
+
+
+@pytest.mark.parametrize('dtype', ['uint8', 'int16', 'int32', 'float32', 'float64'])
+@pytest.mark.parametrize('channels', [1, 2])
+def test_iter_blocks_matches_read(tmp_path, dtype, channels):
+    rng = np.random.default_rng(0)
+    if dtype.startswith('float'):
+        data = rng.uniform(-1, 1, (1001, channels)).astype(dtype)
+    else:
+        info = np.iinfo(dtype)
+        data = rng.integers(info.min, info.max, (1001, channels), dtype=dtype)
+    if channels == 1:
+        data = data[:, 0]
+    path = tmp_path / 'test.wav'
+    wavfile.write(path, 8000, data)
+
+    blocks = list(wavfile.iter_blocks(path, 256))
+    assert [len(b) for b in blocks] == [256, 256, 256, 233]
+    np.testing.assert_array_equal(np.concatenate(blocks), wavfile.read(path)[1])
+
+
+def test_iter_blocks_24bit_and_float_output():
+    samples = np.array([0, 1, -1, 8388607, -8388608, 1234567], dtype=np.int32)
+    wav = _pcm24_bytes(samples)
+
+    blocks = list(wavfile.iter_blocks(io.BytesIO(wav), 4))
+    np.testing.assert_array_equal(np.concatenate(blocks), samples << 8)
+
+    floats = np.concatenate(list(wavfile.iter_blocks(io.BytesIO(wav), 4, dtype=np.float32)))
+    assert floats.dtype == np.float32
+    np.testing.assert_allclose(floats, samples / 2**23)
+
+
+def test_iter_blocks_rf64_and_stream():
+    data = np.arange(-500, 500, dtype=np.int16)
+    buf = io.BytesIO()
+    wavfile.write(buf, 8000, data)
+    rf64 = _to_rf64(buf.getvalue())
+
+    np.testing.assert_array_equal(np.concatenate(list(wavfile.iter_blocks(io.BytesIO(rf64), 300))), data)
+
+    class Unseekable(io.RawIOBase):
+        def __init__(self, payload):
+            self._inner = io.BytesIO(payload)
+        def readable(self):
+            return True
+        def seekable(self):
+            return False
+        def readinto(self, b):
+            chunk = self._inner.read(len(b))
+            b[:len(chunk)] = chunk
+            return len(chunk)
+
+    blocks = list(wavfile.iter_blocks(io.BufferedReader(Unseekable(rf64)), 300))
+    np.testing.assert_array_equal(np.concatenate(blocks), data)
+
+
+def test_info_reads_header_only(tmp_path):
+    data = np.zeros((1234, 2), dtype=np.int16)
+    path = tmp_path / 'test.wav'
+    wavfile.write(path, 22050, data)
+
+    wav = wavfile.info(path)
+    assert (wav.rate, wav.channels, wav.frames, wav.bit_depth) == (22050, 2, 1234, 16)
+    assert wav.format == wavfile.WAVE_FORMAT.PCM
+    assert wav.data_offset == 44
+
+    # Truncated data chunk: only the frames actually present are reported
+    raw = path.read_bytes()[:-400]
+    assert wavfile.info(io.BytesIO(raw)).frames == 1234 - 100
+
+    assert wavfile.info(io.BytesIO(_pcm24_bytes(range(5)))).bit_depth == 24
+
+
+def test_read_many_keeps_order_and_errors(tmp_path):
+    paths = []
+    for i in range(5):
+        path = str(tmp_path / f'note_{i}.wav')
+        wavfile.write(path, 8000, np.full(100 + i, i, dtype=np.int16))
+        paths.append(path)
+    bad = tmp_path / 'bad.wav'
+    bad.write_bytes(b'not a wav file')
+    paths.insert(2, str(bad))
+    paths.insert(4, str(tmp_path / 'missing.wav'))
+
+    results = wavfile.read_many(paths, max_workers=3)
+    assert list(results) == paths
+    assert isinstance(results[str(bad)], ValueError)
+    assert isinstance(results[str(tmp_path / 'missing.wav')], FileNotFoundError)
+    rate, data = results[paths[-1]]
+    assert rate == 8000 and len(data) == 104 and data[0] == 4
+
+
+@pytest.mark.parametrize('dtype', ['uint8', 'int16', 'float32'])
+def test_wav_writer_streams_blocks(tmp_path, dtype):
+    data = (np.arange(3001 * 2) % 200).astype(dtype).reshape(-1, 2)
+    path = tmp_path / 'out.wav'
+    with wavfile.WavWriter(path, 8000, channels=2, dtype=dtype) as out:
+        for start in range(0, len(data), 1000):
+            out.write(data[start:start + 1000])
+    rate, result = wavfile.read(path)
+    assert rate == 8000
+    np.testing.assert_array_equal(result, data)
+    assert wavfile.info(path).frames == 3001
+
+    with pytest.raises(ValueError):
+        with wavfile.WavWriter(tmp_path / 'bad.wav', 8000) as out:
+            out.write(np.zeros(10, dtype=np.int32))
+
+
+def test_wav_writer_switches_to_rf64(tmp_path):
+    class SmallLimitWriter(wavfile.WavWriter):
+        _RIFF_MAX = 1000
+
+    data = np.arange(-1000, 1001, dtype=np.int16)
+    path = tmp_path / 'big.wav'
+    with SmallLimitWriter(path, 8000) as out:
+        out.write(data[:700])
+        out.write(data[700:])
+    assert path.read_bytes()[:4] == b'RF64'
+    np.testing.assert_array_equal(wavfile.read(path)[1], data)
+
+
+@pytest.mark.parametrize('file_dtype, out_dtype', [
+    ('int16', 'int16'), ('int16', 'float32'), ('uint8', 'float32'),
+    ('int32', 'float64'), ('float32', 'float32'), ('float32', 'float64'),
+])
+def test_read_into_matches_read(tmp_path, file_dtype, out_dtype):
+    rng = np.random.default_rng(1)
+    if file_dtype.startswith('float'):
+        data = rng.uniform(-1, 1, (20000, 2)).astype(file_dtype)
+    else:
+        info = np.iinfo(file_dtype)
+        data = rng.integers(info.min, info.max, (20000, 2), dtype=file_dtype)
+    path = tmp_path / 'test.wav'
+    wavfile.write(path, 8000, data)
+
+    out = np.zeros((20010, 2), dtype=out_dtype)
+    assert wavfile.read_into(path, out, offset=5) == 20000
+    expected = wavfile._to_dtype(wavfile.read(path)[1], out_dtype)
+    np.testing.assert_array_equal(out[5:20005], expected)
+    assert not out[:5].any() and not out[20005:].any()
+
+    with pytest.raises(ValueError):
+        wavfile.read_into(path, out, offset=11)
+
+
+def test_read_into_24bit():
+    samples = np.array([0, 1, -1, 8388607, -8388608, 1234567], dtype=np.int32)
+    wav = _pcm24_bytes(samples)
+
+    out = np.empty(6, dtype=np.int32)
+    wavfile.read_into(io.BytesIO(wav), out)
+    np.testing.assert_array_equal(out, samples << 8)
+
+    out = np.empty(6, dtype=np.float32)
+    wavfile.read_into(io.BytesIO(wav), out)
+    np.testing.assert_allclose(out, samples / 2**23)
+
+
+@pytest.mark.parametrize('dtype', ['uint8', 'int16', 'int32', 'float64'])
+def test_read_as_float(tmp_path, dtype):
+    rng = np.random.default_rng(2)
+    if dtype.startswith('float'):
+        data = rng.uniform(-1, 1, (40000, 2)).astype(dtype)
+    else:
+        info = np.iinfo(dtype)
+        data = rng.integers(info.min, info.max, (40000, 2), dtype=dtype)
+    path = tmp_path / 'test.wav'
+    wavfile.write(path, 8000, data)
+
+    rate, result = wavfile.read(path, as_float=True)
+    assert result.dtype == np.float32 and result.shape == data.shape
+    np.testing.assert_array_equal(result, wavfile._to_dtype(wavfile.read(path)[1], np.float32))
+    assert np.abs(result).max() <= 1.0
+
+    with pytest.raises(ValueError):
+        wavfile.read(path, mmap=True, as_float=True)
+
+
+def test_read_24bit_as_float():
+    samples = np.array([0, 1, -1, 8388607, -8388608, 1234567], dtype=np.int32)
+    wav = _pcm24_bytes(samples)
+    np.testing.assert_array_equal(wavfile.read(io.BytesIO(wav))[1], samples << 8)
+    np.testing.assert_allclose(wavfile.read(io.BytesIO(wav), as_float=True)[1], samples / 2**23)
@@ -0,0 +1,56 @@
+"""
+Small aggregates of timing measurements.
+
+Used by the audio engine and the fretboard views to report how long things
+take and how late they happen, in the same shape as the stats main.js sends
+over the bridge: {'count', 'mean_ms', 'max_ms'}.
+"""
+
+from collections import deque
+
+# Number of recent values kept for percentiles
+RECENT_VALUES = 512
+
+
+class TimingStat:
+    """
+    Running count, mean and max of a series of durations in ms, plus a
+    95th percentile over the most recent RECENT_VALUES values.
+
+    Example:
+        >>> stat = TimingStat()
+        >>> stat.add(4.0)
+        >>> stat.add(6.0)
+        >>> stat.summary()['mean_ms']
+        5.0
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.total_ms = 0.0
+        # Values are signed (e.g. how late a timer fired), so start below any
+        self.max_ms = float('-inf')
+        self._recent = deque(maxlen=RECENT_VALUES)
+
+    def add(self, ms):
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+        self._recent.append(ms)
+
+    def summary(self):
+        """
+        Returns:
+            Dict with 'count', 'mean_ms', 'max_ms' and 'p95_ms'
+        """
+        recent = sorted(self._recent)
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'max_ms': self.max_ms if self.count else 0.0,
+            'p95_ms': recent[int(0.95 * (len(recent) - 1))] if recent else 0.0,
+        }
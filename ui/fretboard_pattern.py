@@ -0,0 +1,67 @@
+"""
+Note payloads shared by the fretboard views.
+
+Kept free of QtWebEngine imports so the native fretboard view can use it
+without loading Chromium.
+"""
+
+from functools import lru_cache
+from constants import FRETBOARD_NOTES_SHARP, FRETBOARD_NOTES_FLAT, STRING_ID
+
+
+def pattern_key(notes_to_highlight, highlight_classes=None, use_sharp=True):
+    """
+    Hashable key identifying a displayed pattern.
+
+    Args:
+        notes_to_highlight: List of (string_name, fret) tuples
+        highlight_classes: Dict mapping note names to CSS highlight classes
+        use_sharp: If True, use sharp notation, otherwise flat
+
+    Returns:
+        Tuple usable as build_pattern(*key) and as a dict key
+    """
+    return (tuple((s, f) for s, f in notes_to_highlight),
+            tuple(sorted((highlight_classes or {}).items())), bool(use_sharp))
+
+
+@lru_cache(maxsize=128)
+def build_pattern(notes, highlight_items, use_sharp):
+    """
+    Build the displayNotes payload for a pattern. Memoized, so re-displaying
+    a part (part navigation, view reloads) skips the note name lookups.
+
+    Args:
+        notes: Tuple of (string_name, fret) tuples
+        highlight_items: Sorted tuple of (note_name, css_class) pairs
+        use_sharp: If True, use sharp notation, otherwise flat
+
+    Returns:
+        Tuple of note dicts for main.js. Treat as read-only.
+    """
+    highlight_classes = dict(highlight_items)
+
+    # Select the appropriate note mapping based on sharp/flat preference
+    fretboard_notes = FRETBOARD_NOTES_SHARP if use_sharp else FRETBOARD_NOTES_FLAT
+
+    scale_data = []
+    for s, f in notes:
+        string_num = STRING_ID.index(s)
+        note_name = fretboard_notes[string_num][f]
+
+        # Look up highlight class BEFORE converting to musical symbols
+        highlight_class = highlight_classes.get(note_name)
+
+        # Convert # and b to HTML musical symbols
+        note_name = note_name.replace('#', '♯').replace('b', '♭')
+
+        # Check specifically for flat symbol (needs tighter spacing)
+        has_flat = '♭' in note_name
+        scale_data.append({
+            'stringName': s,
+            'fret': f,
+            'highlight': highlight_class,
+            'noteName': note_name,
+            'hasFlat': has_flat
+        })
+    return tuple(scale_data)
@@ -1,13 +1,66 @@
 """
 Fretboard display component using QWebEngineView.
 Handles all JavaScript communication and fretboard visualization.
+
+Updates are sent to main.js through a QWebChannel bridge instead of
+string-built runJavaScript calls: signals carry lists and dicts that arrive
+in JavaScript as native arrays and objects, so nothing is compiled, quoted
+or re-parsed per call. Updates made in the same event loop iteration are
+batched into one signal and applied by the page in one animation frame.
 """
 
 import os
-import json
-from PySide6.QtCore import QUrl, Signal, Slot
+import time
+from collections import OrderedDict
+from PySide6.QtCore import QObject, QTimer, QUrl, Signal, Slot
+from PySide6.QtWebChannel import QWebChannel
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from constants import FRETBOARD_NOTES_SHARP, FRETBOARD_NOTES_FLAT, STRING_ID
+from constants import STRING_ID
+from ui.fretboard_pattern import build_pattern, pattern_key
+from timing_stats import TimingStat
+
+# Number of drawn patterns the page keeps for instant re-display
+PAGE_PATTERN_CACHE_SIZE = 32
+
+# How often the page reports its timing stats and the bridge is pinged
+STATS_INTERVAL_MS = 1000
+# Pings unanswered for this many ping intervals are dropped as lost
+PING_EXPIRY_INTERVALS = 5
+
+
+class FretboardBridge(QObject):
+    """
+    Object shared with main.js over QWebChannel as 'fretboard'.
+
+    Python -> JS: the updates signal carries a list of [name, args] pairs,
+    e.g. [['displayNotes', [pattern]], ['setTitle', ['C Major']]].
+    JS -> Python: the page calls page_ready() once the channel is connected
+    and the fretboard has been drawn, pong() to answer a 'ping' update and
+    report_stats() with its timing stats when they are enabled.
+    """
+
+    updates = Signal(list)
+
+    # Emitted when the page reports that it can receive updates
+    ready = Signal()
+
+    # Emitted with the sequence number of an answered ping
+    ponged = Signal(int)
+
+    # Emitted with the timing stats reported by the page
+    stats = Signal(dict)
+
+    @Slot()
+    def page_ready(self):
+        self.ready.emit()
+
+    @Slot(int)
+    def pong(self, seq):
+        self.ponged.emit(seq)
+
+    @Slot('QVariantMap')
+    def report_stats(self, stats):
+        self.stats.emit(stats)
 
 
 class FretboardView(QWebEngineView):
@@ -16,25 +69,108 @@ class FretboardView(QWebEngineView):
     Provides a clean API for highlighting notes and updating the display.
     """
 
-    # Signal emitted when the web view has finished loading
+    # Signal emitted when the page and its QWebChannel bridge are ready
     view_loaded = Signal()
 
+    # Emitted with timing_stats() whenever the page reports new stats
+    stats_updated = Signal(dict)
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Updates wait here until the page is ready and the next flush
+        self._pending_updates = []
+        self._page_ready = False
+        self._flush_scheduled = False
+
+        # (string_name, fret) pairs currently active on the page, so each
+        # highlight only sends the notes that turn on or off
+        self._active_notes = set()
+
+        # Notes of each play sequence step, as uploaded by set_step_table()
+        self._step_notes = []
+
+        # Patterns drawn and cached by the page: display key -> pattern id
+        self._page_patterns = OrderedDict()
+        self._next_pattern_id = 0
+
+        # Timing stats, see enable_stats()
+        self._stats_interval_ms = 0
+        self._page_stats = None
+        self._round_trip = TimingStat()
+        self._pings = {}  # seq -> perf_counter() when queued
+        self._next_ping = 0
+        self._ping_timer = QTimer(self)
+        self._ping_timer.timeout.connect(self._send_ping)
+
+        # Expose the bridge to main.js before the page loads
+        self._bridge = FretboardBridge(self)
+        self._bridge.ready.connect(self._on_page_ready)
+        self._bridge.ponged.connect(self._on_pong)
+        self._bridge.stats.connect(self._on_page_stats)
+        self._channel = QWebChannel(self.page())
+        self._channel.registerObject('fretboard', self._bridge)
+        self.page().setWebChannel(self._channel)
+
+        # Connect internal signals
+        self.loadStarted.connect(self._on_load_started)
+        self.loadFinished.connect(self._on_load_finished)
+
         # Load the fretboard HTML
         html_path = os.path.abspath("fretboard.html")
         self.load(QUrl.fromLocalFile(html_path))
         self.setZoomFactor(0.9)
 
-        # Connect internal signal
-        self.loadFinished.connect(self._on_load_finished)
-
     @Slot()
-    def _on_load_finished(self):
+    def _on_load_started(self):
+        self._page_ready = False
+        self._active_notes = set()
+        self._page_patterns.clear()
+        self._pings.clear()
+
+    @Slot(bool)
+    def _on_load_finished(self, ok):
         """Called when the web view finishes loading."""
-        print("Fretboard view loaded successfully")
+        if ok:
+            print("Fretboard view loaded successfully")
+        else:
+            print("Error: Fretboard view failed to load")
+
+    @Slot()
+    def _on_page_ready(self):
+        """Called by main.js through the bridge once it can receive updates."""
+        print("Fretboard bridge connected")
+        self._page_ready = True
+        if self._stats_interval_ms:
+            # A reloaded page starts with stats disabled
+            self._queue_update('setStatsInterval', self._stats_interval_ms)
         self.view_loaded.emit()
+        self._schedule_flush()
+
+    def _queue_update(self, name, *args):
+        """
+        Queue a call of the update handler `name` in main.js.
+
+        Args:
+            name: Handler name, e.g. 'displayNotes'
+            *args: Handler arguments (JSON-compatible Python values)
+        """
+        self._pending_updates.append([name, list(args)])
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._page_ready and self._pending_updates and not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_updates)
+
+    @Slot()
+    def _flush_updates(self):
+        """Send all queued updates to the page as one batch."""
+        self._flush_scheduled = False
+        if not self._page_ready or not self._pending_updates:
+            return
+        updates, self._pending_updates = self._pending_updates, []
+        self._bridge.updates.emit(updates)
 
     def display_notes(self, notes_to_highlight, highlight_classes=None, use_sharp=True):
         """
@@ -46,60 +182,110 @@ class FretboardView(QWebEngineView):
                              e.g., {'C': 'highlight1', 'E': 'highlight2'}
             use_sharp: If True, use sharp notation (C#, D#). If False, use flat notation (Db, Eb)
         """
-        if highlight_classes is None:
-            highlight_classes = {}
-
-        # Select the appropriate note mapping based on sharp/flat preference
-        fretboard_notes = FRETBOARD_NOTES_SHARP if use_sharp else FRETBOARD_NOTES_FLAT
-
-        scale_data = []
-        for s, f in notes_to_highlight:
-            string_num = STRING_ID.index(s)
-            note_name = fretboard_notes[string_num][f]
+        key = pattern_key(notes_to_highlight, highlight_classes, use_sharp)
 
-            # Look up highlight class BEFORE converting to musical symbols
-            highlight_class = highlight_classes.get(note_name)
+        # A new pattern is drawn with every note inactive
+        self._active_notes = set()
 
-            # Convert # and b to HTML musical symbols
-            note_name = note_name.replace('#', '♯').replace('b', '♭')
+        pattern_id = self._page_patterns.get(key)
+        if pattern_id is not None:
+            # The page still has this pattern drawn; just show it again
+            self._page_patterns.move_to_end(key)
+            self._queue_update('showPattern', pattern_id)
+            return
 
-            # Check specifically for flat symbol (needs tighter spacing)
-            has_flat = '♭' in note_name
-            scale_data.append({
-                'stringName': s,
-                'fret': f,
-                'highlight': highlight_class,
-                'noteName': note_name,
-                'hasFlat': has_flat
-            })
-
-        json_data = json.dumps(scale_data)
-        self.page().runJavaScript(f"displayNotes('{json_data}');")
+        self._next_pattern_id += 1
+        pattern_id = self._next_pattern_id
+        self._page_patterns[key] = pattern_id
+        if len(self._page_patterns) > PAGE_PATTERN_CACHE_SIZE:
+            _, old_id = self._page_patterns.popitem(last=False)
+            self._queue_update('forgetPattern', old_id)
+        self._queue_update('displayNotes', list(build_pattern(*key)), pattern_id)
 
     def highlight_notes(self, notes):
         """
         Highlight specific notes on the fretboard (active state).
 
+        Only the difference to the previous highlight is sent to the page.
+
         Args:
             notes: List of (string_name, fret) tuples to highlight
         """
-        notes_data = []
-        for note in notes:
-            if isinstance(note, tuple):
-                notes_data.append({
-                    'stringName': note[0],
-                    'fret': note[1]
-                })
+        active = {(note[0], note[1]) for note in notes if isinstance(note, tuple)}
+        notes_on = sorted(active - self._active_notes)
+        notes_off = sorted(self._active_notes - active)
+        self._active_notes = active
+        if notes_on or notes_off:
+            self._queue_update('updateHighlights',
+                               [list(n) for n in notes_on], [list(n) for n in notes_off])
 
-        json_data = json.dumps(notes_data)
-        js_code = f"highlightNotes('{json_data}');"
-        self.page().runJavaScript(js_code)
+    def set_step_table(self, play_sequence):
+        """
+        Upload the notes of every step of a part to the page once, so that
+        playback only needs to send step indices with highlight_step().
+
+        Bends in the play sequence, (string, fret, halftones) items, are
+        uploaded with their step and animated by the page when the step is
+        highlighted, so they follow the same timetable as the audio.
+
+        Args:
+            play_sequence: Part.play_sequence, e.g. [[('A', 3), 500], ...]
+        """
+        self._step_notes = [
+            [(item[0], item[1]) for item in step if isinstance(item, tuple)]
+            for step in play_sequence
+        ]
+        step_bends = [
+            [[STRING_ID.index(item[0]), item[1], item[2]]
+             for item in step if isinstance(item, tuple) and len(item) > 2]
+            for step in play_sequence
+        ]
+        self._queue_update('setStepTable', [[list(n) for n in notes] for notes in self._step_notes],
+                           step_bends)
+
+    def highlight_step(self, index):
+        """
+        Highlight the notes of one step of the uploaded step table.
+
+        Args:
+            index: Index into the play sequence passed to set_step_table()
+        """
+        if not 0 <= index < len(self._step_notes):
+            return
+        self._active_notes = set(self._step_notes[index])
+        self._queue_update('highlightStep', index)
+
+    def start_clock(self, onsets_ms):
+        """
+        Let the page drive highlights from its own animation-frame clock.
+
+        The page highlights step i of the step table once its clock reaches
+        onsets_ms[i]. The clock starts at the first sync_clock() call.
+
+        Args:
+            onsets_ms: Start time of each step in ms, from AudioEngine.step_onsets_ms
+        """
+        self._queue_update('startClock', list(onsets_ms))
+
+    def sync_clock(self, audio_ms):
+        """
+        Anchor or correct the page clock with the current audio position.
+
+        Args:
+            audio_ms: Audio position in ms (AudioEngine.audio_clock)
+        """
+        self._queue_update('syncClock', audio_ms)
+
+    def stop_clock(self):
+        """Stop the page clock started by start_clock()."""
+        self._queue_update('stopClock')
 
     def clear_note_highlights(self):
         """
         Clear all active note highlights on the fretboard.
         """
-        self.page().runJavaScript("clearNoteHighlights();")
+        self._active_notes = set()
+        self._queue_update('clearNoteHighlights')
 
     def set_title(self, title):
         """
@@ -108,10 +294,7 @@ class FretboardView(QWebEngineView):
         Args:
             title: String to display as the main title
         """
-        # Escape single quotes in the title for JavaScript
-        escaped_title = title.replace("'", "\\'")
-        js_code = f"document.querySelector('.fretboard-title').textContent = '{escaped_title}';"
-        self.page().runJavaScript(js_code)
+        self._queue_update('setTitle', title)
 
     def set_subtitle(self, subtitle):
         """
@@ -120,7 +303,80 @@ class FretboardView(QWebEngineView):
         Args:
             subtitle: String to display as the subtitle
         """
-        # Escape single quotes in the subtitle for JavaScript
-        escaped_subtitle = subtitle.replace("'", "\\'")
-        js_code = f"document.querySelector('.fretboard-subtitle').textContent = '{escaped_subtitle}';"
-        self.page().runJavaScript(js_code)
+        self._queue_update('setSubtitle', subtitle)
+
+    def bend_note(self, string_name, fret, halftones):
+        """
+        Animate a string bend on the fretboard.
+
+        Args:
+            string_name: Name of the string (e.g., 'G')
+            fret: Fret number of the bent note
+            halftones: 1 for a half-tone bend, 2 for a whole-tone bend
+        """
+        self._queue_update('bendNote', STRING_ID.index(string_name), fret, halftones)
+
+    def enable_stats(self, interval_ms=STATS_INTERVAL_MS):
+        """
+        Start timing the page and the bridge.
+
+        Every interval the page sends the time spent in each update handler,
+        the wait from receiving an update to applying it in a frame, its
+        frame intervals and, in page-clock mode, how late steps are
+        highlighted. The bridge is pinged at the same interval to measure
+        the round trip from queuing an update to the page answering it.
+
+        Args:
+            interval_ms: Reporting interval in ms
+        """
+        self._stats_interval_ms = interval_ms
+        self._page_stats = None
+        self._round_trip.reset()
+        self._pings.clear()
+        self._queue_update('setStatsInterval', interval_ms)
+        self._ping_timer.start(interval_ms)
+
+    def disable_stats(self):
+        """Stop the timing started by enable_stats()."""
+        self._stats_interval_ms = 0
+        self._ping_timer.stop()
+        self._queue_update('setStatsInterval', 0)
+
+    def timing_stats(self):
+        """
+        Latest timing stats of the page and the bridge.
+
+        Returns:
+            Dict with 'page', the last report of main.js (None before the
+            first one): 'handlers' per update name, 'queue_delay', 'frames',
+            'long_frames', 'step_lateness' and 'clock_drift', each a
+            {'count', 'mean_ms', 'max_ms'} dict except long_frames; and
+            'bridge_round_trip', the TimingStat summary of the pings
+        """
+        return {
+            'page': self._page_stats,
+            'bridge_round_trip': self._round_trip.summary(),
+        }
+
+    def _send_ping(self):
+        if not self._page_ready:
+            return
+        now = time.perf_counter()
+        # A page that stopped answering would otherwise grow _pings forever
+        expired = now - PING_EXPIRY_INTERVALS * self._ping_timer.interval() / 1000.0
+        for seq in [seq for seq, sent in self._pings.items() if sent < expired]:
+            del self._pings[seq]
+        self._next_ping += 1
+        self._pings[self._next_ping] = now
+        self._queue_update('ping', self._next_ping)
+
+    @Slot(int)
+    def _on_pong(self, seq):
+        sent = self._pings.pop(seq, None)
+        if sent is not None:
+            self._round_trip.add((time.perf_counter() - sent) * 1000.0)
+
+    @Slot(dict)
+    def _on_page_stats(self, stats):
+        self._page_stats = stats
+        self.stats_updated.emit(self.timing_stats())
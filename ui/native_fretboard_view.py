@@ -0,0 +1,460 @@
+"""
+Fretboard display component drawn natively with QGraphicsScene.
+
+Alternative to FretboardView for machines where starting QtWebEngine (a
+Chromium process per view) is too slow or too heavy. The public API and
+signals are the same, so FretboardPlayer works with either view.
+
+The static board (frets, strings, inlays, labels) is painted once with
+QPainter into a pixmap. Note markers are pixmap items whose pixmaps are
+cached per colour, state and label, so highlighting a note only swaps a
+pixmap and repaints its rectangle.
+"""
+
+from collections import OrderedDict
+from PySide6.QtCore import Qt, QElapsedTimer, QPointF, QRectF, QTimer, QVariantAnimation, Signal
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import QGraphicsPixmapItem, QGraphicsScene, QGraphicsSimpleTextItem, QGraphicsView
+from constants import STRING_ID, BEND_RISE_MS, BEND_HOLD_MS, BEND_RELEASE_MS
+from ui.fretboard_pattern import build_pattern, pattern_key
+
+# Geometry, matching the table layout of fretboard.html
+NUM_FRETS = 24
+MARGIN = 20
+HEADER_HEIGHT = 70
+LABEL_WIDTH = 40
+NUT_WIDTH = 8
+ROW_HEIGHT = 35
+FOOTER_HEIGHT = 24
+FIRST_FRET_WIDTH = 80
+FRET_WIDTH_FACTOR = 0.97
+NOTE_SIZE = 30
+MARKER_SIZE = 18
+SINGLE_MARKERS = (3, 5, 7, 9, 15, 17, 19, 21)
+DOUBLE_MARKERS = (12, 24)
+STRING_WIDTHS = (2.1, 2.4, 2.7, 3.0, 3.3, 3.6)
+VIEW_SCALE = 0.9
+FONT_FAMILY = 'Montserrat'
+
+# Number of drawn patterns kept for instant re-display
+PATTERN_CACHE_SIZE = 32
+
+CLOCK_INTERVAL_MS = 16
+CLOCK_DRIFT_TOLERANCE_MS = 8
+
+# (active background, active text, inactive background, inactive text)
+NOTE_COLORS = {
+    None: ('#444', '#fff', '#bcbcbc', '#000'),
+    'highlight1': ('#e74c3c', '#fff', '#fec1bb', '#000'),
+    'highlight2': ('#8e44ad', '#fff', '#c39bd3', '#fff'),
+    'highlight3': ('#3498db', '#fff', '#aed6f1', '#fff'),
+}
+
+
+def _fret_edges():
+    """x positions of the nut and every fret wire, left to right."""
+    edges = [MARGIN + LABEL_WIDTH + NUT_WIDTH]
+    width = FIRST_FRET_WIDTH
+    for _ in range(NUM_FRETS):
+        edges.append(edges[-1] + width)
+        width *= FRET_WIDTH_FACTOR
+    return edges
+
+
+FRET_EDGES = _fret_edges()
+BOARD_TOP = MARGIN + HEADER_HEIGHT
+BOARD_WIDTH = FRET_EDGES[-1] + MARGIN
+BOARD_HEIGHT = BOARD_TOP + ROW_HEIGHT * len(STRING_ID) + FOOTER_HEIGHT + MARGIN
+
+
+def _note_center(string_name, fret):
+    row = STRING_ID.index(string_name)
+    y = BOARD_TOP + row * ROW_HEIGHT + ROW_HEIGHT / 2
+    if fret == 0:
+        # Open strings are shown in the string label column
+        x = MARGIN + LABEL_WIDTH / 2
+    else:
+        x = (FRET_EDGES[fret - 1] + FRET_EDGES[fret]) / 2
+    return QPointF(x, y)
+
+
+def _font(pixel_size, bold=False):
+    font = QFont(FONT_FAMILY)
+    font.setStyleHint(QFont.SansSerif)
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
+
+
+class NativeFretboardView(QGraphicsView):
+    """
+    QGraphicsView drop-in for FretboardView.
+
+    Signals:
+        view_loaded: Emitted once the board is drawn and can take updates
+    """
+
+    view_loaded = Signal()
+
+    # Same signal as FretboardView; never emitted, there is no page to time
+    stats_updated = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing | QPainter.SmoothPixmapTransform)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setBackgroundBrush(QColor('#fff'))
+        self.scale(VIEW_SCALE, VIEW_SCALE)
+
+        self._scene = QGraphicsScene(0, 0, BOARD_WIDTH, BOARD_HEIGHT, self)
+        self.setScene(self._scene)
+
+        # (background, text, label, dpr) -> QPixmap
+        self._note_pixmaps = {}
+        self._background = QGraphicsPixmapItem()
+        self._background.setTransformationMode(Qt.SmoothTransformation)
+        self._scene.addItem(self._background)
+
+        self._title = QGraphicsSimpleTextItem()
+        self._title.setFont(_font(24, bold=True))
+        self._title.setPos(MARGIN + LABEL_WIDTH + NUT_WIDTH, MARGIN)
+        self._subtitle = QGraphicsSimpleTextItem()
+        self._subtitle.setFont(_font(16))
+        self._subtitle.setBrush(QColor('#666'))
+        self._subtitle.setPos(MARGIN + LABEL_WIDTH + NUT_WIDTH, MARGIN + 34)
+        self._scene.addItem(self._title)
+        self._scene.addItem(self._subtitle)
+
+        # pattern key -> {(string_name, fret): (item, note dict)}; hidden when not shown
+        self._patterns = OrderedDict()
+        self._current = {}
+        self._active_notes = set()
+        self._step_notes = []
+        self._step_bends = []
+
+        self._clock = QElapsedTimer()
+        self._clock_timer = QTimer(self)
+        self._clock_timer.setTimerType(Qt.PreciseTimer)
+        self._clock_timer.setInterval(CLOCK_INTERVAL_MS)
+        self._clock_timer.timeout.connect(self._tick_clock)
+        self._onsets_ms = []
+        self._clock_origin_ms = None
+        self._next_step = 0
+        self._bend_animations = []
+
+        self._draw_background()
+        QTimer.singleShot(0, self.view_loaded.emit)
+
+    def _dpr(self):
+        return self.devicePixelRatioF() or 1.0
+
+    def _draw_background(self):
+        """Paint the static board into one pixmap at the device pixel ratio."""
+        dpr = self._dpr()
+        pixmap = QPixmap(int(BOARD_WIDTH * dpr), int(BOARD_HEIGHT * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QColor('#fff'))
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        left = FRET_EDGES[0]
+        right = FRET_EDGES[-1]
+        bottom = BOARD_TOP + ROW_HEIGHT * len(STRING_ID)
+
+        # Inlay markers, drawn on the fret wire rows like the HTML board
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor('#e3e3e3'))
+        r = MARKER_SIZE / 2
+        for fret in SINGLE_MARKERS + DOUBLE_MARKERS:
+            x = (FRET_EDGES[fret - 1] + FRET_EDGES[fret]) / 2
+            rows = (3,) if fret in SINGLE_MARKERS else (1, 5)
+            for row in rows:
+                painter.drawEllipse(QPointF(x, BOARD_TOP + row * ROW_HEIGHT), r, r)
+
+        painter.setPen(QPen(QColor('#ccc'), 1))
+        painter.drawLine(QPointF(left, BOARD_TOP), QPointF(right, BOARD_TOP))
+        painter.drawLine(QPointF(left, bottom), QPointF(right, bottom))
+        painter.setPen(QPen(QColor('#525151'), 1))
+        for x in FRET_EDGES[1:]:
+            painter.drawLine(QPointF(x, BOARD_TOP), QPointF(x, bottom))
+        painter.fillRect(QRectF(left - NUT_WIDTH, BOARD_TOP, NUT_WIDTH, bottom - BOARD_TOP), QColor('#333'))
+
+        painter.setFont(_font(14, bold=True))
+        for row, (name, width) in enumerate(zip(STRING_ID, STRING_WIDTHS)):
+            y = BOARD_TOP + row * ROW_HEIGHT + ROW_HEIGHT / 2
+            painter.setPen(QPen(QColor('#a9a9a9'), width))
+            painter.drawLine(QPointF(left, y), QPointF(right, y))
+            painter.setPen(QColor('#000'))
+            painter.drawText(QRectF(MARGIN, y - ROW_HEIGHT / 2, LABEL_WIDTH, ROW_HEIGHT),
+                             Qt.AlignCenter, name)
+
+        painter.setFont(_font(12))
+        painter.setPen(QColor('#666'))
+        painter.drawText(QRectF(MARGIN, bottom, LABEL_WIDTH, FOOTER_HEIGHT), Qt.AlignCenter, '0')
+        for fret in range(1, NUM_FRETS + 1):
+            rect = QRectF(FRET_EDGES[fret - 1], bottom, FRET_EDGES[fret] - FRET_EDGES[fret - 1], FOOTER_HEIGHT)
+            painter.drawText(rect, Qt.AlignCenter, str(fret))
+        painter.end()
+
+        self._background.setPixmap(pixmap)
+
+    def _note_pixmap(self, highlight, active, label, has_flat):
+        """Cached marker pixmap for one colour, state and label."""
+        colors = NOTE_COLORS.get(highlight, NOTE_COLORS[None])
+        background, text = colors[:2] if active else colors[2:]
+        dpr = self._dpr()
+        key = (background, text, label, dpr)
+        pixmap = self._note_pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        size = int(NOTE_SIZE * dpr)
+        pixmap = QPixmap(size, size)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(background))
+        painter.drawEllipse(QRectF(0, 0, NOTE_SIZE, NOTE_SIZE))
+        font = _font(12 if has_flat else 13, bold=True)
+        if has_flat:
+            font.setLetterSpacing(QFont.AbsoluteSpacing, -1)
+        painter.setFont(font)
+        painter.setPen(QColor(text))
+        painter.drawText(QRectF(0, 0, NOTE_SIZE, NOTE_SIZE), Qt.AlignCenter, label)
+        painter.end()
+
+        self._note_pixmaps[key] = pixmap
+        return pixmap
+
+    def _set_note_state(self, key, active):
+        entry = self._current.get(key)
+        if entry is None:
+            return
+        item, note = entry
+        item.setPixmap(self._note_pixmap(note['highlight'], active, note['noteName'], note['hasFlat']))
+
+    def _hide_current(self):
+        for item, _ in self._current.values():
+            item.setVisible(False)
+        self._current = {}
+
+    def display_notes(self, notes_to_highlight, highlight_classes=None, use_sharp=True):
+        """
+        Display notes on the fretboard in an inactive state.
+
+        Args:
+            notes_to_highlight: List of (string_name, fret) tuples
+            highlight_classes: Dict mapping note names to CSS highlight classes
+                             e.g., {'C': 'highlight1', 'E': 'highlight2'}
+            use_sharp: If True, use sharp notation (C#, D#). If False, use flat notation (Db, Eb)
+        """
+        key = pattern_key(notes_to_highlight, highlight_classes, use_sharp)
+        self._hide_current()
+        self._active_notes = set()
+
+        items = self._patterns.get(key)
+        if items is not None:
+            self._patterns.move_to_end(key)
+        else:
+            items = {}
+            for note in build_pattern(*key):
+                item = QGraphicsPixmapItem()
+                item.setTransformationMode(Qt.SmoothTransformation)
+                item.setOffset(-NOTE_SIZE / 2, -NOTE_SIZE / 2)
+                item.setPos(_note_center(note['stringName'], note['fret']))
+                item.setZValue(2)
+                self._scene.addItem(item)
+                items[(note['stringName'], note['fret'])] = (item, note)
+            self._patterns[key] = items
+            if len(self._patterns) > PATTERN_CACHE_SIZE:
+                _, old_items = self._patterns.popitem(last=False)
+                for item, _ in old_items.values():
+                    self._scene.removeItem(item)
+
+        self._current = items
+        for note_key, (item, _) in items.items():
+            self._set_note_state(note_key, False)
+            item.setVisible(True)
+
+    def highlight_notes(self, notes):
+        """
+        Highlight specific notes on the fretboard (active state).
+
+        Args:
+            notes: List of (string_name, fret) tuples to highlight
+        """
+        active = {(note[0], note[1]) for note in notes if isinstance(note, tuple)}
+        for key in self._active_notes - active:
+            self._set_note_state(key, False)
+        for key in active - self._active_notes:
+            self._set_note_state(key, True)
+        self._active_notes = active
+
+    def set_step_table(self, play_sequence):
+        """
+        Keep the notes and bends of every step of a part for highlight_step().
+
+        Args:
+            play_sequence: Part.play_sequence, e.g. [[('A', 3), 500], ...]
+        """
+        self._step_notes = [
+            [(item[0], item[1]) for item in step if isinstance(item, tuple)]
+            for step in play_sequence
+        ]
+        self._step_bends = [
+            [item for item in step if isinstance(item, tuple) and len(item) > 2]
+            for step in play_sequence
+        ]
+
+    def highlight_step(self, index):
+        """
+        Highlight the notes of one step of the step table and start its bends.
+
+        Args:
+            index: Index into the play sequence passed to set_step_table()
+        """
+        if 0 <= index < len(self._step_notes):
+            self.highlight_notes(self._step_notes[index])
+            for string_name, fret, halftones in self._step_bends[index]:
+                self.bend_note(string_name, fret, halftones)
+
+    def start_clock(self, onsets_ms):
+        """
+        Drive highlights from a local clock, like the page clock of FretboardView.
+
+        Step i is highlighted once the clock reaches onsets_ms[i]. The clock
+        starts at the first sync_clock() call.
+
+        Args:
+            onsets_ms: Start time of each step in ms, from AudioEngine.step_onsets_ms
+        """
+        self._clock_timer.stop()
+        self._onsets_ms = list(onsets_ms)
+        self._clock_origin_ms = None
+        self._next_step = 0
+
+    def sync_clock(self, audio_ms):
+        """
+        Anchor or correct the clock with the current audio position.
+
+        Args:
+            audio_ms: Audio position in ms (AudioEngine.audio_clock)
+        """
+        if not self._onsets_ms:
+            return
+        if self._clock_origin_ms is None:
+            self._clock.start()
+            self._clock_origin_ms = audio_ms
+            self._clock_timer.start()
+            self._tick_clock()
+            return
+        drift = audio_ms - self._clock_ms()
+        if abs(drift) > CLOCK_DRIFT_TOLERANCE_MS:
+            self._clock_origin_ms += drift
+
+    def _clock_ms(self):
+        return self._clock_origin_ms + self._clock.nsecsElapsed() / 1e6
+
+    def _tick_clock(self):
+        now = self._clock_ms()
+        step = self._next_step
+        # Steps only move forward; a late tick jumps to the current step
+        while step < len(self._onsets_ms) and self._onsets_ms[step] <= now:
+            step += 1
+        if step != self._next_step:
+            self._next_step = step
+            self.highlight_step(step - 1)
+        if step >= len(self._onsets_ms):
+            self._clock_timer.stop()
+
+    def stop_clock(self):
+        """Stop the clock started by start_clock()."""
+        self._clock_timer.stop()
+        self._onsets_ms = []
+        self._clock_origin_ms = None
+
+    def clear_note_highlights(self):
+        """
+        Clear all active note highlights on the fretboard.
+        """
+        for key in self._active_notes:
+            self._set_note_state(key, False)
+        self._active_notes = set()
+
+    def set_title(self, title):
+        """
+        Set the title text on the fretboard.
+
+        Args:
+            title: String to display as the main title
+        """
+        self._title.setText(title)
+
+    def set_subtitle(self, subtitle):
+        """
+        Set the subtitle text on the fretboard.
+
+        Args:
+            subtitle: String to display as the subtitle
+        """
+        self._subtitle.setText(subtitle)
+
+    def bend_note(self, string_name, fret, halftones):
+        """
+        Animate a string bend by pushing the note marker towards the low E
+        string, one string spacing per halftone, holding and releasing it.
+        Follows the same envelope as the audio glide and main.js.
+
+        Args:
+            string_name: Name of the string (e.g., 'G')
+            fret: Fret number of the bent note
+            halftones: 1 for a half-tone bend, 2 for a whole-tone bend
+        """
+        entry = self._current.get((string_name, fret))
+        if entry is None:
+            return
+        item = entry[0]
+        rest = _note_center(string_name, fret)
+        distance = halftones * ROW_HEIGHT
+
+        def offset(ms):
+            if ms < BEND_RISE_MS:
+                t = ms / BEND_RISE_MS
+                return distance * (1.0 - (1.0 - t) ** 2)  # ease out
+            ms -= BEND_RISE_MS + BEND_HOLD_MS
+            if ms < 0:
+                return distance
+            t = min(ms / BEND_RELEASE_MS, 1.0)
+            return distance * (1.0 - t * t)  # ease in
+
+        animation = QVariantAnimation(self)
+        animation.setDuration(BEND_RISE_MS + BEND_HOLD_MS + BEND_RELEASE_MS)
+        animation.setStartValue(0.0)
+        animation.setEndValue(float(animation.duration()))
+        animation.valueChanged.connect(lambda ms: item.setPos(rest.x(), rest.y() + offset(ms)))
+        animation.finished.connect(lambda: item.setPos(rest))
+        animation.finished.connect(lambda: self._bend_animations.remove(animation))
+        self._bend_animations.append(animation)
+        item.setZValue(3)
+        animation.finished.connect(lambda: item.setZValue(2))
+        animation.start()
+
+    def enable_stats(self, interval_ms=1000):
+        """
+        Present for API parity with FretboardView. The native view draws in
+        the GUI thread with no page or bridge in between, so there is
+        nothing to time here; see AudioEngine.timing_stats() instead.
+        """
+
+    def disable_stats(self):
+        """Present for API parity with FretboardView."""
+
+    def timing_stats(self):
+        """
+        Returns:
+            The FretboardView.timing_stats() keys, all None
+        """
+        return {'page': None, 'bridge_round_trip': None}
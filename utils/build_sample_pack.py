@@ -0,0 +1,38 @@
+# Compress the per-note .wav files in ./clean into a single lossless .llpack file.
+# The app bundle can then ship the pack instead of the raw clean/ folder:
+#   --include-data-files=./clean.llpack=clean.llpack
+# Usage: python utils/build_sample_pack.py [input_dir] [output_file] [zlib|lzma]
+
+import os
+import sys
+
+# Add the parent directory to the Python path to allow for package-like imports
+# Needed since this file is in a subdirectory.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sample_pack import SamplePack, write_compressed_pack
+
+INPUT_DIR = 'clean'
+OUTPUT_FILE = 'clean.llpack'
+CODEC = 'lzma'
+
+if __name__ == "__main__":
+    input_dir = sys.argv[1] if len(sys.argv) > 1 else INPUT_DIR
+    output_file = sys.argv[2] if len(sys.argv) > 2 else OUTPUT_FILE
+    codec = sys.argv[3] if len(sys.argv) > 3 else CODEC
+
+    if not os.path.isdir(input_dir):
+        print(f"Error: Input directory '{input_dir}' not found. Exiting.")
+        sys.exit(1)
+
+    pack = SamplePack(input_dir)
+    pack.scan()
+    notes = pack.notes()
+    if not notes:
+        print(f"Error: No {pack.prefix}<midi>.wav samples found in '{input_dir}'. Exiting.")
+        sys.exit(1)
+
+    raw_size = sum(os.path.getsize(pack.path_for(n)) for n in notes)
+    packed_size = write_compressed_pack(pack, output_file, codec=codec)
+    print(f"Packed {len(notes)} notes from '{input_dir}' into '{output_file}' ({codec})")
+    print(f"  {raw_size/1e6:.2f} MB -> {packed_size/1e6:.2f} MB ({packed_size/raw_size:.1%})")
@@ -7,6 +7,16 @@ Functions
 
 `write`: Write a NumPy array as a WAV file.
 
+`WavWriter`: Write a WAV file incrementally, block by block.
+
+`iter_blocks`: Iterate over a WAV file in fixed-size blocks of frames.
+
+`info`: Return the format of a WAV file without reading its samples.
+
+`read_many`: Read several WAV files in parallel.
+
+`read_into`: Decode a WAV file into a preallocated array.
+
 """
 import io
 import os
@@ -14,12 +24,20 @@ import sys
 import numpy as np
 import struct
 import warnings
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
 
 
 __all__ = [
     'WavFileWarning',
+    'WavInfo',
+    'WavWriter',
+    'info',
+    'iter_blocks',
     'read',
+    'read_into',
+    'read_many',
     'write'
 ]
 
@@ -444,8 +462,165 @@ def _read_fmt_chunk(fid, is_big_endian):
             bit_depth)
 
 
+def _data_dtype(format_tag, bit_depth, bytes_per_sample, fmt):
+    """
+    Returns
+    -------
+    dtype : str
+        NumPy dtype of the samples in the data chunk, or 'V1' for container
+        sizes without a compatible dtype (3, 5, 6 or 7 bytes), which are read
+        as raw bytes and rearranged by _unpack_packed().
+    """
+    if format_tag == WAVE_FORMAT.PCM:
+        if 1 <= bit_depth <= 8:
+            return 'u1'  # WAV of 8-bit integer or less are unsigned
+        elif bytes_per_sample in {3, 5, 6, 7}:
+            # No compatible dtype.  Load as raw bytes for reshaping later.
+            return 'V1'
+        elif bit_depth <= 64:
+            # Remaining bit depths can map directly to signed numpy dtypes
+            return f'{fmt}i{bytes_per_sample}'
+        else:
+            raise ValueError("Unsupported bit depth: the WAV file "
+                             f"has {bit_depth}-bit integer data.")
+    elif format_tag == WAVE_FORMAT.IEEE_FLOAT:
+        if bit_depth in {32, 64}:
+            return f'{fmt}f{bytes_per_sample}'
+        else:
+            raise ValueError("Unsupported bit depth: the WAV file "
+                             f"has {bit_depth}-bit floating-point data.")
+    else:
+        _raise_bad_format(format_tag)
+
+
+def _unpack_packed(data, bytes_per_sample, is_big_endian):
+    """
+    Rearrange raw 'V1' bytes into the smallest compatible numpy dtype,
+    left-justified (e.g. 24-bit samples become the top 3 bytes of an int32).
+    """
+    fmt = '>' if is_big_endian else '<'
+    dt = f'{fmt}i4' if bytes_per_sample == 3 else f'{fmt}i8'
+    out = np.empty(len(data) // bytes_per_sample, dtype=dt)
+    _unpack_packed_into(data[:out.size * bytes_per_sample], bytes_per_sample,
+                        is_big_endian, out)
+    return out
+
+
+def _unpack_packed_into(data, bytes_per_sample, is_big_endian, out):
+    """
+    Like _unpack_packed, but write the left-justified samples into the
+    integer array `out` (int32 for 3-byte, int64 for 5 to 7-byte containers)
+    instead of allocating a new one.
+    """
+    src = data.view(np.uint8)
+    n = len(out)
+    if bytes_per_sample == 3 and n > 1:
+        # Read each sample as an overlapping 4-byte word (3 bytes of the
+        # sample plus the first byte of the next one) and drop the extra
+        # byte with one shift or mask: a single vectorized pass.
+        fmt = '>' if is_big_endian else '<'
+        words = np.lib.stride_tricks.as_strided(src[:4].view(f'{fmt}i4'),
+                                                shape=(n - 1,), strides=(3,))
+        if is_big_endian:
+            np.bitwise_and(words, -256, out=out[:n - 1])
+        else:
+            np.left_shift(words, 8, out=out[:n - 1])
+        # The last sample has no following byte to borrow
+        src, out = src[-3:], out[n - 1:]
+
+    width = out.dtype.itemsize
+    dst = out.view(np.uint8).reshape(-1, width)
+    src = src.reshape(-1, bytes_per_sample)
+    # Work in little-endian byte order: column 0 is the least significant
+    if is_big_endian:
+        src = src[:, ::-1]
+    if out.dtype.byteorder == '>' or (out.dtype.byteorder == '=' and
+                                      sys.byteorder == 'big'):
+        dst = dst[:, ::-1]
+    dst[:, :width - bytes_per_sample] = 0
+    dst[:, width - bytes_per_sample:] = src
+
+
+def _readinto(fid, buf):
+    """Fill the writable bytes-like `buf` from `fid`; return the number of bytes read."""
+    view = memoryview(buf).cast('B')
+    if not hasattr(fid, 'readinto'):
+        data = fid.read(len(view))
+        view[:len(data)] = data
+        return len(data)
+    total = 0
+    while total < len(view):
+        n = fid.readinto(view[total:])
+        if not n:
+            break
+        total += n
+    return total
+
+
+def _convert_into(src, out):
+    """
+    Copy samples into `out`, scaling integers to [-1, 1) when `out` is
+    floating point (same convention as _to_dtype). No temporaries are
+    allocated beyond numpy's internal casting buffers.
+    """
+    if out.dtype.kind == 'f' and src.dtype.kind in 'iu':
+        if src.dtype.kind == 'u':
+            np.subtract(src, out.dtype.type(128), out=out)
+            out *= out.dtype.type(1.0 / 128)
+        else:
+            scale = out.dtype.type(1.0 / 2 ** (src.dtype.itemsize * 8 - 1))
+            np.multiply(src, scale, out=out, casting='unsafe')
+    else:
+        np.copyto(out, src, casting='same_kind')
+
+
+# Frames decoded per pass when read_into has to convert samples
+READ_INTO_BLOCK_FRAMES = 65536
+
+
+def _decode_into(fid, dest, file_dtype, bytes_per_sample, is_big_endian,
+                 block_samples):
+    """
+    Read len(dest) samples of `file_dtype` from `fid` into the flat array
+    `dest`, converting with _convert_into through a scratch buffer of at
+    most `block_samples` samples. Returns the number of bytes read, which
+    is short if the file ends early.
+    """
+    if file_dtype != 'V1' and np.dtype(file_dtype) == dest.dtype:
+        return _readinto(fid, dest)
+
+    block_samples = max(1, min(len(dest), block_samples))
+    scratch = np.empty(block_samples * bytes_per_sample, dtype=np.uint8)
+    unpacked = None
+    if file_dtype == 'V1':
+        int_dtype = np.dtype('i4' if bytes_per_sample == 3 else 'i8')
+        if dest.dtype != int_dtype:
+            unpacked = np.empty(block_samples, dtype=int_dtype)
+
+    nbytes = 0
+    for first in range(0, len(dest), block_samples):
+        raw = scratch[:min(block_samples, len(dest) - first) * bytes_per_sample]
+        n = _readinto(fid, raw)
+        nbytes += n
+        count = n // bytes_per_sample
+        raw_samples = raw[:count * bytes_per_sample]
+        target = dest[first:first + count]
+        if file_dtype != 'V1':
+            _convert_into(raw_samples.view(file_dtype), target)
+        elif unpacked is None:
+            # unpack straight into dest
+            _unpack_packed_into(raw_samples, bytes_per_sample, is_big_endian, target)
+        else:
+            _unpack_packed_into(raw_samples, bytes_per_sample, is_big_endian,
+                                unpacked[:count])
+            _convert_into(unpacked[:count], target)
+        if n < len(raw):
+            break
+    return nbytes
+
+
 def _read_data_chunk(fid, format_tag, channels, bit_depth, is_big_endian, is_rf64,
-                     block_align, mmap=False, rf64_chunk_size=None):
+                     block_align, mmap=False, rf64_chunk_size=None, as_float=False):
     """
     Notes
     -----
@@ -488,29 +663,16 @@ def _read_data_chunk(fid, format_tag, channels, bit_depth, is_big_endian, is_rf6
     bytes_per_sample = block_align // channels
     n_samples = size // bytes_per_sample
 
-    if format_tag == WAVE_FORMAT.PCM:
-        if 1 <= bit_depth <= 8:
-            dtype = 'u1'  # WAV of 8-bit integer or less are unsigned
-        elif bytes_per_sample in {3, 5, 6, 7}:
-            # No compatible dtype.  Load as raw bytes for reshaping later.
-            dtype = 'V1'
-        elif bit_depth <= 64:
-            # Remaining bit depths can map directly to signed numpy dtypes
-            dtype = f'{fmt}i{bytes_per_sample}'
-        else:
-            raise ValueError("Unsupported bit depth: the WAV file "
-                             f"has {bit_depth}-bit integer data.")
-    elif format_tag == WAVE_FORMAT.IEEE_FLOAT:
-        if bit_depth in {32, 64}:
-            dtype = f'{fmt}f{bytes_per_sample}'
-        else:
-            raise ValueError("Unsupported bit depth: the WAV file "
-                             f"has {bit_depth}-bit floating-point data.")
-    else:
-        _raise_bad_format(format_tag)
+    dtype = _data_dtype(format_tag, bit_depth, bytes_per_sample, fmt)
 
     start = fid.tell()
-    if not mmap:
+    if as_float:
+        # Decode and scale in blocks straight into the float32 result
+        data = np.empty(n_samples, dtype=np.float32)
+        nbytes = _decode_into(fid, data, dtype, bytes_per_sample, is_big_endian,
+                              READ_INTO_BLOCK_FRAMES * channels)
+        data = data[:nbytes // bytes_per_sample]
+    elif not mmap:
         try:
             count = size if dtype == 'V1' else n_samples
             data = np.fromfile(fid, dtype=dtype, count=count)
@@ -519,15 +681,7 @@ def _read_data_chunk(fid, format_tag, channels, bit_depth, is_big_endian, is_rf6
             data = np.frombuffer(fid.read(size), dtype=dtype)
 
         if dtype == 'V1':
-            # Rearrange raw bytes into smallest compatible numpy dtype
-            dt = f'{fmt}i4' if bytes_per_sample == 3 else f'{fmt}i8'
-            a = np.zeros((len(data) // bytes_per_sample, np.dtype(dt).itemsize),
-                            dtype='V1')
-            if is_big_endian:
-                a[:, :bytes_per_sample] = data.reshape((-1, bytes_per_sample))
-            else:
-                a[:, -bytes_per_sample:] = data.reshape((-1, bytes_per_sample))
-            data = a.view(dt).reshape(a.shape[:-1])
+            data = _unpack_packed(data, bytes_per_sample, is_big_endian)
     else:
         if bytes_per_sample in {1, 2, 4, 8}:
             start = fid.tell()
@@ -612,7 +766,224 @@ def _handle_pad_byte(fid, size):
         fid.seek(1, 1)
 
 
-def read(filename, mmap=False):
+def _seek_data_chunk(fid):
+    """
+    Walk the RIFF chunks up to the samples of the data chunk.
+
+    Returns
+    -------
+    fs : int
+        sampling frequency in samples per second
+    format_tag : int
+        PCM or float
+    channels : int
+        number of channels
+    bit_depth : int
+        bits per sample
+    block_align : int
+        bytes per sample, including all channels
+    is_big_endian : bool
+        True for RIFX files
+    size : int
+        size of the data chunk in bytes
+
+    Notes
+    -----
+    Leaves the file pointer at the first byte of sample data.
+    """
+    file_size, is_big_endian, is_rf64, rf64_chunk_size = _read_riff_chunk(fid)
+    fmt = '>I' if is_big_endian else '<I'
+    fmt_chunk = None
+    while fid.tell() < file_size:
+        chunk_id = fid.read(4)
+        if len(chunk_id) < 4:
+            break
+        if chunk_id == b'fmt ':
+            fmt_chunk = _read_fmt_chunk(fid, is_big_endian)
+        elif chunk_id == b'data':
+            if fmt_chunk is None:
+                raise ValueError("No fmt chunk before data")
+            size = struct.unpack(fmt, fid.read(4))[0]
+            if is_rf64:
+                # chunk size is stored in global file header for RF64
+                size = rf64_chunk_size
+            format_tag, channels, fs = fmt_chunk[1:4]
+            block_align = fmt_chunk[5]
+            bit_depth = fmt_chunk[6]
+            return (fs, format_tag, channels, bit_depth, block_align,
+                    is_big_endian, size)
+        else:
+            _skip_unknown_chunk(fid, is_big_endian)
+    raise ValueError("Unexpected end of file: no data chunk found.")
+
+
+def _to_dtype(data, dtype):
+    """
+    Convert samples to the requested dtype. Integer samples converted to a
+    float dtype are scaled to [-1, 1), using the container size for
+    full scale (8-bit unsigned data is centred on 128 first).
+    """
+    dtype = np.dtype(dtype)
+    if data.dtype == dtype:
+        return data
+    if dtype.kind == 'f' and data.dtype.kind in 'iu':
+        if data.dtype.kind == 'u':
+            out = data.astype(dtype)
+            out -= 128
+            out /= 128
+            return out
+        out = data.astype(dtype)
+        out *= 1.0 / 2 ** (data.dtype.itemsize * 8 - 1)
+        return out
+    return data.astype(dtype)
+
+
+def iter_blocks(filename, blocksize, dtype=None):
+    """
+    Iterate over a WAV file in blocks of frames.
+
+    Only one block is held in memory at a time, so long backing tracks can be
+    streamed through a processing pipeline with a bounded memory footprint.
+
+    Parameters
+    ----------
+    filename : string or open file handle
+        Input WAV file. Non-seekable streams are supported.
+    blocksize : int
+        Number of frames per block. The last block may be shorter.
+    dtype : data-type, optional
+        Output data-type. By default blocks have the same dtype that
+        `read` would return. Integer data requested as a float dtype is
+        scaled to [-1, 1).
+
+    Yields
+    ------
+    data : numpy array
+        1-D for 1-channel WAV, or 2-D of shape (blocksize, Nchannels).
+
+    Notes
+    -----
+    Supports the same formats as `read`: integer PCM of any depth (including
+    packed 24-bit), 32/64-bit float, RIFX and RF64.
+
+    Examples
+    --------
+    >>> for block in wavfile.iter_blocks('backing.wav', 4096, dtype=np.float32):
+    ...     peak = max(peak, np.abs(block).max())
+    """
+    if blocksize < 1:
+        raise ValueError(f"blocksize must be positive, got {blocksize}")
+
+    if hasattr(filename, 'read'):
+        fid = filename
+    else:
+        fid = open(filename, 'rb')
+    if not fid.seekable():
+        fid = SeekEmulatingReader(fid)
+
+    try:
+        (fs, format_tag, channels, bit_depth, block_align,
+         is_big_endian, size) = _seek_data_chunk(fid)
+        fmt = '>' if is_big_endian else '<'
+        bytes_per_sample = block_align // channels
+        file_dtype = _data_dtype(format_tag, bit_depth, bytes_per_sample, fmt)
+
+        remaining = size - size % block_align
+        while remaining > 0:
+            raw = fid.read(min(blocksize * block_align, remaining))
+            if not raw:
+                warnings.warn("Reached EOF before the end of the data chunk.",
+                              WavFileWarning, stacklevel=2)
+                break
+            raw = raw[:len(raw) - len(raw) % block_align]
+            remaining -= len(raw)
+
+            data = np.frombuffer(raw, dtype=file_dtype)
+            if file_dtype == 'V1':
+                data = _unpack_packed(data, bytes_per_sample, is_big_endian)
+            if dtype is not None:
+                data = _to_dtype(data, dtype)
+            if channels > 1:
+                data = data.reshape(-1, channels)
+            yield data
+    finally:
+        if not hasattr(filename, 'read'):
+            fid.close()
+
+
+WavInfo = namedtuple('WavInfo', ['rate', 'channels', 'frames', 'bit_depth',
+                                 'format', 'data_offset'])
+WavInfo.__doc__ = """\
+Format of a WAV file as returned by `info`.
+
+rate : int
+    Sample rate of the file in samples/sec.
+channels : int
+    Number of channels.
+frames : int
+    Number of complete frames in the data chunk.
+bit_depth : int
+    Bits per sample as stored in the fmt chunk.
+format : WAVE_FORMAT
+    Sample format, e.g. WAVE_FORMAT.PCM or WAVE_FORMAT.IEEE_FLOAT.
+data_offset : int
+    Byte offset of the first sample from the start of the file.
+"""
+
+
+def info(filename):
+    """
+    Read the format of a WAV file without reading its samples.
+
+    Only the RIFF, fmt and data chunk headers are parsed, so indexing a
+    folder of samples costs a few small reads per file.
+
+    Parameters
+    ----------
+    filename : string or open file handle
+        Input WAV file.
+
+    Returns
+    -------
+    info : WavInfo
+        Named tuple (rate, channels, frames, bit_depth, format, data_offset).
+
+    Notes
+    -----
+    If the data chunk claims more bytes than the file holds, `frames` counts
+    only the frames actually present (the same data `read` would return).
+
+    Examples
+    --------
+    >>> wavfile.info('clean/clean_52.wav')
+    WavInfo(rate=44100, channels=1, frames=88200, bit_depth=16, format=<WAVE_FORMAT.PCM: 1>, data_offset=44)
+    """
+    if hasattr(filename, 'read'):
+        fid = filename
+    else:
+        fid = open(filename, 'rb')
+
+    if not (was_seekable := fid.seekable()):
+        fid = SeekEmulatingReader(fid)
+
+    try:
+        (fs, format_tag, channels, bit_depth, block_align,
+         is_big_endian, size) = _seek_data_chunk(fid)
+        data_offset = fid.tell()
+        if was_seekable:
+            # Seek past the data chunk to catch files truncated mid-chunk
+            size = min(size, fid.seek(0, os.SEEK_END) - data_offset)
+        return WavInfo(fs, channels, size // block_align, bit_depth,
+                       WAVE_FORMAT(format_tag), data_offset)
+    finally:
+        if not hasattr(filename, 'read'):
+            fid.close()
+        elif was_seekable:
+            # Rewind, like read() does
+            fid.seek(0)
+
+
+def read(filename, mmap=False, as_float=False):
     """
     Open a WAV file.
 
@@ -627,6 +998,11 @@ def read(filename, mmap=False):
         with some bit depths; see Notes.  Only to be used on real files.
 
         .. versionadded:: 0.12.0
+    as_float : bool, optional
+        Return float32 data scaled to [-1, 1) for any integer depth,
+        converted block by block while reading, so no full-size integer
+        copy is made (default: False).  Float files are returned as
+        float32 unscaled.  Not compatible with `mmap`.
 
     Returns
     -------
@@ -714,6 +1090,9 @@ def read(filename, mmap=False):
     >>> plt.show()
 
     """
+    if mmap and as_float:
+        raise ValueError("mmap=True not compatible with as_float=True.")
+
     if hasattr(filename, 'read'):
         fid = filename
         mmap = False
@@ -764,7 +1143,7 @@ def read(filename, mmap=False):
                     raise ValueError("No fmt chunk before data")
                 data = _read_data_chunk(fid, format_tag, channels, bit_depth,
                                         is_big_endian, is_rf64, block_align,
-                                        mmap, rf64_chunk_size)
+                                        mmap, rf64_chunk_size, as_float)
             elif chunk_id == b'LIST':
                 # Someday this could be handled properly but for now skip it
                 _skip_unknown_chunk(fid, is_big_endian)
@@ -786,6 +1165,130 @@ def read(filename, mmap=False):
     return fs, data
 
 
+def read_many(paths, max_workers=None, mmap=False):
+    """
+    Read several WAV files, overlapping their I/O in a thread pool.
+
+    File reads and numpy copies release the GIL, so a folder of samples
+    loads in roughly the time of its slowest files instead of the sum of
+    all of them, especially from a cold page cache.
+
+    Parameters
+    ----------
+    paths : iterable of str or path-like
+        Files to read. Duplicates are read once.
+    max_workers : int, optional
+        Thread pool size. Defaults to ThreadPoolExecutor's default.
+    mmap : bool, optional
+        Passed to `read` for every file.
+
+    Returns
+    -------
+    results : OrderedDict
+        Maps each path, in input order, to a ``(rate, data)`` tuple as
+        returned by `read`, or to the exception raised while reading it.
+        One unreadable file does not stop the others from loading.
+
+    Examples
+    --------
+    >>> results = wavfile.read_many(['clean/clean_52.wav', 'missing.wav'])
+    >>> for path, result in results.items():
+    ...     if isinstance(result, Exception):
+    ...         print(f"{path}: {result}")
+    missing.wav: [Errno 2] No such file or directory: 'missing.wav'
+    """
+    paths = list(dict.fromkeys(paths))
+
+    def load(path):
+        try:
+            return read(path, mmap=mmap)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return OrderedDict(zip(paths, pool.map(load, paths)))
+
+
+def read_into(filename, out, offset=0):
+    """
+    Decode the samples of a WAV file into a preallocated array.
+
+    Useful for filling one large buffer (a contiguous sample bank, a ring
+    buffer, ...) from many files without allocating an array per file.
+    When `out` has the file's sample dtype the data is read straight into
+    it; otherwise samples are converted through a small scratch buffer of
+    READ_INTO_BLOCK_FRAMES frames, so memory use does not grow with the
+    file size.
+
+    Parameters
+    ----------
+    filename : string or open file handle
+        Input WAV file. Non-seekable streams are supported.
+    out : ndarray
+        C-contiguous destination array, either 1-D (interleaved samples)
+        or 2-D of shape (Nframes, Nchannels). Integer data is converted to
+        a float `out` by scaling to [-1, 1); packed 24-bit data ends up in
+        the top 3 bytes of an int32 `out`, as with `read`. Other dtypes
+        must be a same-kind cast of the file's samples.
+    offset : int, optional
+        Frame index in `out` where the first frame is written.
+
+    Returns
+    -------
+    frames : int
+        Number of frames written.
+
+    Raises
+    ------
+    ValueError
+        If `out` is not contiguous, has the wrong number of channels or is
+        too small to hold the file from `offset` on.
+
+    Examples
+    --------
+    >>> n = wavfile.info('clean/clean_52.wav').frames
+    >>> bank = np.empty(n, dtype=np.float32)
+    >>> wavfile.read_into('clean/clean_52.wav', bank)
+    """
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("out must be a writeable C-contiguous array")
+
+    if hasattr(filename, 'read'):
+        fid = filename
+    else:
+        fid = open(filename, 'rb')
+    if not fid.seekable():
+        fid = SeekEmulatingReader(fid)
+
+    try:
+        (fs, format_tag, channels, bit_depth, block_align,
+         is_big_endian, size) = _seek_data_chunk(fid)
+        if out.ndim == 2 and out.shape[1] != channels or out.ndim > 2:
+            raise ValueError(f"out has shape {out.shape}, but the file has "
+                             f"{channels} channel(s)")
+        fmt = '>' if is_big_endian else '<'
+        bytes_per_sample = block_align // channels
+        file_dtype = _data_dtype(format_tag, bit_depth, bytes_per_sample, fmt)
+
+        frames = size // block_align
+        flat = out.reshape(-1)
+        start = offset * channels
+        if offset < 0 or start + frames * channels > flat.size:
+            raise ValueError(f"out has room for {flat.size // channels - offset} "
+                             f"frames at offset {offset}, the file has {frames}")
+        dest = flat[start:start + frames * channels]
+
+        nbytes = _decode_into(fid, dest, file_dtype, bytes_per_sample,
+                              is_big_endian, READ_INTO_BLOCK_FRAMES * channels)
+        if nbytes < frames * block_align:
+            warnings.warn("Reached EOF before the end of the data chunk.",
+                          WavFileWarning, stacklevel=2)
+        return nbytes // block_align
+    finally:
+        if not hasattr(filename, 'read'):
+            fid.close()
+
+
 def write(filename, rate, data):
     """
     Write a NumPy array as a WAV file.
@@ -939,6 +1442,178 @@ def write(filename, rate, data):
             fid.seek(0)
 
 
+class WavWriter:
+    """
+    Write a WAV file incrementally, one block of frames at a time.
+
+    The header is written with placeholder sizes when the file is opened and
+    patched on close, so only the current block needs to be in memory. A
+    JUNK chunk reserves room for a ds64 chunk right after the RIFF header;
+    if the file grows past the 4 GiB RIFF limit it is converted to RF64 on
+    close by rewriting that chunk in place.
+
+    Parameters
+    ----------
+    filename : string or open file handle
+        Output wav file. Must be seekable.
+    rate : int
+        The sample rate (in samples/sec).
+    channels : int, optional
+        Number of channels. Blocks for more than one channel must have shape
+        (Nframes, Nchannels).
+    dtype : data-type, optional
+        Sample data-type, one of the types supported by `write`. Every block
+        must have exactly this dtype.
+
+    Examples
+    --------
+    >>> with wavfile.WavWriter('export.wav', 44100, channels=2) as out:
+    ...     for block in render_blocks():
+    ...         out.write(block)
+    """
+
+    # Size of the ds64 body written by `write` (riff size, data size,
+    # sample count, table length)
+    _DS64_SIZE = 28
+    # Largest RIFF size that fits the 32-bit header field
+    _RIFF_MAX = 0xFFFFFFFF
+
+    def __init__(self, filename, rate, channels=1, dtype=np.int16):
+        dtype = np.dtype(dtype)
+        allowed_dtypes = ['float32', 'float64',
+                          'uint8', 'int16', 'int32', 'int64']
+        if dtype.name not in allowed_dtypes:
+            raise ValueError(f"Unsupported data type '{dtype}'")
+        if channels < 1:
+            raise ValueError(f"channels must be positive, got {channels}")
+
+        self.rate = rate
+        self.channels = channels
+        self.dtype = dtype
+        self.frames = 0
+        self._data_size = 0
+        self._filename = filename
+
+        if hasattr(filename, 'write'):
+            self._fid = filename
+        else:
+            self._fid = open(filename, 'wb')
+        if not self._fid.seekable():
+            if not hasattr(filename, 'write'):
+                self._fid.close()
+            raise ValueError("WavWriter needs a seekable output file")
+
+        try:
+            self._write_header()
+        except BaseException:
+            if not hasattr(filename, 'write'):
+                self._fid.close()
+            raise
+
+    def _write_header(self):
+        fid = self._fid
+        self._start = fid.tell()
+        bit_depth = self.dtype.itemsize * 8
+        self._is_float = self.dtype.kind == 'f'
+        format_tag = WAVE_FORMAT.IEEE_FLOAT if self._is_float else WAVE_FORMAT.PCM
+        block_align = self.channels * (bit_depth // 8)
+        self._block_align = block_align
+
+        fmt_chunk_data = struct.pack('<HHIIHH', format_tag, self.channels,
+                                     self.rate, self.rate * block_align,
+                                     block_align, bit_depth)
+        if self._is_float:
+            # add cbSize field for non-PCM files
+            fmt_chunk_data += b'\x00\x00'
+
+        header_data = b'RIFF' + b'\x00\x00\x00\x00' + b'WAVE'
+        # placeholder for a ds64 chunk, in case the file ends up as RF64
+        header_data += b'JUNK' + struct.pack('<I', self._DS64_SIZE)
+        header_data += b'\x00' * self._DS64_SIZE
+        header_data += b'fmt ' + struct.pack('<I', len(fmt_chunk_data))
+        header_data += fmt_chunk_data
+        if self._is_float:
+            self._fact_pos = len(header_data) + 8
+            header_data += b'fact' + struct.pack('<II', 4, 0)
+        header_data += b'data' + b'\x00\x00\x00\x00'
+        fid.write(header_data)
+        self._data_size_pos = len(header_data) - 4
+
+    def write(self, data):
+        """
+        Append a block of frames.
+
+        Parameters
+        ----------
+        data : ndarray
+            1-D array for mono, or 2-D array of shape (Nframes, Nchannels).
+        """
+        if self._fid is None:
+            raise ValueError("I/O operation on closed WavWriter")
+        data = np.asarray(data)
+        if data.dtype.name != self.dtype.name:
+            raise ValueError(f"Expected {self.dtype} data, got {data.dtype}")
+        if data.ndim == 1 and self.channels == 1:
+            frames_in_block = data.shape[0]
+        elif data.ndim == 2 and data.shape[1] == self.channels:
+            frames_in_block = data.shape[0]
+        else:
+            raise ValueError(f"Expected data of shape (N, {self.channels}), "
+                             f"got {data.shape}")
+
+        if data.dtype.byteorder == '>' or (data.dtype.byteorder == '=' and
+                                           sys.byteorder == 'big'):
+            data = data.byteswap()
+        _array_tofile(self._fid, data)
+        self.frames += frames_in_block
+        self._data_size += data.nbytes
+
+    def close(self):
+        """
+        Patch the header sizes and close the file.
+
+        Switches the header to RF64 if the RIFF size no longer fits in 32
+        bits. Calling close more than once has no effect.
+        """
+        fid = self._fid
+        if fid is None:
+            return
+        self._fid = None
+        try:
+            if self._data_size % 2:
+                fid.write(b'\x00')  # pad byte after an odd-sized data chunk
+            end = fid.tell()
+            riff_size = end - self._start - 8
+            if riff_size > self._RIFF_MAX:
+                fid.seek(self._start)
+                fid.write(b'RF64' + b'\xFF\xFF\xFF\xFF' + b'WAVE')
+                fid.write(b'ds64' + struct.pack('<I', self._DS64_SIZE))
+                fid.write(struct.pack('<QQQI', riff_size, self._data_size,
+                                      self.frames, 0))
+                data_size = 0xFFFFFFFF
+            else:
+                fid.seek(self._start + 4)
+                fid.write(struct.pack('<I', riff_size))
+                data_size = self._data_size
+            if self._is_float:
+                fid.seek(self._start + self._fact_pos)
+                fid.write(struct.pack('<I', min(self.frames, 0xFFFFFFFF)))
+            fid.seek(self._start + self._data_size_pos)
+            fid.write(struct.pack('<I', data_size))
+            fid.seek(end)
+        finally:
+            if not hasattr(self._filename, 'write'):
+                fid.close()
+            else:
+                fid.seek(self._start)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 def _array_tofile(fid, data):
     # ravel gives a c-contiguous buffer
     fid.write(data.ravel().view('b').data)
\ No newline at end of file